@@ -1,23 +1,48 @@
 from __future__ import annotations
 
+import os
+from collections import OrderedDict
 from collections.abc import Callable
+from concurrent.futures import Executor, Future
 from dataclasses import dataclass
+from enum import IntFlag
+from functools import lru_cache, partial, wraps
+from typing import Any, TypeVar
 
 from app.core.errors import CommandFailed, NotARepo, ParseError
+from app.core.models import Commit
 from app.core.repo_state import RepoState
+from app.exec.command_models import CommandResult
 from app.exec.command_queue import CommandQueue, QueueItem, QueuePriority
+from app.exec.command_runner import MAX_CAPTURE_BYTES
 from app.git.git_service import GitService
-from app.utils.qt_compat import QObject
+from app.utils.qt_compat import QObject, Signal
+
+# Upper bound on remembered repo validations (recents, tab switches, reopen).
+_REPO_CACHE_SIZE = 64
 
 # ─────────────────────────────────────────────────────────────────────────────
 # PendingAction: Tracks in-flight commands so we can route results correctly.
 # When a command completes, we look up its PendingAction to know:
 #   - kind: What type of operation it was (status, commit, etc.)
-#   - refresh_*: Which data views to reload after success
+#   - refresh_mask: Which data views to reload after success
 # ─────────────────────────────────────────────────────────────────────────────
 
 
-@dataclass(frozen=True)
+class RefreshFlag(IntFlag):
+    """Follow-up refreshes a mutating action asks for once it succeeds."""
+
+    NONE = 0
+    STATUS = 1
+    BRANCHES = 2
+    LOG = 4
+    STASHES = 8
+    TAGS = 16
+    REMOTES = 32
+    ALL = STATUS | BRANCHES | LOG | STASHES | TAGS | REMOTES
+
+
+@dataclass(frozen=True, slots=True)
 class PendingAction:
     """Tracks which intent a RunHandle belongs to."""
 
@@ -30,13 +55,250 @@ class PendingAction:
     # Diff actions need the staged/unstaged choice.
     staged: bool = False
 
-    # Flags to trigger automatic refreshes after mutating operations succeed.
-    refresh_status: bool = False
-    refresh_branches: bool = False
-    refresh_log: bool = False
-    refresh_stashes: bool = False
-    refresh_tags: bool = False
-    refresh_remotes: bool = False
+    # Bitmask of refreshes to trigger after mutating operations succeed.
+    refresh_mask: RefreshFlag = RefreshFlag.NONE
+
+    @classmethod
+    def validate_repo(cls, repo_path: str) -> PendingAction:
+        """Return the (interned) validation action for repo_path."""
+        return _interned_validate_action(repo_path)
+
+    @classmethod
+    def diff(cls, path: str, staged: bool = False) -> PendingAction:
+        """Return the (interned) diff action for a file + staged choice."""
+        return _interned_diff_action(path, staged)
+
+
+# Frozen, so per-call actions can be shared too: re-opening a repo or
+# re-clicking a file reuses the instance instead of allocating a new one.
+@lru_cache(maxsize=_REPO_CACHE_SIZE)
+def _interned_validate_action(repo_path: str) -> PendingAction:
+    return PendingAction(kind="validate_repo", repo_path=repo_path)
+
+
+@lru_cache(maxsize=256)
+def _interned_diff_action(path: str, staged: bool) -> PendingAction:
+    return PendingAction(kind="diff", path=path, staged=staged)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Action table: Declarative description of every "guard -> run -> track"
+# intent. Each entry names the GitService method to call, the queue key and
+# priority, and a shared PendingAction (frozen, so one instance per shape is
+# enough for every run).
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+@dataclass(frozen=True, slots=True)
+class _ActionSpec:
+    """One table-driven controller action."""
+
+    # Queue key (background keys coalesce; user keys run in order).
+    key: str
+    # GitService method called as method(repo_path, *args, **kwargs).
+    service_method: str
+    priority: QueuePriority
+    # Recorded in _pending so completion knows how to route the result.
+    pending: PendingAction
+
+
+_BG = QueuePriority.BACKGROUND
+_USER = QueuePriority.USER
+
+_ACTIONS: dict[str, _ActionSpec] = {
+    # Background refreshes: parse output into RepoState.
+    "refresh_status": _ActionSpec(
+        "refresh_status", "status_raw", _BG, PendingAction(kind="status")
+    ),
+    "refresh_log": _ActionSpec(
+        "refresh_log", "log_raw", _BG, PendingAction(kind="log")
+    ),
+    "refresh_branches": _ActionSpec(
+        "refresh_branches", "branches_raw", _BG, PendingAction(kind="branches")
+    ),
+    "refresh_remote_branches": _ActionSpec(
+        "refresh_remote_branches",
+        "remote_branches_raw",
+        _BG,
+        PendingAction(kind="remote_branches"),
+    ),
+    "refresh_conflicts": _ActionSpec(
+        "refresh_conflicts", "conflicts_raw", _BG, PendingAction(kind="conflicts")
+    ),
+    "refresh_stashes": _ActionSpec(
+        "refresh_stashes", "stash_list_raw", _BG, PendingAction(kind="stashes")
+    ),
+    "refresh_tags": _ActionSpec(
+        "refresh_tags", "tags_raw", _BG, PendingAction(kind="tags")
+    ),
+    "refresh_remotes": _ActionSpec(
+        "refresh_remotes", "remotes_raw", _BG, PendingAction(kind="remotes")
+    ),
+    # User mutations: output is ignored, refresh flags drive follow-ups.
+    "stage": _ActionSpec(
+        "stage",
+        "stage",
+        _USER,
+        PendingAction(kind="stage", refresh_mask=RefreshFlag.STATUS),
+    ),
+    "unstage": _ActionSpec(
+        "unstage",
+        "unstage",
+        _USER,
+        PendingAction(kind="unstage", refresh_mask=RefreshFlag.STATUS),
+    ),
+    "discard": _ActionSpec(
+        "discard",
+        "discard",
+        _USER,
+        PendingAction(kind="discard", refresh_mask=RefreshFlag.STATUS),
+    ),
+    "commit": _ActionSpec(
+        "commit",
+        "commit",
+        _USER,
+        PendingAction(kind="commit", refresh_mask=RefreshFlag.STATUS | RefreshFlag.LOG),
+    ),
+    "fetch": _ActionSpec(
+        "fetch",
+        "fetch",
+        _USER,
+        PendingAction(kind="fetch", refresh_mask=RefreshFlag.BRANCHES),
+    ),
+    "pull_ff_only": _ActionSpec(
+        "pull",
+        "pull_ff_only",
+        _USER,
+        PendingAction(kind="pull", refresh_mask=RefreshFlag.STATUS),
+    ),
+    "push": _ActionSpec(
+        "push",
+        "push",
+        _USER,
+        PendingAction(kind="push", refresh_mask=RefreshFlag.BRANCHES),
+    ),
+    "switch_branch": _ActionSpec(
+        "switch_branch",
+        "switch_branch",
+        _USER,
+        PendingAction(
+            kind="switch_branch", refresh_mask=RefreshFlag.STATUS | RefreshFlag.BRANCHES
+        ),
+    ),
+    "create_branch": _ActionSpec(
+        "create_branch",
+        "create_branch",
+        _USER,
+        PendingAction(
+            kind="create_branch", refresh_mask=RefreshFlag.STATUS | RefreshFlag.BRANCHES
+        ),
+    ),
+    "delete_branch": _ActionSpec(
+        "delete_branch",
+        "delete_branch",
+        _USER,
+        PendingAction(kind="delete_branch", refresh_mask=RefreshFlag.BRANCHES),
+    ),
+    "delete_remote_branch": _ActionSpec(
+        "delete_remote_branch",
+        "delete_remote_branch",
+        _USER,
+        PendingAction(kind="delete_remote_branch", refresh_mask=RefreshFlag.BRANCHES),
+    ),
+    "stash_save": _ActionSpec(
+        "stash_save",
+        "stash_save",
+        _USER,
+        PendingAction(
+            kind="stash_save", refresh_mask=RefreshFlag.STATUS | RefreshFlag.STASHES
+        ),
+    ),
+    "stash_apply": _ActionSpec(
+        "stash_apply",
+        "stash_apply",
+        _USER,
+        PendingAction(kind="stash_apply", refresh_mask=RefreshFlag.STATUS),
+    ),
+    "stash_pop": _ActionSpec(
+        "stash_pop",
+        "stash_pop",
+        _USER,
+        PendingAction(
+            kind="stash_pop", refresh_mask=RefreshFlag.STATUS | RefreshFlag.STASHES
+        ),
+    ),
+    "stash_drop": _ActionSpec(
+        "stash_drop",
+        "stash_drop",
+        _USER,
+        PendingAction(kind="stash_drop", refresh_mask=RefreshFlag.STASHES),
+    ),
+    "create_tag": _ActionSpec(
+        "create_tag",
+        "create_tag",
+        _USER,
+        PendingAction(kind="create_tag", refresh_mask=RefreshFlag.TAGS),
+    ),
+    "delete_tag": _ActionSpec(
+        "delete_tag",
+        "delete_tag",
+        _USER,
+        PendingAction(kind="delete_tag", refresh_mask=RefreshFlag.TAGS),
+    ),
+    "push_tag": _ActionSpec(
+        "push_tag", "push_tag", _USER, PendingAction(kind="push_tag")
+    ),
+    "push_tags": _ActionSpec(
+        "push_tags", "push_tags", _USER, PendingAction(kind="push_tags")
+    ),
+    "add_remote": _ActionSpec(
+        "add_remote",
+        "add_remote",
+        _USER,
+        PendingAction(kind="add_remote", refresh_mask=RefreshFlag.REMOTES),
+    ),
+    "remove_remote": _ActionSpec(
+        "remove_remote",
+        "remove_remote",
+        _USER,
+        PendingAction(kind="remove_remote", refresh_mask=RefreshFlag.REMOTES),
+    ),
+    "set_remote_url": _ActionSpec(
+        "set_remote_url",
+        "set_remote_url",
+        _USER,
+        PendingAction(kind="set_remote_url", refresh_mask=RefreshFlag.REMOTES),
+    ),
+    "set_upstream": _ActionSpec(
+        "set_upstream",
+        "set_upstream",
+        _USER,
+        PendingAction(kind="set_upstream", refresh_mask=RefreshFlag.BRANCHES),
+    ),
+}
+
+# (queue key, priority) per enqueue name, computed once at import. The two
+# actions outside the table (per-call PendingAction) are listed explicitly.
+_QUEUE_TEMPLATES: dict[str, tuple[str, QueuePriority]] = {
+    name: (spec.key, spec.priority) for name, spec in _ACTIONS.items()
+}
+_QUEUE_TEMPLATES["open_repo"] = ("open_repo", _USER)
+_QUEUE_TEMPLATES["diff"] = ("diff", _USER)
+
+_Method = TypeVar("_Method", bound=Callable[..., None])
+
+
+def _require_repo(method: _Method) -> _Method:
+    """Report NotARepo and skip the call when no repo is open."""
+
+    @wraps(method)
+    def wrapper(self: RepoController, *args: Any, **kwargs: Any) -> None:
+        if not self._state.repo_path:
+            self._state.set_error(NotARepo("(none)"))
+            return
+        method(self, *args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -67,11 +329,16 @@ class PendingAction:
 class RepoController(QObject):
     """Coordinates git intents, queueing, and state updates."""
 
+    # Emitted from parse worker threads with (setter, future). Qt queues the
+    # delivery onto the controller's (main) thread, where RepoState is updated.
+    parse_finished = Signal(object, object)
+
     def __init__(
         self,
         service: GitService,
         state: RepoState | None = None,
         queue: CommandQueue | None = None,
+        parse_executor: Executor | None = None,
     ) -> None:
         super().__init__()
         # Service builds git commands and parses outputs.
@@ -84,6 +351,42 @@ class RepoController(QObject):
         # Map run_id -> PendingAction so we know how to handle each completion.
         self._pending: dict[int, PendingAction] = {}
 
+        # Optional worker pool for parsing. None keeps parsing inline (tests,
+        # headless use); the app passes a pool so big outputs don't block the UI.
+        self._parse_executor = parse_executor
+        # Parses in flight; the queue stays busy until their results land.
+        self._parsing = 0
+        # True while _on_command_finished runs (a parse may finish inline).
+        self._completing = False
+        self.parse_finished.connect(self._on_parse_finished)
+
+        # kind -> result handler, so completion routing is a single dict lookup.
+        self._handlers: dict[str, Callable[[PendingAction, CommandResult], None]] = {
+            "validate_repo": self._handle_validate_repo,
+            "status": self._handle_status,
+            "log": self._handle_log,
+            "branches": self._handle_branches,
+            "remote_branches": self._handle_remote_branches,
+            "conflicts": self._handle_conflicts,
+            "stashes": self._handle_stashes,
+            "tags": self._handle_tags,
+            "remotes": self._handle_remotes,
+            "diff": self._handle_diff,
+        }
+
+        # LRU of realpath -> validated, so reopening a known repo skips the
+        # `git rev-parse` spawn. Manual OrderedDict to allow invalidation.
+        self._repo_cache: OrderedDict[str, bool] = OrderedDict()
+
+        # Topics whose views want post-mutation refreshes (see subscribe()).
+        self._interests = RefreshFlag.ALL
+
+        # Parsed commits by oid plus the HEAD/limit they were read with, so an
+        # unchanged HEAD skips the log subprocess and reparses reuse commits.
+        self._log_cache: dict[str, Commit] = {}
+        self._log_head: str | None = None
+        self._log_limit: int | None = None
+
         # Wire up the completion callback so we process results.
         self._service.runner.command_finished.connect(self._on_command_finished)
 
@@ -92,245 +395,172 @@ class RepoController(QObject):
         """Expose the current repo state for the UI."""
         return self._state
 
-    def _enqueue(
-        self, key: str, priority: QueuePriority, run: Callable[[], None]
-    ) -> None:
-        """Add a command to the queue with the given priority."""
+    def _enqueue(self, name: str, run: Callable[[], None]) -> None:
+        """Queue `run` under the precomputed key/priority for action `name`."""
+        key, priority = _QUEUE_TEMPLATES[name]
         self._queue.enqueue(QueueItem(key=key, run=run, priority=priority))
 
-    def open_repo(self, repo_path: str) -> None:
-        """Validate a repo path and set it if valid."""
+    @staticmethod
+    def _repo_cache_key(repo_path: str) -> str:
+        """Normalize a repo path so aliases share one cache entry."""
+        return os.path.realpath(os.path.abspath(repo_path))
 
-        def action() -> None:
-            # Ask git whether this path is inside a work tree.
-            handle = self._service.is_inside_work_tree_raw(repo_path)
-            self._pending[handle.run_id] = PendingAction(
-                kind="validate_repo", repo_path=repo_path
-            )
-            self._state.set_busy(True)
+    def _remember_repo(self, repo_path: str) -> None:
+        """Record a validated repo path, evicting the least recent entry."""
+        key = self._repo_cache_key(repo_path)
+        self._repo_cache[key] = True
+        self._repo_cache.move_to_end(key)
+        if len(self._repo_cache) > _REPO_CACHE_SIZE:
+            self._repo_cache.popitem(last=False)
 
-        self._enqueue("open_repo", QueuePriority.USER, action)
+    def _forget_repo(self, repo_path: str | None) -> None:
+        """Drop a cached validation (repo deleted, moved, or no longer git)."""
+        if repo_path:
+            self._repo_cache.pop(self._repo_cache_key(repo_path), None)
+
+    def open_repo(self, repo_path: str) -> None:
+        """Validate a repo path and set it if valid."""
+        if self._repo_cache.get(self._repo_cache_key(repo_path)):
+            # Already validated this session: skip the git subprocess, but still
+            # switch in queue order so commands queued for the old repo run there.
+            self._enqueue("open_repo", partial(self._switch_repo, repo_path))
+            return
+
+        self._enqueue("open_repo", partial(self._start_validate, repo_path))
+
+    def _switch_repo(self, repo_path: str) -> None:
+        """Open an already validated repo_path without running git."""
+        self._repo_cache.move_to_end(self._repo_cache_key(repo_path))
+        self._reset_log_cache()
+        with self._state.batch():
+            self._state.set_repo_path(repo_path)
+            self._state.set_error(None)
+            self.refresh_status()
+        # Nothing was started, so release the queue ourselves.
+        self._queue.mark_idle()
+
+    def _start_validate(self, repo_path: str) -> None:
+        """Ask git whether repo_path is inside a work tree."""
+        handle = self._service.is_inside_work_tree_raw(repo_path)
+        self._pending[handle.run_id] = PendingAction.validate_repo(repo_path)
+        self._set_busy(True)
+
+    @_require_repo
+    def _dispatch(self, name: str, *args: object, **kwargs: object) -> None:
+        """Enqueue the table-driven action `name` (guarded by _require_repo)."""
+        self._enqueue(name, partial(self._start_action, _ACTIONS[name], args, kwargs))
+
+    def _start_action(
+        self, spec: _ActionSpec, args: tuple, kwargs: dict[str, object]
+    ) -> None:
+        """Start the git command for a table entry and record its pending action."""
+        # repo_path is read at run time, matching when the command actually starts.
+        service_method = getattr(self._service, spec.service_method)
+        handle = service_method(self._state.repo_path, *args, **kwargs)
+        self._pending[handle.run_id] = spec.pending
+        self._set_busy(True)
 
     def refresh_status(self) -> None:
         """Fetch status for the current repo, if set."""
-        if not self._state.repo_path:
-            self._state.set_error(NotARepo("(none)"))
-            return
-
-        def action() -> None:
-            # Run porcelain v2 status and mark it as pending.
-            handle = self._service.status_raw(self._state.repo_path)
-            self._pending[handle.run_id] = PendingAction(kind="status")
-            self._state.set_busy(True)
-
-        self._enqueue("refresh_status", QueuePriority.BACKGROUND, action)
-
-    def refresh_log(self, limit: int = 300) -> None:
-        """Fetch recent commits for the current repo."""
-        if not self._state.repo_path:
-            self._state.set_error(NotARepo("(none)"))
+        self._dispatch("refresh_status")
+
+    @_require_repo
+    def refresh_log(self, limit: int = 300, force: bool = False) -> None:
+        """Fetch recent commits for the current repo.
+
+        Skips git entirely when HEAD is unchanged since the last parsed log,
+        unless force is set (explicit user refresh).
+        """
+        spec = _ACTIONS["refresh_log"]
+        self._enqueue("refresh_log", partial(self._start_log, spec, limit, force))
+
+    def _start_log(self, spec: _ActionSpec, limit: int, force: bool) -> None:
+        """Run the log refresh unless the cached log already matches HEAD."""
+        # Decide at run time: a status refresh queued ahead of us (e.g. after
+        # a commit) has already updated head_oid by now.
+        status = self._state.status
+        head_oid = status.branch.head_oid if status else None
+        if (
+            not force
+            and head_oid is not None
+            and head_oid == self._log_head
+            and limit == self._log_limit
+            and self._state.log is not None
+        ):
+            # Nothing was started, so release the queue ourselves.
+            self._queue.mark_idle()
             return
-
-        def action() -> None:
-            handle = self._service.log_raw(self._state.repo_path, limit=limit)
-            self._pending[handle.run_id] = PendingAction(kind="log")
-            self._state.set_busy(True)
-
-        self._enqueue("refresh_log", QueuePriority.BACKGROUND, action)
+        self._log_limit = limit
+        self._start_action(spec, (), {"limit": limit})
 
     def refresh_branches(self) -> None:
         """Fetch branch list for the current repo."""
-        if not self._state.repo_path:
-            self._state.set_error(NotARepo("(none)"))
-            return
-
-        def action() -> None:
-            handle = self._service.branches_raw(self._state.repo_path)
-            self._pending[handle.run_id] = PendingAction(kind="branches")
-            self._state.set_busy(True)
-
-        self._enqueue("refresh_branches", QueuePriority.BACKGROUND, action)
-
-        def remote_action() -> None:
-            handle = self._service.remote_branches_raw(self._state.repo_path)
-            self._pending[handle.run_id] = PendingAction(kind="remote_branches")
-            self._state.set_busy(True)
-
-        self._enqueue(
-            "refresh_remote_branches", QueuePriority.BACKGROUND, remote_action
-        )
+        self._dispatch("refresh_branches")
+        self._dispatch("refresh_remote_branches")
 
     def refresh_remote_branches(self) -> None:
         """Fetch remote branch list for the current repo."""
-        if not self._state.repo_path:
-            self._state.set_error(NotARepo("(none)"))
-            return
-
-        def action() -> None:
-            handle = self._service.remote_branches_raw(self._state.repo_path)
-            self._pending[handle.run_id] = PendingAction(kind="remote_branches")
-            self._state.set_busy(True)
-
-        self._enqueue("refresh_remote_branches", QueuePriority.BACKGROUND, action)
+        self._dispatch("refresh_remote_branches")
 
     def refresh_conflicts(self) -> None:
         """Fetch conflicted paths for the current repo."""
-        if not self._state.repo_path:
-            self._state.set_error(NotARepo("(none)"))
-            return
-
-        def action() -> None:
-            handle = self._service.conflicts_raw(self._state.repo_path)
-            self._pending[handle.run_id] = PendingAction(kind="conflicts")
-            self._state.set_busy(True)
-
-        self._enqueue("refresh_conflicts", QueuePriority.BACKGROUND, action)
+        self._dispatch("refresh_conflicts")
 
     def refresh_stashes(self) -> None:
         """Fetch stash list for the current repo."""
-        if not self._state.repo_path:
-            self._state.set_error(NotARepo("(none)"))
-            return
-
-        def action() -> None:
-            handle = self._service.stash_list_raw(self._state.repo_path)
-            self._pending[handle.run_id] = PendingAction(kind="stashes")
-            self._state.set_busy(True)
-
-        self._enqueue("refresh_stashes", QueuePriority.BACKGROUND, action)
+        self._dispatch("refresh_stashes")
 
     def refresh_tags(self) -> None:
         """Fetch tag list for the current repo."""
-        if not self._state.repo_path:
-            self._state.set_error(NotARepo("(none)"))
-            return
-
-        def action() -> None:
-            handle = self._service.tags_raw(self._state.repo_path)
-            self._pending[handle.run_id] = PendingAction(kind="tags")
-            self._state.set_busy(True)
-
-        self._enqueue("refresh_tags", QueuePriority.BACKGROUND, action)
+        self._dispatch("refresh_tags")
 
     def refresh_remotes(self) -> None:
         """Fetch remote list for the current repo."""
-        if not self._state.repo_path:
-            self._state.set_error(NotARepo("(none)"))
-            return
+        self._dispatch("refresh_remotes")
 
-        def action() -> None:
-            handle = self._service.remotes_raw(self._state.repo_path)
-            self._pending[handle.run_id] = PendingAction(kind="remotes")
-            self._state.set_busy(True)
+    @_require_repo
+    def refresh_all(self) -> None:
+        """Refresh every subscribed view in one call (View > Refresh).
 
-        self._enqueue("refresh_remotes", QueuePriority.BACKGROUND, action)
+        All refreshes are queued up front, so the queue runs them back to back
+        and each kind still coalesces with any copy already pending.
+        """
+        self._enqueue_refreshes(RefreshFlag.ALL)
 
+    @_require_repo
     def request_diff(self, path: str, staged: bool = False) -> None:
         """Load a diff for a single file in the current repo."""
-        if not self._state.repo_path:
-            self._state.set_error(NotARepo("(none)"))
-            return
+        self._enqueue("diff", partial(self._start_diff, path, staged))
 
-        def action() -> None:
-            handle = self._service.diff_file_raw(
-                self._state.repo_path, path, staged=staged
-            )
-            self._pending[handle.run_id] = PendingAction(
-                kind="diff", path=path, staged=staged
-            )
-            self._state.set_busy(True)
-
-        self._enqueue("diff", QueuePriority.USER, action)
+    def _start_diff(self, path: str, staged: bool) -> None:
+        """Run the single-file diff and record its pending action."""
+        handle = self._service.diff_file_raw(self._state.repo_path, path, staged=staged)
+        self._pending[handle.run_id] = PendingAction.diff(path, staged)
+        self._set_busy(True)
 
     def stage(self, paths: list[str]) -> None:
         """Stage files and refresh status on success."""
-        if not self._state.repo_path:
-            self._state.set_error(NotARepo("(none)"))
-            return
-
-        def action() -> None:
-            handle = self._service.stage(self._state.repo_path, paths)
-            self._pending[handle.run_id] = PendingAction(
-                kind="stage", refresh_status=True
-            )
-            self._state.set_busy(True)
-
-        self._enqueue("stage", QueuePriority.USER, action)
+        self._dispatch("stage", paths)
 
     def unstage(self, paths: list[str]) -> None:
         """Unstage files and refresh status on success."""
-        if not self._state.repo_path:
-            self._state.set_error(NotARepo("(none)"))
-            return
-
-        def action() -> None:
-            handle = self._service.unstage(self._state.repo_path, paths)
-            self._pending[handle.run_id] = PendingAction(
-                kind="unstage", refresh_status=True
-            )
-            self._state.set_busy(True)
-
-        self._enqueue("unstage", QueuePriority.USER, action)
+        self._dispatch("unstage", paths)
 
     def discard(self, paths: list[str]) -> None:
         """Discard local changes and refresh status on success."""
-        if not self._state.repo_path:
-            self._state.set_error(NotARepo("(none)"))
-            return
-
-        def action() -> None:
-            handle = self._service.discard(self._state.repo_path, paths)
-            self._pending[handle.run_id] = PendingAction(
-                kind="discard", refresh_status=True
-            )
-            self._state.set_busy(True)
-
-        self._enqueue("discard", QueuePriority.USER, action)
+        self._dispatch("discard", paths)
 
     def commit(self, message: str, amend: bool = False) -> None:
         """Commit staged changes and refresh status/log on success."""
-        if not self._state.repo_path:
-            self._state.set_error(NotARepo("(none)"))
-            return
-
-        def action() -> None:
-            handle = self._service.commit(self._state.repo_path, message, amend=amend)
-            self._pending[handle.run_id] = PendingAction(
-                kind="commit", refresh_status=True, refresh_log=True
-            )
-            self._state.set_busy(True)
-
-        self._enqueue("commit", QueuePriority.USER, action)
+        self._dispatch("commit", message, amend=amend)
 
     def fetch(self) -> None:
         """Fetch and refresh branches if needed."""
-        if not self._state.repo_path:
-            self._state.set_error(NotARepo("(none)"))
-            return
-
-        def action() -> None:
-            handle = self._service.fetch(self._state.repo_path)
-            self._pending[handle.run_id] = PendingAction(
-                kind="fetch", refresh_branches=True
-            )
-            self._state.set_busy(True)
-
-        self._enqueue("fetch", QueuePriority.USER, action)
+        self._dispatch("fetch")
 
     def pull_ff_only(self) -> None:
         """Pull with fast-forward only and refresh status."""
-        if not self._state.repo_path:
-            self._state.set_error(NotARepo("(none)"))
-            return
-
-        def action() -> None:
-            handle = self._service.pull_ff_only(self._state.repo_path)
-            self._pending[handle.run_id] = PendingAction(
-                kind="pull", refresh_status=True
-            )
-            self._state.set_busy(True)
-
-        self._enqueue("pull", QueuePriority.USER, action)
+        self._dispatch("pull_ff_only")
 
     def push(
         self,
@@ -339,273 +569,269 @@ class RepoController(QObject):
         branch: str | None = None,
     ) -> None:
         """Push to remote and refresh branches if needed."""
-        if not self._state.repo_path:
-            self._state.set_error(NotARepo("(none)"))
-            return
-
-        def action() -> None:
-            handle = self._service.push(
-                self._state.repo_path,
-                set_upstream=set_upstream,
-                remote=remote,
-                branch=branch,
-            )
-            self._pending[handle.run_id] = PendingAction(
-                kind="push", refresh_branches=True
-            )
-            self._state.set_busy(True)
-
-        self._enqueue("push", QueuePriority.USER, action)
+        self._dispatch("push", set_upstream=set_upstream, remote=remote, branch=branch)
 
     def switch_branch(self, name: str) -> None:
         """Switch branches and refresh status/branches."""
-        if not self._state.repo_path:
-            self._state.set_error(NotARepo("(none)"))
-            return
-
-        def action() -> None:
-            handle = self._service.switch_branch(self._state.repo_path, name)
-            self._pending[handle.run_id] = PendingAction(
-                kind="switch_branch", refresh_status=True, refresh_branches=True
-            )
-            self._state.set_busy(True)
-
-        self._enqueue("switch_branch", QueuePriority.USER, action)
+        self._dispatch("switch_branch", name)
 
     def create_branch(self, name: str, from_ref: str = "HEAD") -> None:
         """Create and switch to a new branch, then refresh status/branches."""
-        if not self._state.repo_path:
-            self._state.set_error(NotARepo("(none)"))
-            return
-
-        def action() -> None:
-            handle = self._service.create_branch(
-                self._state.repo_path, name, from_ref=from_ref
-            )
-            self._pending[handle.run_id] = PendingAction(
-                kind="create_branch", refresh_status=True, refresh_branches=True
-            )
-            self._state.set_busy(True)
-
-        self._enqueue("create_branch", QueuePriority.USER, action)
+        self._dispatch("create_branch", name, from_ref=from_ref)
 
     def delete_branch(self, name: str, force: bool = False) -> None:
         """Delete a branch and refresh branch list."""
-        if not self._state.repo_path:
-            self._state.set_error(NotARepo("(none)"))
-            return
-
-        def action() -> None:
-            handle = self._service.delete_branch(
-                self._state.repo_path, name, force=force
-            )
-            self._pending[handle.run_id] = PendingAction(
-                kind="delete_branch", refresh_branches=True
-            )
-            self._state.set_busy(True)
-
-        self._enqueue("delete_branch", QueuePriority.USER, action)
+        self._dispatch("delete_branch", name, force=force)
 
     def delete_remote_branch(self, remote: str, name: str) -> None:
         """Delete a remote branch and refresh branch list."""
-        if not self._state.repo_path:
-            self._state.set_error(NotARepo("(none)"))
-            return
-
-        def action() -> None:
-            handle = self._service.delete_remote_branch(
-                self._state.repo_path, remote, name
-            )
-            self._pending[handle.run_id] = PendingAction(
-                kind="delete_remote_branch", refresh_branches=True
-            )
-            self._state.set_busy(True)
-
-        self._enqueue("delete_remote_branch", QueuePriority.USER, action)
+        self._dispatch("delete_remote_branch", remote, name)
 
     def stash_save(
         self, message: str | None = None, include_untracked: bool = False
     ) -> None:
         """Create a stash and refresh status + stashes."""
-        if not self._state.repo_path:
-            self._state.set_error(NotARepo("(none)"))
-            return
-
-        def action() -> None:
-            handle = self._service.stash_save(
-                self._state.repo_path,
-                message=message,
-                include_untracked=include_untracked,
-            )
-            self._pending[handle.run_id] = PendingAction(
-                kind="stash_save", refresh_status=True, refresh_stashes=True
-            )
-            self._state.set_busy(True)
-
-        self._enqueue("stash_save", QueuePriority.USER, action)
+        self._dispatch(
+            "stash_save", message=message, include_untracked=include_untracked
+        )
 
     def stash_apply(self, ref: str | None = None) -> None:
         """Apply a stash and refresh status."""
-        if not self._state.repo_path:
-            self._state.set_error(NotARepo("(none)"))
-            return
-
-        def action() -> None:
-            handle = self._service.stash_apply(self._state.repo_path, ref=ref)
-            self._pending[handle.run_id] = PendingAction(
-                kind="stash_apply", refresh_status=True
-            )
-            self._state.set_busy(True)
-
-        self._enqueue("stash_apply", QueuePriority.USER, action)
+        self._dispatch("stash_apply", ref=ref)
 
     def stash_pop(self, ref: str | None = None) -> None:
         """Pop a stash and refresh status + stashes."""
-        if not self._state.repo_path:
-            self._state.set_error(NotARepo("(none)"))
-            return
-
-        def action() -> None:
-            handle = self._service.stash_pop(self._state.repo_path, ref=ref)
-            self._pending[handle.run_id] = PendingAction(
-                kind="stash_pop", refresh_status=True, refresh_stashes=True
-            )
-            self._state.set_busy(True)
-
-        self._enqueue("stash_pop", QueuePriority.USER, action)
+        self._dispatch("stash_pop", ref=ref)
 
     def stash_drop(self, ref: str | None = None) -> None:
         """Drop a stash entry and refresh stash list."""
-        if not self._state.repo_path:
-            self._state.set_error(NotARepo("(none)"))
-            return
-
-        def action() -> None:
-            handle = self._service.stash_drop(self._state.repo_path, ref=ref)
-            self._pending[handle.run_id] = PendingAction(
-                kind="stash_drop", refresh_stashes=True
-            )
-            self._state.set_busy(True)
-
-        self._enqueue("stash_drop", QueuePriority.USER, action)
+        self._dispatch("stash_drop", ref=ref)
 
     def create_tag(self, name: str, ref: str | None = None) -> None:
         """Create a tag and refresh tag list."""
-        if not self._state.repo_path:
-            self._state.set_error(NotARepo("(none)"))
-            return
-
-        def action() -> None:
-            handle = self._service.create_tag(self._state.repo_path, name, ref=ref)
-            self._pending[handle.run_id] = PendingAction(
-                kind="create_tag", refresh_tags=True
-            )
-            self._state.set_busy(True)
-
-        self._enqueue("create_tag", QueuePriority.USER, action)
+        self._dispatch("create_tag", name, ref=ref)
 
     def delete_tag(self, name: str) -> None:
         """Delete a tag and refresh tag list."""
-        if not self._state.repo_path:
-            self._state.set_error(NotARepo("(none)"))
-            return
-
-        def action() -> None:
-            handle = self._service.delete_tag(self._state.repo_path, name)
-            self._pending[handle.run_id] = PendingAction(
-                kind="delete_tag", refresh_tags=True
-            )
-            self._state.set_busy(True)
-
-        self._enqueue("delete_tag", QueuePriority.USER, action)
+        self._dispatch("delete_tag", name)
 
     def push_tag(self, name: str, remote: str = "origin") -> None:
         """Push a tag to a remote."""
-        if not self._state.repo_path:
-            self._state.set_error(NotARepo("(none)"))
-            return
-
-        def action() -> None:
-            handle = self._service.push_tag(self._state.repo_path, name, remote=remote)
-            self._pending[handle.run_id] = PendingAction(kind="push_tag")
-            self._state.set_busy(True)
-
-        self._enqueue("push_tag", QueuePriority.USER, action)
+        self._dispatch("push_tag", name, remote=remote)
 
     def push_tags(self, remote: str = "origin") -> None:
         """Push all tags to a remote."""
-        if not self._state.repo_path:
-            self._state.set_error(NotARepo("(none)"))
-            return
-
-        def action() -> None:
-            handle = self._service.push_tags(self._state.repo_path, remote=remote)
-            self._pending[handle.run_id] = PendingAction(kind="push_tags")
-            self._state.set_busy(True)
-
-        self._enqueue("push_tags", QueuePriority.USER, action)
+        self._dispatch("push_tags", remote=remote)
 
     def add_remote(self, name: str, url: str) -> None:
         """Add a remote and refresh remotes list."""
-        if not self._state.repo_path:
-            self._state.set_error(NotARepo("(none)"))
-            return
-
-        def action() -> None:
-            handle = self._service.add_remote(self._state.repo_path, name, url)
-            self._pending[handle.run_id] = PendingAction(
-                kind="add_remote", refresh_remotes=True
-            )
-            self._state.set_busy(True)
-
-        self._enqueue("add_remote", QueuePriority.USER, action)
+        self._dispatch("add_remote", name, url)
 
     def remove_remote(self, name: str) -> None:
         """Remove a remote and refresh remotes list."""
-        if not self._state.repo_path:
-            self._state.set_error(NotARepo("(none)"))
-            return
-
-        def action() -> None:
-            handle = self._service.remove_remote(self._state.repo_path, name)
-            self._pending[handle.run_id] = PendingAction(
-                kind="remove_remote", refresh_remotes=True
-            )
-            self._state.set_busy(True)
-
-        self._enqueue("remove_remote", QueuePriority.USER, action)
+        self._dispatch("remove_remote", name)
 
     def set_remote_url(self, name: str, url: str) -> None:
         """Update a remote URL and refresh remotes list."""
-        if not self._state.repo_path:
-            self._state.set_error(NotARepo("(none)"))
-            return
-
-        def action() -> None:
-            handle = self._service.set_remote_url(self._state.repo_path, name, url)
-            self._pending[handle.run_id] = PendingAction(
-                kind="set_remote_url", refresh_remotes=True
-            )
-            self._state.set_busy(True)
-
-        self._enqueue("set_remote_url", QueuePriority.USER, action)
+        self._dispatch("set_remote_url", name, url)
 
     def set_upstream(self, upstream: str, branch: str | None = None) -> None:
         """Set upstream tracking and refresh branches list."""
-        if not self._state.repo_path:
-            self._state.set_error(NotARepo("(none)"))
+        self._dispatch("set_upstream", upstream, branch=branch)
+
+    def subscribe(self, topic: str) -> None:
+        """Resume post-mutation refreshes for a topic (e.g. "log")."""
+        self._interests |= RefreshFlag[topic.upper()]
+
+    def unsubscribe(self, topic: str) -> None:
+        """Skip post-mutation refreshes for a topic nobody is showing."""
+        self._interests &= ~RefreshFlag[topic.upper()]
+
+    def _enqueue_refreshes(self, mask: RefreshFlag) -> None:
+        """Enqueue one background refresh per set bit in mask."""
+        # Hidden views are refreshed when shown, so skip them here entirely.
+        mask &= self._interests
+        # Each refresh keeps its own coalescing key, so bits requested by
+        # back-to-back mutations collapse onto the refreshes already queued.
+        if mask & RefreshFlag.STATUS:
+            self.refresh_status()
+        if mask & RefreshFlag.BRANCHES:
+            self.refresh_branches()
+        if mask & RefreshFlag.LOG:
+            self.refresh_log()
+        if mask & RefreshFlag.STASHES:
+            self.refresh_stashes()
+        if mask & RefreshFlag.TAGS:
+            self.refresh_tags()
+        if mask & RefreshFlag.REMOTES:
+            self.refresh_remotes()
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Result handlers: One per PendingAction.kind that produces data.
+    # Looked up in `_handlers` (built once in __init__) instead of walking an
+    # if/elif chain on every completion.
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def _safe_parse(
+        self,
+        parser: Callable[[bytes], Any],
+        payload: bytes,
+        setter: Callable[[Any], None],
+    ) -> None:
+        """Parse payload into RepoState, surfacing failures as ParseError."""
+        if self._parse_executor is not None:
+            # Parse on a worker; parse_finished brings the result back.
+            self._parsing += 1
+            future = self._parse_executor.submit(parser, payload)
+            future.add_done_callback(partial(self.parse_finished.emit, setter))
             return
+        try:
+            setter(parser(payload))
+            self._state.set_error(None)
+        except Exception as exc:
+            self._state.set_error(ParseError(str(exc)))
+
+    def _on_parse_finished(self, setter: Callable[[Any], None], future: Future) -> None:
+        """Apply a worker parse result on the main thread and release the queue."""
+        with self._state.batch():
+            try:
+                setter(future.result())
+                self._state.set_error(None)
+            except Exception as exc:
+                self._state.set_error(ParseError(str(exc)))
+            finally:
+                self._parsing -= 1
+                # Inside _on_command_finished its finally block finishes instead.
+                if not self._completing:
+                    self._finish_command()
+
+    def _finish_command(self) -> None:
+        """Let the queue start the next command, then update busy."""
+        # Start the next command first: in a chain (commit -> status -> log)
+        # busy stays True throughout instead of flickering False/True.
+        self._queue.mark_idle()
+        # Busy is true if any actions or parses remain in flight.
+        self._set_busy(bool(self._pending) or self._parsing > 0)
+
+    def _set_busy(self, busy: bool) -> None:
+        """Forward busy to RepoState only when it actually changes."""
+        if busy != self._state.busy:
+            self._state.set_busy(busy)
+
+    def _handle_validate_repo(
+        self, action: PendingAction, cmd_result: CommandResult
+    ) -> None:
+        """Accept the repo path if git reports a work tree."""
+        # rev-parse prints exactly b"true\n"; compare bytes, no decode needed.
+        if cmd_result.stdout.strip() == b"true":
+            self._remember_repo(action.repo_path or "")
+            self._reset_log_cache()
+            self._state.set_repo_path(action.repo_path)
+            self._state.set_error(None)
+            self.refresh_status()
+        else:
+            self._forget_repo(action.repo_path)
+            self._state.set_error(NotARepo(action.repo_path or ""))
+
+    def _handle_status(self, _action: PendingAction, cmd_result: CommandResult) -> None:
+        """Parse porcelain status into RepoState."""
+        self._safe_parse(
+            self._service.parse_status, cmd_result.stdout, self._state.set_status
+        )
 
-        def action() -> None:
-            handle = self._service.set_upstream(
-                self._state.repo_path, upstream, branch=branch
-            )
-            self._pending[handle.run_id] = PendingAction(
-                kind="set_upstream", refresh_branches=True
-            )
-            self._state.set_busy(True)
+    def _handle_log(self, _action: PendingAction, cmd_result: CommandResult) -> None:
+        """Parse commit log into RepoState, reusing already-parsed commits."""
+        self._safe_parse(
+            partial(self._service.parse_log, known=self._log_cache),
+            cmd_result.stdout,
+            self._set_log,
+        )
+
+    def _set_log(self, commits: list[Commit]) -> None:
+        """Store the log and remember which HEAD it was read from."""
+        # git log walks from HEAD, so the first record is always HEAD.
+        self._log_head = commits[0].oid if commits else None
+        self._log_cache = {commit.oid: commit for commit in commits}
+        self._state.set_log(commits)
+
+    def _reset_log_cache(self) -> None:
+        """Forget cached log data (a different repo was opened)."""
+        self._log_cache = {}
+        self._log_head = None
+        self._log_limit = None
+
+    def _handle_branches(
+        self, _action: PendingAction, cmd_result: CommandResult
+    ) -> None:
+        """Parse local branches into RepoState."""
+        self._safe_parse(
+            self._service.parse_branches, cmd_result.stdout, self._state.set_branches
+        )
+
+    def _handle_remote_branches(
+        self, _action: PendingAction, cmd_result: CommandResult
+    ) -> None:
+        """Parse remote branches into RepoState."""
+        self._safe_parse(
+            self._service.parse_remote_branches,
+            cmd_result.stdout,
+            self._state.set_remote_branches,
+        )
 
-        self._enqueue("set_upstream", QueuePriority.USER, action)
+    def _handle_conflicts(
+        self, _action: PendingAction, cmd_result: CommandResult
+    ) -> None:
+        """Parse conflicted paths into RepoState."""
+        self._safe_parse(
+            self._service.parse_conflicts, cmd_result.stdout, self._state.set_conflicts
+        )
+
+    def _handle_stashes(
+        self, _action: PendingAction, cmd_result: CommandResult
+    ) -> None:
+        """Parse stash list into RepoState."""
+        self._safe_parse(
+            self._service.parse_stashes, cmd_result.stdout, self._state.set_stashes
+        )
+
+    def _handle_tags(self, _action: PendingAction, cmd_result: CommandResult) -> None:
+        """Parse tag list into RepoState."""
+        self._safe_parse(
+            self._service.parse_tags, cmd_result.stdout, self._state.set_tags
+        )
+
+    def _handle_remotes(
+        self, _action: PendingAction, cmd_result: CommandResult
+    ) -> None:
+        """Parse remotes into RepoState."""
+        self._safe_parse(
+            self._service.parse_remotes, cmd_result.stdout, self._state.set_remotes
+        )
+
+    def _handle_diff(self, _action: PendingAction, cmd_result: CommandResult) -> None:
+        """Hand raw diff bytes to RepoState; it decodes only when read."""
+        self._state.set_diff_bytes(cmd_result.stdout)
+        self._state.set_error(None)
+
+    def _handle_truncated(
+        self,
+        action: PendingAction,
+        cmd_result: CommandResult,
+        handler: Callable[[PendingAction, CommandResult], None],
+    ) -> None:
+        """Surface output cut at MAX_CAPTURE_BYTES instead of using it as complete."""
+        limit_mib = MAX_CAPTURE_BYTES // (1024 * 1024)
+        if action.kind == "diff":
+            # A partial diff is still worth reading; show it, flagged as partial.
+            handler(action, cmd_result)
+            message = (
+                f"diff output truncated at {limit_mib} MiB; showing the start only"
+            )
+        else:
+            # The last record is cut mid-way: keep the previous snapshot rather
+            # than parse a silently wrong one.
+            message = f"{action.kind} output truncated at {limit_mib} MiB; not parsed"
+        self._state.set_error(ParseError(message))
 
     # ─────────────────────────────────────────────────────────────────────────
     # Command Completion Handler: The central routing logic.
@@ -621,123 +847,53 @@ class RepoController(QObject):
 
     def _on_command_finished(self, handle: object, result: object) -> None:
         """Handle completed commands and update RepoState."""
-        try:
-            # PySide6 signals use `object` type to avoid registration friction.
-            # We know these are actually RunHandle and CommandResult.
-            run_handle = handle  # type: ignore[assignment]
-            cmd_result = result  # type: ignore[assignment]
-
-            # Find and remove the pending action for this command.
-            action = self._pending.pop(run_handle.run_id, None)
-            if not action:
-                # Unknown command (shouldn't happen) - ignore it.
-                return
-
-            # Any non-zero exit code is an error we surface to the UI.
-            if not cmd_result.ok:
-                self._state.set_error(
-                    CommandFailed(
-                        command_args=run_handle.spec.args,
-                        exit_code=cmd_result.exit_code,
-                        stdout=cmd_result.stdout,
-                        stderr=cmd_result.stderr,
+        # One state_changed for the result, error and busy updates together.
+        with self._state.batch():
+            self._completing = True
+            try:
+                # PySide6 signals use `object` type to avoid registration friction.
+                # We know these are actually RunHandle and CommandResult.
+                run_handle = handle  # type: ignore[assignment]
+                cmd_result = result  # type: ignore[assignment]
+
+                # Find and remove the pending action for this command.
+                action = self._pending.pop(run_handle.run_id, None)
+                if not action:
+                    # Unknown command (shouldn't happen) - ignore it.
+                    return
+
+                # Any non-zero exit code is an error we surface to the UI.
+                if not cmd_result.ok:
+                    # A vanished or broken repo must be re-validated next open.
+                    if action.kind == "validate_repo":
+                        self._forget_repo(action.repo_path)
+                    elif b"not a git repository" in cmd_result.stderr:
+                        self._forget_repo(run_handle.spec.cwd)
+                    self._state.set_error(
+                        CommandFailed(
+                            command_args=run_handle.spec.args,
+                            exit_code=cmd_result.exit_code,
+                            stdout=cmd_result.stdout,
+                            stderr=cmd_result.stderr,
+                        )
                     )
-                )
-                return
-
-            # ───── Route by action kind to the appropriate handler ─────
-            if action.kind == "validate_repo":
-                output = cmd_result.stdout.decode("utf-8", errors="replace").strip()
-                if output == "true":
-                    self._state.set_repo_path(action.repo_path)
-                    self._state.set_error(None)
-                    self.refresh_status()
-                else:
-                    self._state.set_error(NotARepo(action.repo_path or ""))
-
-            elif action.kind == "status":
-                try:
-                    status = self._service.parse_status(cmd_result.stdout)
-                    self._state.set_status(status)
-                    self._state.set_error(None)
-                except Exception as exc:
-                    self._state.set_error(ParseError(str(exc)))
-
-            elif action.kind == "log":
-                try:
-                    commits = self._service.parse_log(cmd_result.stdout)
-                    self._state.set_log(commits)
-                    self._state.set_error(None)
-                except Exception as exc:
-                    self._state.set_error(ParseError(str(exc)))
-
-            elif action.kind == "branches":
-                try:
-                    branches = self._service.parse_branches(cmd_result.stdout)
-                    self._state.set_branches(branches)
-                    self._state.set_error(None)
-                except Exception as exc:
-                    self._state.set_error(ParseError(str(exc)))
-
-            elif action.kind == "remote_branches":
-                try:
-                    branches = self._service.parse_remote_branches(cmd_result.stdout)
-                    self._state.set_remote_branches(branches)
-                    self._state.set_error(None)
-                except Exception as exc:
-                    self._state.set_error(ParseError(str(exc)))
-
-            elif action.kind == "conflicts":
-                try:
-                    conflicts = self._service.parse_conflicts(cmd_result.stdout)
-                    self._state.set_conflicts(conflicts)
-                    self._state.set_error(None)
-                except Exception as exc:
-                    self._state.set_error(ParseError(str(exc)))
-
-            elif action.kind == "stashes":
-                try:
-                    stashes = self._service.parse_stashes(cmd_result.stdout)
-                    self._state.set_stashes(stashes)
-                    self._state.set_error(None)
-                except Exception as exc:
-                    self._state.set_error(ParseError(str(exc)))
-
-            elif action.kind == "tags":
-                try:
-                    tags = self._service.parse_tags(cmd_result.stdout)
-                    self._state.set_tags(tags)
-                    self._state.set_error(None)
-                except Exception as exc:
-                    self._state.set_error(ParseError(str(exc)))
-
-            elif action.kind == "remotes":
-                try:
-                    remotes = self._service.parse_remotes(cmd_result.stdout)
-                    self._state.set_remotes(remotes)
-                    self._state.set_error(None)
-                except Exception as exc:
-                    self._state.set_error(ParseError(str(exc)))
-
-            elif action.kind == "diff":
-                diff_text = self._service.parse_diff(cmd_result.stdout)
-                self._state.set_diff_text(diff_text)
-                self._state.set_error(None)
-
-            # For mutating actions, trigger refreshes if requested.
-            if action.refresh_status:
-                self.refresh_status()
-            if action.refresh_branches:
-                self.refresh_branches()
-            if action.refresh_log:
-                self.refresh_log()
-            if action.refresh_stashes:
-                self.refresh_stashes()
-            if action.refresh_tags:
-                self.refresh_tags()
-            if action.refresh_remotes:
-                self.refresh_remotes()
-        finally:
-            # Busy is true if any actions remain in flight.
-            self._state.set_busy(bool(self._pending))
-            self._queue.mark_idle()
+                    return
+
+                # ───── Route by action kind to the appropriate handler ─────
+                # Mutations have no handler: their output is ignored.
+                handler = self._handlers.get(action.kind)
+                if handler and cmd_result.truncated:
+                    self._handle_truncated(action, cmd_result, handler)
+                elif handler:
+                    handler(action, cmd_result)
+
+                # For mutating actions, trigger refreshes if requested.
+                if action.refresh_mask:
+                    self._enqueue_refreshes(action.refresh_mask)
+            finally:
+                # A worker parse finishes the command later, once its result lands.
+                # Holding the queue until then keeps refreshes ordered (e.g. the
+                # log refresh after a commit sees the new status HEAD).
+                self._completing = False
+                if not self._parsing:
+                    self._finish_command()
@@ -2,6 +2,18 @@ from __future__ import annotations
 
 from collections.abc import Sequence
 
+# Keep only the tail of failed-command output; the end carries the error and
+# a verbose pull/merge could otherwise pin megabytes behind last_error.
+OUTPUT_TAIL_LIMIT = 64 * 1024
+TRUNCATED_MARKER = b"...[truncated]...\n"
+
+
+def _tail(payload: bytes) -> bytes:
+    """Return payload, or its last OUTPUT_TAIL_LIMIT bytes behind a marker."""
+    if len(payload) <= OUTPUT_TAIL_LIMIT:
+        return payload
+    return TRUNCATED_MARKER + payload[-OUTPUT_TAIL_LIMIT:]
+
 
 class GitUIError(Exception):
     """Base error type for git UI domain failures."""
@@ -21,8 +33,8 @@ class CommandFailed(GitUIError):
         super().__init__(message)
         self.command_args = list(command_args)
         self.exit_code = exit_code
-        self.stdout = stdout
-        self.stderr = stderr
+        self.stdout = _tail(stdout)
+        self.stderr = _tail(stderr)
 
 
 class NotARepo(GitUIError):
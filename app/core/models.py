@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
+from typing import overload
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FileChange:
     """Single file change from git status porcelain v2."""
 
@@ -14,7 +15,90 @@ class FileChange:
     orig_path: str | None = None
 
 
-@dataclass(frozen=True)
+class FileChangeBucket(Sequence[FileChange]):
+    """FileChange rows stored column-wise: one list per field, not one object per row.
+
+    Status buckets can hold tens of thousands of rows, and the UI only reads
+    paths, so rows are kept as parallel lists and FileChange objects are built
+    on access. Status codes are single characters, which CPython shares, so a
+    row costs four list slots instead of a separate object.
+    """
+
+    __slots__ = ("paths", "staged_codes", "unstaged_codes", "orig_paths")
+
+    def __init__(self) -> None:
+        """Create an empty bucket; parsers fill it with add()."""
+        self.paths: list[str] = []
+        self.staged_codes: list[str] = []
+        self.unstaged_codes: list[str] = []
+        self.orig_paths: list[str | None] = []
+
+    def add(
+        self,
+        path: str,
+        staged_status: str,
+        unstaged_status: str,
+        orig_path: str | None = None,
+    ) -> None:
+        """Append one row."""
+        self.paths.append(path)
+        self.staged_codes.append(staged_status)
+        self.unstaged_codes.append(unstaged_status)
+        self.orig_paths.append(orig_path)
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return len(self.paths)
+
+    @overload
+    def __getitem__(self, index: int) -> FileChange: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[FileChange]: ...
+
+    def __getitem__(self, index: int | slice) -> FileChange | list[FileChange]:
+        """Build the FileChange row(s) at index."""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return FileChange(
+            self.paths[index],
+            self.staged_codes[index],
+            self.unstaged_codes[index],
+            self.orig_paths[index],
+        )
+
+    def __iter__(self) -> Iterator[FileChange]:
+        """Yield rows one at a time without indexing each column."""
+        for row in zip(
+            self.paths,
+            self.staged_codes,
+            self.unstaged_codes,
+            self.orig_paths,
+            strict=True,
+        ):
+            yield FileChange(*row)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare row by row with any sequence of FileChange."""
+        if isinstance(other, FileChangeBucket):
+            return (
+                self.paths == other.paths
+                and self.staged_codes == other.staged_codes
+                and self.unstaged_codes == other.unstaged_codes
+                and self.orig_paths == other.orig_paths
+            )
+        if isinstance(other, Sequence):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Show rows like a list does."""
+        return f"FileChangeBucket({list(self)!r})"
+
+
+@dataclass(frozen=True, slots=True)
 class BranchInfo:
     """Branch and upstream tracking info for the current HEAD."""
 
@@ -25,7 +109,7 @@ class BranchInfo:
     behind: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Branch:
     """Single branch row from `git branch --format=...` output."""
 
@@ -38,7 +122,7 @@ class Branch:
     gone: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RemoteBranch:
     """Remote-tracking branch parsed from `git branch -r --format=...` output."""
 
@@ -47,7 +131,7 @@ class RemoteBranch:
     full_name: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RepoStatus:
     """Snapshot of repo status grouped for the UI."""
 
@@ -58,7 +142,7 @@ class RepoStatus:
     conflicted: Sequence[FileChange]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Commit:
     """Commit metadata parsed from structured git log output."""
 
@@ -71,7 +155,7 @@ class Commit:
     subject: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StashEntry:
     """Single stash row parsed from structured stash list output."""
 
@@ -81,14 +165,14 @@ class StashEntry:
     date: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Tag:
     """Single tag name from git tag output."""
 
     name: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Remote:
     """Remote name with optional fetch/push URLs."""
 
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from enum import IntFlag
+from pathlib import PurePath
 
 from app.core.models import (
     Branch,
@@ -16,6 +19,40 @@ from app.utils.qt_compat import QObject, Signal
 # RepoState is the single source of truth for UI data.
 # We centralize state here so UI widgets can subscribe to one signal and avoid
 # brittle partial-update logic spread across the UI.
+# Setters return early when the value is unchanged (identity for parsed
+# snapshots, equality for path/text/busy), so no-op writes never notify.
+
+
+class StateField(IntFlag):
+    """Which RepoState properties changed in one state_changed_fields emit."""
+
+    NONE = 0
+    REPO_PATH = 1
+    STATUS = 2
+    LOG = 4
+    BRANCHES = 8
+    REMOTE_BRANCHES = 16
+    STASHES = 32
+    TAGS = 64
+    REMOTES = 128
+    CONFLICTS = 256
+    DIFF = 512
+    ERROR = 1024
+    BUSY = 2048
+    ALL = (
+        REPO_PATH
+        | STATUS
+        | LOG
+        | BRANCHES
+        | REMOTE_BRANCHES
+        | STASHES
+        | TAGS
+        | REMOTES
+        | CONFLICTS
+        | DIFF
+        | ERROR
+        | BUSY
+    )
 
 
 class RepoState(QObject):
@@ -24,6 +61,9 @@ class RepoState(QObject):
     # Emitted whenever any state property changes.
     # UI components connect to this to know when to refresh.
     state_changed = Signal()
+    # Same moment as state_changed, carrying a StateField mask of what changed
+    # so listeners can skip views whose data did not move.
+    state_changed_fields = Signal(int)
 
     def __init__(self) -> None:
         """Initialize empty state."""
@@ -39,11 +79,17 @@ class RepoState(QObject):
         self._remotes: Sequence[Remote] | None = None
         self._conflicts: Sequence[str] | None = None
         self._diff_text: str | None = None
+        # Raw diff bytes, decoded on each diff_text read (see diff_text).
+        self._diff_bytes: bytes | None = None
 
         # UI-facing status flags.
         self._last_error: Exception | None = None
         self._busy = False
 
+        # batch() nesting depth and the fields changed since the last emit.
+        self._suspend = 0
+        self._changed = StateField.NONE
+
     @property
     def repo_path(self) -> str | None:
         """Current repo path or None."""
@@ -91,7 +137,15 @@ class RepoState(QObject):
 
     @property
     def diff_text(self) -> str | None:
-        """Latest diff text for the selected file, if loaded."""
+        """Latest diff text for the selected file, if loaded.
+
+        Raw diffs are decoded per read and not cached: the viewer copies the
+        text into its own document, so a cached str would hold a large diff a
+        third time (bytes + str + QTextDocument) for as long as it is shown.
+        """
+        if self._diff_bytes is not None:
+            # Same decoding as parse_diff_text, only when someone reads it.
+            return self._diff_bytes.decode("utf-8", errors="replace")
         return self._diff_text
 
     @property
@@ -106,60 +160,124 @@ class RepoState(QObject):
 
     def set_repo_path(self, path: str | None) -> None:
         """Update the current repo path and notify listeners."""
+        # Normalize once ("repo/", "a//b") so every command built from it
+        # shares one cwd string (and one interned CommandSpec).
+        if path:
+            path = str(PurePath(path))
+        if path == self._repo_path:
+            return
         self._repo_path = path
-        self.state_changed.emit()
+        self._notify(StateField.REPO_PATH)
 
     def set_status(self, status: RepoStatus | None) -> None:
         """Update the current status snapshot and notify listeners."""
+        if status is self._status:
+            return
         self._status = status
-        self.state_changed.emit()
+        self._notify(StateField.STATUS)
 
     def set_log(self, commits: Sequence[Commit] | None) -> None:
         """Update the commit log and notify listeners."""
+        if commits is self._log:
+            return
         self._log = commits
-        self.state_changed.emit()
+        self._notify(StateField.LOG)
 
     def set_branches(self, branches: Sequence[Branch] | None) -> None:
         """Update the branch list and notify listeners."""
+        if branches is self._branches:
+            return
         self._branches = branches
-        self.state_changed.emit()
+        self._notify(StateField.BRANCHES)
 
     def set_remote_branches(self, branches: Sequence[RemoteBranch] | None) -> None:
         """Update the remote branch list and notify listeners."""
+        if branches is self._remote_branches:
+            return
         self._remote_branches = branches
-        self.state_changed.emit()
+        self._notify(StateField.REMOTE_BRANCHES)
 
     def set_stashes(self, stashes: Sequence[StashEntry] | None) -> None:
         """Update the stash list and notify listeners."""
+        if stashes is self._stashes:
+            return
         self._stashes = stashes
-        self.state_changed.emit()
+        self._notify(StateField.STASHES)
 
     def set_tags(self, tags: Sequence[Tag] | None) -> None:
         """Update the tag list and notify listeners."""
+        if tags is self._tags:
+            return
         self._tags = tags
-        self.state_changed.emit()
+        self._notify(StateField.TAGS)
 
     def set_remotes(self, remotes: Sequence[Remote] | None) -> None:
         """Update the remote list and notify listeners."""
+        if remotes is self._remotes:
+            return
         self._remotes = remotes
-        self.state_changed.emit()
+        self._notify(StateField.REMOTES)
 
     def set_conflicts(self, conflicts: Sequence[str] | None) -> None:
         """Update the conflicted paths and notify listeners."""
+        if conflicts is self._conflicts:
+            return
         self._conflicts = conflicts
-        self.state_changed.emit()
+        self._notify(StateField.CONFLICTS)
 
     def set_diff_text(self, diff_text: str | None) -> None:
         """Update the latest diff text and notify listeners."""
+        if self._diff_bytes is None and diff_text == self._diff_text:
+            return
+        self._diff_bytes = None
         self._diff_text = diff_text
-        self.state_changed.emit()
+        self._notify(StateField.DIFF)
+
+    def set_diff_bytes(self, payload: bytes | None) -> None:
+        """Store raw diff output (decoded lazily) and notify listeners."""
+        if payload is not None and payload == self._diff_bytes:
+            return
+        self._diff_bytes = payload
+        self._diff_text = None
+        self._notify(StateField.DIFF)
 
     def set_error(self, error: Exception | None) -> None:
         """Update the last error and notify listeners."""
+        if error is self._last_error:
+            return
         self._last_error = error
-        self.state_changed.emit()
+        self._notify(StateField.ERROR)
 
     def set_busy(self, busy: bool) -> None:
         """Update busy flag and notify listeners."""
+        if busy == self._busy:
+            return
         self._busy = busy
+        self._notify(StateField.BUSY)
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Group setter calls so listeners see one state_changed at the end.
+
+        Nested batches are allowed; only the outermost one emits, and only
+        if something changed inside it.
+        """
+        self._suspend += 1
+        try:
+            yield
+        finally:
+            self._suspend -= 1
+            if not self._suspend and self._changed:
+                self._emit()
+
+    def _notify(self, field: StateField) -> None:
+        """Record a changed field and emit now, or defer to the enclosing batch()."""
+        self._changed |= field
+        if not self._suspend:
+            self._emit()
+
+    def _emit(self) -> None:
+        """Emit the accumulated field mask, then the plain state_changed."""
+        changed, self._changed = self._changed, StateField.NONE
+        self.state_changed_fields.emit(int(changed))
         self.state_changed.emit()
@@ -4,27 +4,29 @@ from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CommandSpec:
     """Immutable description of a command to execute."""
 
     # Keep this immutable so callers can safely share specs across layers.
-    args: Sequence[str]  # Program + arguments, e.g. ["git", "status"].
+    args: Sequence[str]  # Program + arguments, e.g. ("git", "status").
     cwd: str | None = None  # Working directory for the process.
     env: Mapping[str, str] | None = None  # Env var overrides.
+    # False when nobody parses stdout (mutations): only a short tail is kept.
+    capture_stdout: bool = True
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RunHandle:
     """Immutable reference to a running command."""
 
     # Stable ID lets us correlate signals without storing process objects in UI.
     run_id: int
     spec: CommandSpec  # Command + args + cwd + env.
-    started_at_ms: int  # Monotonic ms timestamp.
+    started_at_ns: int  # Monotonic ns timestamp (monotonic_ns()).
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CommandResult:
     """Final output of a completed command."""
 
@@ -33,6 +35,9 @@ class CommandResult:
     stdout: bytes  # Collected stdout bytes.
     stderr: bytes  # Collected stderr bytes.
     duration_ms: int  # Runtime in milliseconds (monotonic).
+    # True when output exceeded the runner's capture cap and was cut short,
+    # so parsers should treat stdout/stderr as partial.
+    truncated: bool = False
 
     @property
     def ok(self) -> bool:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import OrderedDict, deque
 from collections.abc import Callable
 from dataclasses import dataclass
 from enum import Enum
@@ -35,7 +36,7 @@ class QueuePriority(Enum):
     BACKGROUND = "background"  # Automatic refreshes (status, log, branches)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class QueueItem:
     """Queued command action with an optional coalesce key."""
 
@@ -53,7 +54,9 @@ class CommandQueue(QObject):
     def __init__(self) -> None:
         super().__init__()
         self._running = False  # True while a command is executing
-        self._queue: list[QueueItem] = []  # Pending items waiting to run
+        # Pending items: USER in FIFO order, BACKGROUND keyed for O(1) coalescing.
+        self._user: deque[QueueItem] = deque()
+        self._background: OrderedDict[str, QueueItem] = OrderedDict()
 
     @property
     def running(self) -> bool:
@@ -64,14 +67,17 @@ class CommandQueue(QObject):
         """Add a command to the queue, coalescing by key for background tasks."""
         if item.priority == QueuePriority.BACKGROUND:
             # Background tasks coalesce: if there's already a pending task with
-            # the same key, replace it with this newer one. This prevents
-            # queueing multiple redundant refreshes.
-            self._queue = [q for q in self._queue if q.key != item.key]
-
-        self._queue.append(item)
-        self.queue_changed.emit()
-        # Try to run immediately if nothing else is running.
-        self._try_start_next()
+            # the same key, replace it with this newer one (moved to the back,
+            # as if the old one were removed). This prevents queueing multiple
+            # redundant refreshes.
+            self._background[item.key] = item
+            self._background.move_to_end(item.key)
+        else:
+            self._user.append(item)
+        # Try to run immediately if nothing else is running; starting emits
+        # queue_changed itself, so only announce the append otherwise.
+        if not self._try_start_next():
+            self.queue_changed.emit()
 
     def mark_running(self) -> None:
         """Mark the queue as running (called externally to block queue)."""
@@ -81,23 +87,28 @@ class CommandQueue(QObject):
     def mark_idle(self) -> None:
         """Mark the queue as idle and start the next command if any."""
         self._running = False
-        self.queue_changed.emit()
-        # Check if there's another command waiting to run.
-        self._try_start_next()
+        # Check if there's another command waiting to run (one emit either way).
+        if not self._try_start_next():
+            self.queue_changed.emit()
+
+    def _try_start_next(self) -> bool:
+        """Start the next queued item if not currently running.
 
-    def _try_start_next(self) -> None:
-        """Start the next queued item if not currently running."""
-        if self._running or not self._queue:
-            return
+        Returns True when an item was started (queue_changed already emitted).
+        """
+        if self._running or not (self._user or self._background):
+            return False
 
         # USER priority items always run before BACKGROUND ones.
         # This ensures user actions aren't blocked by pending refreshes.
-        user_items = [q for q in self._queue if q.priority == QueuePriority.USER]
-        item = user_items[0] if user_items else self._queue[0]
-        self._queue.remove(item)
+        if self._user:
+            item = self._user.popleft()
+        else:
+            _key, item = self._background.popitem(last=False)
 
         self._running = True
         self.queue_changed.emit()
         # Run the item. It's responsible for calling mark_idle() when done
         # (typically via _on_command_finished in the controller).
         item.run()
+        return True
@@ -1,9 +1,58 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from time import monotonic_ns
+from types import MappingProxyType
 
 from app.exec.command_models import CommandResult, CommandSpec, RunHandle
-from app.utils.qt_compat import QObject, QProcess, Signal
+from app.utils.qt_compat import QObject, QProcess, QProcessEnvironment, Signal
+
+# Stdout kept for commands with capture_stdout=False: enough for git's error
+# text (some failures, like "nothing to commit", are reported on stdout).
+UNCAPTURED_STDOUT_TAIL = 4096
+
+# Cap on buffered bytes per stream so runaway output (e.g. `log -p --all`)
+# cannot exhaust memory. Chunks past the cap are still emitted live but left
+# out of the CommandResult, which is then marked truncated.
+MAX_CAPTURE_BYTES = 64 * 1024 * 1024
+
+# QProcess dynamic property holding the run_id; slots read it via sender().
+_RUN_ID_PROPERTY = "run_id"
+
+
+@dataclass(slots=True)
+class _RunCtx:
+    """Everything CommandRunner tracks for one in-flight run."""
+
+    handle: RunHandle
+    # Kept here so the QProcess stays alive until the run finishes.
+    process: QProcess | None = None
+    # Output chunks, joined once into the CommandResult when the run ends.
+    stdout: list[bytes] = field(default_factory=list)
+    stderr: list[bytes] = field(default_factory=list)
+    stdout_size: int = 0
+    stderr_size: int = 0
+    # True once either stream hit MAX_CAPTURE_BYTES.
+    truncated: bool = False
+
+    def add_stdout(self, data: bytes) -> None:
+        """Buffer a stdout chunk, up to MAX_CAPTURE_BYTES."""
+        self.stdout_size = self._add(self.stdout, self.stdout_size, data)
+
+    def add_stderr(self, data: bytes) -> None:
+        """Buffer a stderr chunk, up to MAX_CAPTURE_BYTES."""
+        self.stderr_size = self._add(self.stderr, self.stderr_size, data)
+
+    def _add(self, chunks: list[bytes], size: int, data: bytes) -> int:
+        """Append what fits under the cap and return the new buffered size."""
+        room = MAX_CAPTURE_BYTES - size
+        if len(data) > room:
+            data = data[:room]
+            self.truncated = True
+        if data:
+            chunks.append(data)
+        return size + len(data)
 
 
 class CommandRunner(QObject):
@@ -21,22 +70,23 @@ class CommandRunner(QObject):
         super().__init__()
         self._next_run_id = 1  # Unique ID generator for each run.
 
-        # Keep QProcess alive and accessible by run_id.
-        self._processes: dict[int, QProcess] = {}
-        self._handles: dict[int, RunHandle] = {}
+        # One record per in-flight run: handle, process and output buffers,
+        # so each output chunk costs a single lookup.
+        self._runs: dict[int, _RunCtx] = {}
 
-        # Accumulate output so we can build CommandResult later.
-        self._stdout_buffers: dict[int, bytearray] = {}
-        self._stderr_buffers: dict[int, bytearray] = {}
+        # Built process environments for shared read-only env mappings (the
+        # GitRunner defaults), by identity: id(env) -> (env, built).
+        self._process_envs: dict[int, tuple[Mapping[str, str], QProcessEnvironment]] = (
+            {}
+        )
 
     def _new_handle(self, spec: CommandSpec) -> RunHandle:
         """Create and register a new handle for a command run."""
         run_id = self._next_run_id
         self._next_run_id += 1
         # Monotonic time only moves forward, which is safe for durations.
-        started_at_ms = monotonic_ns() // 1_000_000
-        handle = RunHandle(run_id=run_id, spec=spec, started_at_ms=started_at_ms)
-        self._handles[run_id] = handle
+        handle = RunHandle(run_id=run_id, spec=spec, started_at_ns=monotonic_ns())
+        self._runs[run_id] = _RunCtx(handle)
         return handle
 
     def run(self, spec: CommandSpec) -> RunHandle:
@@ -49,116 +99,152 @@ class CommandRunner(QObject):
 
         # Create and store the QProcess so it stays alive.
         process = QProcess(self)
-        self._processes[handle.run_id] = process
-
-        # Create output buffers for this run.
-        self._stdout_buffers[handle.run_id] = bytearray()
-        self._stderr_buffers[handle.run_id] = bytearray()
+        self._runs[handle.run_id].process = process
 
         # Set working directory if provided (so git runs in the repo).
         if spec.cwd:
             process.setWorkingDirectory(spec.cwd)
 
-        # Apply environment overrides if provided.
+        # Apply environment overrides on top of the inherited environment.
         if spec.env:
-            env = process.processEnvironment()
-            for key, value in spec.env.items():
-                env.insert(key, value)
-            process.setProcessEnvironment(env)
+            process.setProcessEnvironment(self._process_env(spec.env))
 
         # QProcess expects program and args split, while CommandSpec keeps argv together.
         process.setProgram(spec.args[0])
         process.setArguments(list(spec.args[1:]))
 
         # Wire output and completion signals for this run.
-        # The lambda captures run_id so signals map back to the right handle.
-        process.readyReadStandardOutput.connect(
-            lambda rid=handle.run_id: self._on_stdout(rid)
-        )
-        process.readyReadStandardError.connect(
-            lambda rid=handle.run_id: self._on_stderr(rid)
-        )
-        process.finished.connect(
-            lambda exit_code, _status, rid=handle.run_id: self._on_finished(
-                rid, exit_code
-            )
-        )
+        # The process carries its run_id, so every run shares the same bound
+        # slots instead of allocating three closures per command.
+        process.setProperty(_RUN_ID_PROPERTY, handle.run_id)
+        process.readyReadStandardOutput.connect(self._on_stdout_ready)
+        process.readyReadStandardError.connect(self._on_stderr_ready)
+        process.finished.connect(self._on_process_finished)
 
         # Kick off the process and announce it started.
         process.start()
         self.command_started.emit(handle)
         return handle
 
+    def _process_env(self, env: Mapping[str, str]) -> QProcessEnvironment:
+        """Return the system environment plus env overrides.
+
+        Starts from systemEnvironment() because QProcess replaces the whole
+        environment once one is set. Shared read-only mappings are built once
+        and reused, so repeated refreshes skip the per-key insert loop.
+        """
+        shared = isinstance(env, MappingProxyType)
+        if shared:
+            cached = self._process_envs.get(id(env))
+            if cached and cached[0] is env:
+                return cached[1]
+        built = QProcessEnvironment.systemEnvironment()
+        for key, value in env.items():
+            built.insert(key, value)
+        if shared:
+            self._process_envs[id(env)] = (env, built)
+        return built
+
     def cancel(self, handle: RunHandle) -> bool:
         """Request a graceful stop for a running command."""
-        process = self._processes.get(handle.run_id)
-        if not process:
+        ctx = self._runs.get(handle.run_id)
+        if not ctx or not ctx.process:
             return False
 
         # Terminate asks the process to exit cleanly.
-        process.terminate()
+        ctx.process.terminate()
         return True
 
     def kill(self, handle: RunHandle) -> bool:
         """Force-kill a running command."""
-        process = self._processes.get(handle.run_id)
-        if not process:
+        ctx = self._runs.get(handle.run_id)
+        if not ctx or not ctx.process:
             return False
 
         # Kill is immediate and does not allow cleanup.
-        process.kill()
+        ctx.process.kill()
         return True
 
+    def _sender_run_id(self) -> int | None:
+        """Return the run_id of the QProcess that emitted the current signal."""
+        process = self.sender()
+        if process is None:
+            return None
+        return process.property(_RUN_ID_PROPERTY)
+
+    def _on_stdout_ready(self) -> None:
+        """Slot for readyReadStandardOutput."""
+        run_id = self._sender_run_id()
+        if run_id is not None:
+            self._on_stdout(run_id)
+
+    def _on_stderr_ready(self) -> None:
+        """Slot for readyReadStandardError."""
+        run_id = self._sender_run_id()
+        if run_id is not None:
+            self._on_stderr(run_id)
+
+    def _on_process_finished(self, exit_code: int, _status: object) -> None:
+        """Slot for QProcess.finished."""
+        run_id = self._sender_run_id()
+        if run_id is not None:
+            self._on_finished(run_id, exit_code)
+
     def _on_stdout(self, run_id: int) -> None:
         """Read and emit stdout for a running command."""
-        # Look up the process/handle for this run.
-        process = self._processes.get(run_id)
-        handle = self._handles.get(run_id)
-        if not process or not handle:
+        # Look up the run record (handle, process, buffers).
+        ctx = self._runs.get(run_id)
+        if not ctx or not ctx.process:
             return
 
         # Read bytes, buffer them, and emit streaming output.
-        data = process.readAllStandardOutput().data()
+        data = ctx.process.readAllStandardOutput().data()
         if data:
-            self._stdout_buffers[run_id].extend(data)
-            self.command_stdout.emit(handle, data)
+            if ctx.handle.spec.capture_stdout:
+                ctx.add_stdout(data)
+            else:
+                # Nobody parses this output; keep only the tail, as one chunk.
+                tail = b"".join((*ctx.stdout, data))[-UNCAPTURED_STDOUT_TAIL:]
+                ctx.stdout[:] = [tail]
+            self.command_stdout.emit(ctx.handle, data)
 
     def _on_stderr(self, run_id: int) -> None:
         """Read and emit stderr for a running command."""
-        # Look up the process/handle for this run.
-        process = self._processes.get(run_id)
-        handle = self._handles.get(run_id)
-        if not process or not handle:
+        # Look up the run record (handle, process, buffers).
+        ctx = self._runs.get(run_id)
+        if not ctx or not ctx.process:
             return
 
         # Read bytes, buffer them, and emit streaming output.
-        data = process.readAllStandardError().data()
+        data = ctx.process.readAllStandardError().data()
         if data:
-            self._stderr_buffers[run_id].extend(data)
-            self.command_stderr.emit(handle, data)
+            ctx.add_stderr(data)
+            self.command_stderr.emit(ctx.handle, data)
 
     def _on_finished(self, run_id: int, exit_code: int) -> None:
         """Assemble the CommandResult and emit completion."""
         # Build the final result from buffers and emit completion.
-        handle = self._handles.get(run_id)
-        process = self._processes.get(run_id)
-        if not handle:
+        # Popping first also cleans up the run record (no leaks).
+        ctx = self._runs.pop(run_id, None)
+        if not ctx:
             return
+        handle = ctx.handle
 
         # Compute duration from monotonic timestamp.
-        duration_ms = monotonic_ns() // 1_000_000 - handle.started_at_ms
-        stdout = bytes(self._stdout_buffers.pop(run_id, bytearray()))
-        stderr = bytes(self._stderr_buffers.pop(run_id, bytearray()))
+        # Divide once at the end so the duration has no ms rounding at both ends.
+        duration_ms = (monotonic_ns() - handle.started_at_ns) // 1_000_000
+        # bytes.join sizes the result once and copies each chunk exactly once.
+        stdout = b"".join(ctx.stdout)
+        stderr = b"".join(ctx.stderr)
         result = CommandResult(
             exit_code=exit_code,
             stdout=stdout,
             stderr=stderr,
             duration_ms=duration_ms,
+            truncated=ctx.truncated,
         )
         self.command_finished.emit(handle, result)
 
-        # Cleanup process and handle to avoid leaks.
-        if process:
-            process.deleteLater()
-        self._processes.pop(run_id, None)
-        self._handles.pop(run_id, None)
+        # Release the QProcess now that the result is delivered.
+        if ctx.process:
+            ctx.process.deleteLater()
@@ -1,23 +1,31 @@
 from __future__ import annotations
 
+from collections import deque
+
 from app.exec.command_models import CommandSpec, RunHandle
 
 
 class FakeCommandRunner:
     """Test double that records CommandSpec inputs and returns handles."""
 
-    def __init__(self) -> None:
-        # Store all CommandSpec inputs for assertions in tests.
-        self.calls: list[CommandSpec] = []
-        self.handles: list[RunHandle] = []
+    def __init__(self, max_history: int | None = None) -> None:
+        # Store CommandSpec inputs for assertions in tests. Long-running
+        # harnesses can pass max_history to keep only the most recent calls.
+        self.calls: deque[CommandSpec] = deque(maxlen=max_history)
+        self.handles: deque[RunHandle] = deque(maxlen=max_history)
         self._next_run_id = 1
 
+    def reset(self) -> None:
+        """Forget recorded calls and handles (run ids keep counting)."""
+        self.calls.clear()
+        self.handles.clear()
+
     def run(self, spec: CommandSpec) -> RunHandle:
         """Record the spec and return a stable RunHandle."""
         self.calls.append(spec)
 
         # We do not execute a real process; this is a deterministic handle.
-        handle = RunHandle(run_id=self._next_run_id, spec=spec, started_at_ms=0)
+        handle = RunHandle(run_id=self._next_run_id, spec=spec, started_at_ns=0)
         self._next_run_id += 1
         self.handles.append(handle)
         return handle
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from collections.abc import Mapping, Sequence
+from types import MappingProxyType
 
 from app.exec.command_models import CommandSpec, RunHandle
 from app.exec.command_runner import CommandRunner
 
+# Upper bound on interned read-command specs (a few repos x refresh kinds).
+_SPEC_CACHE_SIZE = 128
+
 
 class GitRunner:
     """Thin wrapper that runs git commands with safe defaults."""
@@ -15,11 +20,19 @@ class GitRunner:
         self._git_executable = git_executable
 
         # Defaults keep output stable and avoid interactive prompts.
-        self._default_env = {
-            "GIT_PAGER": "cat",
-            "GIT_TERMINAL_PROMPT": "0",
-            "LANG": "C.UTF-8",
-        }
+        # Read-only, so specs without overrides can all share this one mapping.
+        self._default_env: Mapping[str, str] = MappingProxyType(
+            {
+                "GIT_PAGER": "cat",
+                "GIT_TERMINAL_PROMPT": "0",
+                "LANG": "C.UTF-8",
+            }
+        )
+        # Merged envs for read-only override mappings, by identity:
+        # id(override) -> (override, merged).
+        self._merged_envs: dict[int, tuple[Mapping[str, str], Mapping[str, str]]] = {}
+        # Interned specs for repeated read commands (refreshes).
+        self._specs: OrderedDict[tuple[object, ...], CommandSpec] = OrderedDict()
 
     @property
     def runner(self) -> CommandRunner:
@@ -31,19 +44,50 @@ class GitRunner:
         args: Sequence[str],
         cwd: str | None = None,
         env: Mapping[str, str] | None = None,
+        capture_stdout: bool = True,
     ) -> RunHandle:
         """Run a git command and return a handle."""
         if not args:
             raise ValueError("GitRunner.run requires at least one arg")
 
-        # Merge default environment with caller overrides.
-        merged_env = dict(self._default_env)
-        if env:
-            merged_env.update(env)
-
-        spec = CommandSpec(
-            args=[self._git_executable, *args],
-            cwd=cwd,
-            env=merged_env,
-        )
+        merged_env = self._merge_env(env)
+        argv = (self._git_executable, *args)
+        if capture_stdout and isinstance(merged_env, MappingProxyType):
+            spec = self._intern_spec(argv, cwd, merged_env)
+        else:
+            spec = CommandSpec(
+                args=argv, cwd=cwd, env=merged_env, capture_stdout=capture_stdout
+            )
         return self._runner.run(spec)
+
+    def _merge_env(self, env: Mapping[str, str] | None) -> Mapping[str, str]:
+        """Merge default environment with caller overrides.
+
+        Defaults are shared as-is, and merges of read-only overrides (such as
+        READ_ONLY_ENV) are computed once and reused.
+        """
+        if not env:
+            return self._default_env
+        if not isinstance(env, MappingProxyType):
+            return {**self._default_env, **env}
+        cached = self._merged_envs.get(id(env))
+        if cached and cached[0] is env:
+            return cached[1]
+        merged = MappingProxyType({**self._default_env, **env})
+        self._merged_envs[id(env)] = (env, merged)
+        return merged
+
+    def _intern_spec(
+        self, argv: tuple[str, ...], cwd: str | None, env: Mapping[str, str]
+    ) -> CommandSpec:
+        """Return a shared spec for a repeated read command (small LRU)."""
+        key = (argv, cwd, id(env))
+        spec = self._specs.get(key)
+        if spec is not None and spec.env is env:
+            self._specs.move_to_end(key)
+            return spec
+        spec = CommandSpec(args=argv, cwd=cwd, env=env)
+        self._specs[key] = spec
+        if len(self._specs) > _SPEC_CACHE_SIZE:
+            self._specs.popitem(last=False)
+        return spec
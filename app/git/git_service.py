@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
+from types import MappingProxyType
 
 from app.core.models import (
     Branch,
@@ -44,6 +45,11 @@ STASH_FORMAT = "%H%x1f%gd%x1f%gs%x1f%ad%x1e"
 # Branch format: name, is_current (*), upstream, tracking status (+n/-n)
 BRANCH_FORMAT = "%(refname:short)|%(HEAD)|%(upstream:short)|%(upstream:track)"
 
+# Read-only refreshes skip git's optional index lock/rewrite (see ADR-0010), so
+# a background status never contends with a mutation or an external git.
+# Read-only mapping, so GitRunner can cache its merge and intern the specs.
+READ_ONLY_ENV: Mapping[str, str] = MappingProxyType({"GIT_OPTIONAL_LOCKS": "0"})
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # GitService: Intent layer between Controller and GitRunner.
@@ -73,6 +79,12 @@ class GitService:
         """Expose CommandRunner so controllers can subscribe to signals."""
         return self._runner.runner
 
+    def _mutate(self, args: Sequence[str], repo_path: str) -> RunHandle:
+        """Run a mutating command whose stdout the controller never parses."""
+        # Only a short stdout tail is kept (for error dialogs, e.g. "nothing to
+        # commit"); the console still sees every chunk as it streams.
+        return self._runner.run(args, cwd=repo_path, capture_stdout=False)
+
     def status_raw(self, repo_path: str) -> RunHandle:
         """Run git status using machine-readable output."""
         # --porcelain=v2: Stable machine-readable format with more detail
@@ -81,6 +93,7 @@ class GitService:
         return self._runner.run(
             ["status", "--porcelain=v2", "-b", "-z"],
             cwd=repo_path,
+            env=READ_ONLY_ENV,
         )
 
     def diff_file_raw(
@@ -94,19 +107,19 @@ class GitService:
         if staged:
             args.append("--cached")
         args.extend(["--", path])
-        return self._runner.run(args, cwd=repo_path)
+        return self._runner.run(args, cwd=repo_path, env=READ_ONLY_ENV)
 
     def stage(self, repo_path: str, paths: Sequence[str]) -> RunHandle:
         """Stage files (git add)."""
-        return self._runner.run(["add", "--", *paths], cwd=repo_path)
+        return self._mutate(["add", "--", *paths], repo_path)
 
     def unstage(self, repo_path: str, paths: Sequence[str]) -> RunHandle:
         """Unstage files (git restore --staged)."""
-        return self._runner.run(["restore", "--staged", "--", *paths], cwd=repo_path)
+        return self._mutate(["restore", "--staged", "--", *paths], repo_path)
 
     def discard(self, repo_path: str, paths: Sequence[str]) -> RunHandle:
         """Discard local changes (git restore)."""
-        return self._runner.run(["restore", "--", *paths], cwd=repo_path)
+        return self._mutate(["restore", "--", *paths], repo_path)
 
     def commit(self, repo_path: str, message: str, amend: bool = False) -> RunHandle:
         """Commit staged changes with a message."""
@@ -114,15 +127,15 @@ class GitService:
         if amend:
             args.append("--amend")
         args.extend(["-m", message])
-        return self._runner.run(args, cwd=repo_path)
+        return self._mutate(args, repo_path)
 
     def fetch(self, repo_path: str) -> RunHandle:
         """Fetch from remotes."""
-        return self._runner.run(["fetch"], cwd=repo_path)
+        return self._mutate(["fetch"], repo_path)
 
     def pull_ff_only(self, repo_path: str) -> RunHandle:
         """Pull with fast-forward only."""
-        return self._runner.run(["pull", "--ff-only"], cwd=repo_path)
+        return self._mutate(["pull", "--ff-only"], repo_path)
 
     def push(
         self,
@@ -139,7 +152,7 @@ class GitService:
                     "remote and branch are required when set_upstream is True"
                 )
             args.extend(["-u", remote, branch])
-        return self._runner.run(args, cwd=repo_path)
+        return self._mutate(args, repo_path)
 
     def log_raw(self, repo_path: str, limit: int = 300) -> RunHandle:
         """Return structured log output for recent commits."""
@@ -167,7 +180,9 @@ class GitService:
     def conflicts_raw(self, repo_path: str) -> RunHandle:
         """List conflicted paths using diff-filter=U."""
         return self._runner.run(
-            ["diff", "--name-only", "--diff-filter=U"], cwd=repo_path
+            ["diff", "--name-only", "--diff-filter=U"],
+            cwd=repo_path,
+            env=READ_ONLY_ENV,
         )
 
     def stash_list_raw(self, repo_path: str) -> RunHandle:
@@ -189,28 +204,28 @@ class GitService:
             args.append("-u")
         if message:
             args.extend(["-m", message])
-        return self._runner.run(args, cwd=repo_path)
+        return self._mutate(args, repo_path)
 
     def stash_apply(self, repo_path: str, ref: str | None = None) -> RunHandle:
         """Apply a stash without dropping it."""
         args = ["stash", "apply"]
         if ref:
             args.append(ref)
-        return self._runner.run(args, cwd=repo_path)
+        return self._mutate(args, repo_path)
 
     def stash_pop(self, repo_path: str, ref: str | None = None) -> RunHandle:
         """Apply a stash and drop it if successful."""
         args = ["stash", "pop"]
         if ref:
             args.append(ref)
-        return self._runner.run(args, cwd=repo_path)
+        return self._mutate(args, repo_path)
 
     def stash_drop(self, repo_path: str, ref: str | None = None) -> RunHandle:
         """Drop a stash entry without applying it."""
         args = ["stash", "drop"]
         if ref:
             args.append(ref)
-        return self._runner.run(args, cwd=repo_path)
+        return self._mutate(args, repo_path)
 
     def tags_raw(self, repo_path: str) -> RunHandle:
         """List tags in the repo."""
@@ -223,19 +238,19 @@ class GitService:
         args = ["tag", name]
         if ref:
             args.append(ref)
-        return self._runner.run(args, cwd=repo_path)
+        return self._mutate(args, repo_path)
 
     def delete_tag(self, repo_path: str, name: str) -> RunHandle:
         """Delete a local tag."""
-        return self._runner.run(["tag", "-d", name], cwd=repo_path)
+        return self._mutate(["tag", "-d", name], repo_path)
 
     def push_tag(self, repo_path: str, name: str, remote: str = "origin") -> RunHandle:
         """Push a single tag to a remote."""
-        return self._runner.run(["push", remote, name], cwd=repo_path)
+        return self._mutate(["push", remote, name], repo_path)
 
     def push_tags(self, repo_path: str, remote: str = "origin") -> RunHandle:
         """Push all tags to a remote."""
-        return self._runner.run(["push", remote, "--tags"], cwd=repo_path)
+        return self._mutate(["push", remote, "--tags"], repo_path)
 
     def remotes_raw(self, repo_path: str) -> RunHandle:
         """List remotes with their fetch/push URLs."""
@@ -243,15 +258,15 @@ class GitService:
 
     def add_remote(self, repo_path: str, name: str, url: str) -> RunHandle:
         """Add a new remote."""
-        return self._runner.run(["remote", "add", name, url], cwd=repo_path)
+        return self._mutate(["remote", "add", name, url], repo_path)
 
     def remove_remote(self, repo_path: str, name: str) -> RunHandle:
         """Remove an existing remote."""
-        return self._runner.run(["remote", "remove", name], cwd=repo_path)
+        return self._mutate(["remote", "remove", name], repo_path)
 
     def set_remote_url(self, repo_path: str, name: str, url: str) -> RunHandle:
         """Update a remote's URL."""
-        return self._runner.run(["remote", "set-url", name, url], cwd=repo_path)
+        return self._mutate(["remote", "set-url", name, url], repo_path)
 
     def set_upstream(
         self, repo_path: str, upstream: str, branch: str | None = None
@@ -260,28 +275,28 @@ class GitService:
         args = ["branch", "--set-upstream-to", upstream]
         if branch:
             args.append(branch)
-        return self._runner.run(args, cwd=repo_path)
+        return self._mutate(args, repo_path)
 
     def switch_branch(self, repo_path: str, name: str) -> RunHandle:
         """Switch to an existing branch."""
-        return self._runner.run(["switch", name], cwd=repo_path)
+        return self._mutate(["switch", name], repo_path)
 
     def create_branch(
         self, repo_path: str, name: str, from_ref: str = "HEAD"
     ) -> RunHandle:
         """Create and switch to a new branch."""
-        return self._runner.run(["switch", "-c", name, from_ref], cwd=repo_path)
+        return self._mutate(["switch", "-c", name, from_ref], repo_path)
 
     def delete_branch(
         self, repo_path: str, name: str, force: bool = False
     ) -> RunHandle:
         """Delete a local branch."""
         flag = "-D" if force else "-d"
-        return self._runner.run(["branch", flag, name], cwd=repo_path)
+        return self._mutate(["branch", flag, name], repo_path)
 
     def delete_remote_branch(self, repo_path: str, remote: str, name: str) -> RunHandle:
         """Delete a remote branch via push --delete."""
-        return self._runner.run(["push", remote, "--delete", name], cwd=repo_path)
+        return self._mutate(["push", remote, "--delete", name], repo_path)
 
     def is_inside_work_tree_raw(self, repo_path: str) -> RunHandle:
         """Check if a path is inside a git work tree."""
@@ -298,9 +313,11 @@ class GitService:
         """Parse porcelain v2 status output into RepoStatus."""
         return parse_status_porcelain_v2(payload)
 
-    def parse_log(self, payload: bytes) -> list[Commit]:
+    def parse_log(
+        self, payload: bytes, known: Mapping[str, Commit] | None = None
+    ) -> list[Commit]:
         """Parse structured log output into Commit objects."""
-        return parse_log_records(payload)
+        return parse_log_records(payload, known=known)
 
     def parse_diff(self, payload: bytes) -> str:
         """Return diff output as text for display."""
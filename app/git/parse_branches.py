@@ -1,6 +1,16 @@
 from __future__ import annotations
 
+import re
+
 from app.core.models import Branch
+from app.git.parse_utils import parse_uint
+
+# The track shapes git emits for a live upstream: "", "[ahead N]",
+# "[behind N]" or "[ahead N, behind M]". Anything else ("[gone]", hand-made
+# input) goes through _parse_track.
+_AHEAD_BEHIND_RE = re.compile(
+    r"(?:\[(?:ahead (\d+))?(?:, )?(?:behind (\d+))?\])?", re.ASCII
+)
 
 
 def parse_branches(payload: bytes) -> list[Branch]:
@@ -8,52 +18,66 @@ def parse_branches(payload: bytes) -> list[Branch]:
     text = payload.decode("utf-8", errors="replace")
     branches: list[Branch] = []
 
+    # Lines stay on str.split: splitting a short line is cheaper than a
+    # line-level regex match, so the regex only replaces the track parsing.
     for line in text.splitlines():
         if not line:
             continue
 
-        parts = line.split("|")
+        # Only fields 0..3 are read; maxsplit stops scanning after the fourth
+        # '|' (extras land in parts[4] and are ignored, as before).
+        parts = line.split("|", 4)
         name = parts[0] if len(parts) > 0 else ""
         head_flag = parts[1] if len(parts) > 1 else ""
         upstream_raw = parts[2] if len(parts) > 2 else ""
         track_raw = parts[3] if len(parts) > 3 else ""
 
-        upstream = upstream_raw or None
-        is_current = head_flag.strip() == "*"
-
         ahead = 0
         behind = 0
         gone = False
+        if track_raw:
+            counts = _AHEAD_BEHIND_RE.fullmatch(track_raw.strip())
+            if counts:
+                ahead_raw, behind_raw = counts.groups()
+                ahead = int(ahead_raw) if ahead_raw else 0
+                behind = int(behind_raw) if behind_raw else 0
+            else:
+                ahead, behind, gone = _parse_track(track_raw)
 
-        track = track_raw.strip()
-        if track.startswith("[") and track.endswith("]"):
-            track = track[1:-1]
-
-        if track:
-            if "gone" in track:
-                gone = True
-            for token in track.split(","):
-                token = token.strip()
-                if token.startswith("ahead "):
-                    try:
-                        ahead = int(token.split()[1])
-                    except (IndexError, ValueError):
-                        ahead = 0
-                elif token.startswith("behind "):
-                    try:
-                        behind = int(token.split()[1])
-                    except (IndexError, ValueError):
-                        behind = 0
-
+        # Positional order: name, is_current, upstream, ahead, behind, gone.
         branches.append(
             Branch(
-                name=name,
-                is_current=is_current,
-                upstream=upstream,
-                ahead=ahead,
-                behind=behind,
-                gone=gone,
+                name,
+                head_flag.strip() == "*",
+                upstream_raw or None,
+                ahead,
+                behind,
+                gone,
             )
         )
 
     return branches
+
+
+def _parse_track(track_raw: str) -> tuple[int, int, bool]:
+    """Return (ahead, behind, gone) from a track field of any shape."""
+    ahead = 0
+    behind = 0
+    gone = False
+
+    track = track_raw.strip()
+    if track.startswith("[") and track.endswith("]"):
+        track = track[1:-1]
+
+    if track:
+        if "gone" in track:
+            gone = True
+        for token in track.split(","):
+            token = token.strip()
+            # Stripped and starting with "<word> ", so split()[1] always exists.
+            if token.startswith("ahead "):
+                ahead = parse_uint(token.split()[1])
+            elif token.startswith("behind "):
+                behind = parse_uint(token.split()[1])
+
+    return ahead, behind, gone
@@ -1,18 +1,51 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
+
 from app.core.models import Commit
+from app.git.parse_utils import FIELD_SEP, RECORD_SEP, decode_records, split_flat_fields
 
-RECORD_SEP = "\x1e"
-FIELD_SEP = "\x1f"
+# oid, parents, author_name, author_email, author_date, subject
+_FIELD_COUNT = 6
 
 
-def parse_log_records(payload: bytes) -> list[Commit]:
+def parse_log_records(
+    payload: bytes, known: Mapping[str, Commit] | None = None
+) -> list[Commit]:
     """Parse structured git log records into Commit objects.
 
     Expected format per record:
     oid<US>parents<US>author_name<US>author_email<US>author_date<US>subject<RS>
+
+    Commits whose oid is in `known` are reused instead of re-split/rebuilt;
+    an oid names immutable content, so the cached Commit is still exact.
     """
-    text = payload.decode("utf-8", errors="replace")
+    text = decode_records(payload)
+    if not text:
+        return []
+
+    # Fast path: one split over the whole payload, six fields per record.
+    flat = split_flat_fields(text, _FIELD_COUNT)
+    if flat is None:
+        return _parse_records(text, known)
+
+    fields = iter(flat)
+    rows = zip(fields, fields, fields, fields, fields, fields, strict=True)
+    if not known:
+        # Positional Commit(...) mirrors the field order of the format string.
+        return [
+            Commit(oid, parents.split() if parents else [], name, email, date, subject)
+            for oid, parents, name, email, date, subject in rows
+        ]
+    return [
+        known.get(oid)
+        or Commit(oid, parents.split() if parents else [], name, email, date, subject)
+        for oid, parents, name, email, date, subject in rows
+    ]
+
+
+def _parse_records(text: str, known: Mapping[str, Commit] | None) -> list[Commit]:
+    """Record-by-record fallback for output with missing or extra fields."""
     commits: list[Commit] = []
 
     # Records are separated by ASCII record separator (0x1e).
@@ -20,10 +53,16 @@ def parse_log_records(payload: bytes) -> list[Commit]:
         if not record:
             continue
 
+        if known:
+            cached = known.get(record.split(FIELD_SEP, 1)[0])
+            if cached is not None:
+                commits.append(cached)
+                continue
+
         fields = record.split(FIELD_SEP)
-        if len(fields) < 6:
+        if len(fields) < _FIELD_COUNT:
             # Pad missing fields to keep parsing predictable.
-            fields += [""] * (6 - len(fields))
+            fields += [""] * (_FIELD_COUNT - len(fields))
 
         oid, parents_raw, author_name, author_email, author_date, subject = fields[:6]
         parents = parents_raw.split() if parents_raw else []
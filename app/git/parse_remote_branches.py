@@ -10,25 +10,15 @@ def parse_remote_branches(payload: bytes) -> list[RemoteBranch]:
 
     for line in text.splitlines():
         name = line.strip()
-        if not name:
-            continue
-        if "->" in name:
-            continue
-
-        if "/" not in name:
-            continue
-        remote, branch = name.split("/", 1)
+        # One partition finds the first slash and splits at it; blank and
+        # slash-less lines leave remote or branch empty.
+        remote, _, branch = name.partition("/")
         if not remote or not branch:
             continue
-        if branch == "HEAD":
+        # Symbolic refs (origin/HEAD, "origin/HEAD -> origin/main").
+        if branch == "HEAD" or "->" in name:
             continue
 
-        branches.append(
-            RemoteBranch(
-                remote=remote,
-                name=branch,
-                full_name=name,
-            )
-        )
+        branches.append(RemoteBranch(remote, branch, name))
 
     return branches
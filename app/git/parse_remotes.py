@@ -6,32 +6,48 @@ from app.core.models import Remote
 def parse_remotes(payload: bytes) -> list[Remote]:
     """Parse `git remote -v` output into Remote objects."""
     text = payload.decode("utf-8", errors="replace")
-    remotes: dict[str, Remote] = {}
+    # name -> [fetch_url, push_url]; Remote is frozen, so build each one once
+    # at the end instead of replacing it for every fetch/push line.
+    urls: dict[str, list[str | None]] = {}
 
     for line in text.splitlines():
         if not line.strip():
             continue
 
-        parts = line.split()
-        if len(parts) < 3:
+        fields = _split_remote_line(line)
+        if fields is None:
             continue
 
-        name = parts[0]
-        kind = parts[-1].strip("()").lower()
-        url = " ".join(parts[1:-1])
-
-        current = remotes.get(name)
-        if current is None:
-            current = Remote(name=name, fetch_url=None, push_url=None)
-
+        name, url, kind_raw = fields
+        kind = kind_raw.strip("()").lower()
         if kind == "fetch":
-            current = Remote(name=name, fetch_url=url, push_url=current.push_url)
+            slot = 0
         elif kind == "push":
-            current = Remote(name=name, fetch_url=current.fetch_url, push_url=url)
+            slot = 1
         else:
             # Unknown kind; skip without failing.
             continue
 
-        remotes[name] = current
-
-    return list(remotes.values())
+        urls.setdefault(name, [None, None])[slot] = url
+
+    return [
+        Remote(name, fetch_url, push_url)
+        for name, (fetch_url, push_url) in urls.items()
+    ]
+
+
+def _split_remote_line(line: str) -> tuple[str, str, str] | None:
+    """Return (name, url, "(kind)") from one `git remote -v` line."""
+    # git writes "<name>\t<url> (<kind>)": partition at the tab and the last
+    # space instead of splitting every word, which also keeps runs of spaces
+    # inside a URL (local paths) intact.
+    name, tab, rest = line.partition("\t")
+    url, _, kind = rest.strip().rpartition(" ")
+    if tab and name.strip() and url.strip() and kind:
+        return name.strip(), url.strip(), kind
+
+    # Hand-written or space-separated lines: fall back to word splitting.
+    parts = line.split()
+    if len(parts) < 3:
+        return None
+    return parts[0], " ".join(parts[1:-1]), parts[-1]
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 from app.core.models import StashEntry
+from app.git.parse_utils import FIELD_SEP, RECORD_SEP, decode_records, split_flat_fields
 
-RECORD_SEP = "\x1e"
-FIELD_SEP = "\x1f"
+# oid, selector, summary, date
+_FIELD_COUNT = 4
 
 
 def parse_stash_records(payload: bytes) -> list[StashEntry]:
@@ -12,7 +13,23 @@ def parse_stash_records(payload: bytes) -> list[StashEntry]:
     Expected format per record:
     oid<US>selector<US>summary<US>date<RS>
     """
-    text = payload.decode("utf-8", errors="replace")
+    text = decode_records(payload)
+    if not text:
+        return []
+
+    # Fast path: one split over the whole payload, four fields per record.
+    flat = split_flat_fields(text, _FIELD_COUNT)
+    if flat is not None:
+        fields = iter(flat)
+        # Positional StashEntry(...) mirrors the field order of STASH_FORMAT.
+        return [
+            StashEntry(*row) for row in zip(fields, fields, fields, fields, strict=True)
+        ]
+    return _parse_records(text)
+
+
+def _parse_records(text: str) -> list[StashEntry]:
+    """Record-by-record fallback for output with missing or extra fields."""
     stashes: list[StashEntry] = []
 
     # Records are separated by ASCII record separator (0x1e).
@@ -21,9 +38,9 @@ def parse_stash_records(payload: bytes) -> list[StashEntry]:
             continue
 
         fields = record.split(FIELD_SEP)
-        if len(fields) < 4:
+        if len(fields) < _FIELD_COUNT:
             # Pad missing fields so we always unpack safely.
-            fields += [""] * (4 - len(fields))
+            fields += [""] * (_FIELD_COUNT - len(fields))
 
         oid, selector, summary, date = fields[:4]
         stashes.append(
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from app.core.models import BranchInfo, FileChange, RepoStatus
+from collections.abc import Iterator
+
+from app.core.models import BranchInfo, FileChangeBucket, RepoStatus
+from app.git.parse_utils import parse_uint
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Git Status Porcelain v2 Parser
@@ -25,6 +28,59 @@ from app.core.models import BranchInfo, FileChange, RepoStatus
 # Reference: https://git-scm.com/docs/git-status#_porcelain_format_version_2
 # ─────────────────────────────────────────────────────────────────────────────
 
+# Record types as byte values: indexing bytes yields an int, so records are
+# classified with an integer compare before anything is decoded.
+_HEADER = ord("#")
+_ORDINARY = ord("1")
+_RENAME = ord("2")
+_UNMERGED = ord("u")
+_UNTRACKED = ord("?")
+
+
+# Records are split this many payload bytes at a time: C-speed splitting with
+# only one block's records alive at once, however large the payload.
+_BLOCK_SIZE = 64 * 1024
+
+
+def _iter_records(payload: bytes) -> Iterator[bytes]:
+    """Yield the NUL-separated records of payload, one block at a time."""
+    start = 0
+    end = len(payload)
+    while start < end:
+        # Cut each block at its last NUL so no record straddles two blocks.
+        stop = payload.rfind(b"\x00", start, start + _BLOCK_SIZE)
+        if stop < 0:
+            # A single record longer than a block: take it whole.
+            stop = payload.find(b"\x00", start + _BLOCK_SIZE)
+            if stop < 0:
+                stop = end
+        yield from payload[start:stop].split(b"\x00")
+        start = stop + 1
+
+
+def _decode(raw: bytes) -> str:
+    """Decode one field of a status record."""
+    return raw.decode("utf-8", errors="replace")
+
+
+# Every XY pair git emits, pre-split: the common case is one dict lookup
+# instead of a decode plus two subscripts.
+_XY_CODES: dict[bytes, tuple[str, str]] = {
+    (x + y).encode("ascii"): (x, y) for x in ".MTADRCU?!" for y in ".MTADRCU?!"
+}
+
+
+def _split_xy(xy: bytes) -> tuple[str, str]:
+    """Return (staged, unstaged) status codes from XY."""
+    codes = _XY_CODES.get(xy)
+    if codes is not None:
+        return codes
+    if len(xy) >= 2:
+        codes = _decode(xy)
+        if len(codes) >= 2:
+            return codes[0], codes[1]
+    return ".", "."
+
 
 def parse_status_porcelain_v2(payload: bytes) -> RepoStatus:
     """Parse `git status --porcelain=v2 -b -z` output.
@@ -32,10 +88,10 @@ def parse_status_porcelain_v2(payload: bytes) -> RepoStatus:
     Returns a RepoStatus with grouped lists for staged, unstaged, untracked,
     and conflicted files.
     """
-    staged: list[FileChange] = []
-    unstaged: list[FileChange] = []
-    untracked: list[FileChange] = []
-    conflicted: list[FileChange] = []
+    staged = FileChangeBucket()
+    unstaged = FileChangeBucket()
+    untracked = FileChangeBucket()
+    conflicted = FileChangeBucket()
 
     # Branch metadata (optional; may be absent for some repos).
     branch_name: str | None = None
@@ -45,41 +101,25 @@ def parse_status_porcelain_v2(payload: bytes) -> RepoStatus:
     behind = 0
     branch_seen = False
 
-    def split_xy(xy: str) -> tuple[str, str]:
-        """Return (staged, unstaged) status codes from XY."""
-        if len(xy) >= 2:
-            return xy[0], xy[1]
-        return ".", "."
-
-    def add_by_xy(change: FileChange, xy: str) -> None:
-        """Append a change into staged/unstaged lists based on XY codes."""
-        staged_code, unstaged_code = split_xy(xy)
-        if staged_code != ".":
-            staged.append(change)
-        if unstaged_code != ".":
-            unstaged.append(change)
-
-    # Split by NUL (\x00) since -z flag uses it as separator.
+    # Records are NUL (\x00) terminated since the -z flag uses it as separator.
     # This is safer than newline for filenames with special characters.
-    records = payload.split(b"\x00")
-    i = 0
+    # Records come from _iter_records, so the whole payload is never held as
+    # one list of record copies.
+    records = _iter_records(payload)
 
-    # Process each record. We use index-based iteration because rename/copy
-    # entries consume the next record for the original path.
-    while i < len(records):
-        record = records[i]
+    # Rename/copy entries also consume the next record (orig_path).
+    for record in records:
         if not record:
-            i += 1
             continue
 
-        line = record.decode("utf-8", errors="replace")
+        # First byte identifies the record type.
+        record_type = record[0]
 
         # ───── Branch header lines (start with "# ") ─────
-        if line.startswith("# "):
+        if record_type == _HEADER and record.startswith(b"# "):
             branch_seen = True
-            parts = line.split(" ", 2)
+            parts = _decode(record).split(" ", 2)
             if len(parts) < 3:
-                i += 1
                 continue
 
             key = parts[1]
@@ -96,80 +136,67 @@ def parse_status_porcelain_v2(payload: bytes) -> RepoStatus:
                 # Format: "+<ahead> -<behind>"
                 for token in value.split():
                     if token.startswith("+"):
-                        try:
-                            ahead = int(token[1:])
-                        except ValueError:
-                            ahead = 0
+                        ahead = parse_uint(token[1:])
                     elif token.startswith("-"):
-                        try:
-                            behind = int(token[1:])
-                        except ValueError:
-                            behind = 0
+                        behind = parse_uint(token[1:])
 
-            i += 1
             continue
 
-        # First character identifies the record type.
-        record_type = line[0]
+        # Entry records are split as bytes; only XY and the path get decoded.
+        # (A space byte never occurs inside a UTF-8 sequence, so this matches
+        # splitting the decoded line.)
 
         # ───── Type "1": Ordinary changed entry ─────
         # Format: 1 <XY> <sub> <mH> <mI> <mW> <hH> <hI> <path>
-        if record_type == "1":
-            parts = line.split(" ", 8)
-            xy = parts[1] if len(parts) > 1 else ".."  # XY status codes
-            path = parts[8] if len(parts) > 8 else ""  # File path is last field
-            change = FileChange(
-                path=path,
-                staged_status=split_xy(xy)[0],
-                unstaged_status=split_xy(xy)[1],
-            )
-            add_by_xy(change, xy)
+        if record_type == _ORDINARY:
+            parts = record.split(b" ", 8)
+            xy = parts[1] if len(parts) > 1 else b".."  # XY status codes
+            # File path is the last field.
+            path = _decode(parts[8]) if len(parts) > 8 else ""
+            # XY is split once; each code picks the bucket(s) the row lands in.
+            # Inlined rather than a helper: this runs once per changed file.
+            staged_code, unstaged_code = _split_xy(xy)
+            if staged_code != ".":
+                staged.add(path, staged_code, unstaged_code)
+            if unstaged_code != ".":
+                unstaged.add(path, staged_code, unstaged_code)
 
         # ───── Type "2": Rename/copy entry ─────
         # Format: 2 <XY> <sub> <mH> <mI> <mW> <hH> <hI> <X><score> <path><sep><origPath>
         # The original path is in the NEXT record (separated by NUL).
-        elif record_type == "2":
-            parts = line.split(" ", 9)
-            xy = parts[1] if len(parts) > 1 else ".."
-            path = parts[9] if len(parts) > 9 else ""
+        elif record_type == _RENAME:
+            parts = record.split(b" ", 9)
+            xy = parts[1] if len(parts) > 1 else b".."
+            path = _decode(parts[9]) if len(parts) > 9 else ""
             # Read the original path from the next NUL-separated record.
-            orig_path = None
-            if i + 1 < len(records) and records[i + 1]:
-                orig_path = records[i + 1].decode("utf-8", errors="replace")
-                i += 1  # Skip the orig_path record in the next iteration
-            change = FileChange(
-                path=path,
-                staged_status=split_xy(xy)[0],
-                unstaged_status=split_xy(xy)[1],
-                orig_path=orig_path,
-            )
-            add_by_xy(change, xy)
+            # An empty or missing next record means no orig_path; consuming
+            # an empty record is harmless since it would be skipped anyway.
+            next_record = next(records, None)
+            orig_path = _decode(next_record) if next_record else None
+            staged_code, unstaged_code = _split_xy(xy)
+            if staged_code != ".":
+                staged.add(path, staged_code, unstaged_code, orig_path)
+            if unstaged_code != ".":
+                unstaged.add(path, staged_code, unstaged_code, orig_path)
 
         # ───── Type "u": Unmerged/conflicted entry ─────
         # These appear during merge conflicts. Format has more fields for
         # tracking the three-way merge state (stage 1, 2, 3).
-        elif record_type == "u":
-            parts = line.split(" ", 10)
-            xy = parts[1] if len(parts) > 1 else "UU"  # UU = both modified
-            path = parts[10] if len(parts) > 10 else ""
-            change = FileChange(
-                path=path,
-                staged_status=split_xy(xy)[0],
-                unstaged_status=split_xy(xy)[1],
-            )
-            conflicted.append(change)
+        elif record_type == _UNMERGED:
+            parts = record.split(b" ", 10)
+            xy = parts[1] if len(parts) > 1 else b"UU"  # UU = both modified
+            path = _decode(parts[10]) if len(parts) > 10 else ""
+            conflicted.add(path, *_split_xy(xy))
 
         # ───── Type "?": Untracked file ─────
         # Simple format: just "? <path>" with no status codes.
-        elif record_type == "?":
+        elif record_type == _UNTRACKED:
+            line = _decode(record)
             path = line[2:] if len(line) > 2 else ""  # Skip "? " prefix
-            change = FileChange(path=path, staged_status="?", unstaged_status="?")
-            untracked.append(change)
+            untracked.add(path, "?", "?")
 
         # Ignored files ('!') and unknown records are skipped for now.
 
-        i += 1
-
     branch = None
     if branch_seen or branch_name or branch_oid or branch_upstream or ahead or behind:
         branch = BranchInfo(
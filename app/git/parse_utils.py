@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+# Separators used by the structured --pretty formats (see git_service).
+RECORD_SEP = "\x1e"
+FIELD_SEP = "\x1f"
+
+
+def parse_uint(text: str) -> int:
+    """Return text as a non-negative int, or 0 if it is not plain ASCII digits.
+
+    Checks the digits up front instead of catching ValueError, which costs
+    ~12x more when taken. Stricter than int(): no signs, underscores,
+    whitespace or non-ASCII digits, none of which git writes for counts.
+    """
+    if text.isascii() and text.isdigit():
+        return int(text)
+    return 0
+
+
+def decode_records(payload: bytes) -> str:
+    """Decode RS-terminated `--pretty=format:` output for record parsing.
+
+    git puts a newline between records; it is folded into the separator so
+    the first field of the next record does not start with "\n". The final
+    RS is dropped, so the text splits into exactly one item per record.
+    """
+    text = payload.decode("utf-8", errors="replace")
+    text = text.replace(RECORD_SEP + "\n", RECORD_SEP)
+    if text.endswith(RECORD_SEP):
+        text = text[:-1]
+    return text
+
+
+def split_flat_fields(text: str, field_count: int) -> list[str] | None:
+    """Split decoded records into one flat list of field_count fields each.
+
+    One C-level split over the whole text instead of one per record. Returns
+    None when the total does not add up (truncated or padded output), so the
+    caller can fall back to record-by-record parsing. Only the total is
+    checked: a field that itself contains separators misparses on either
+    path, so a per-record check would cost time without adding safety.
+    """
+    flat = text.replace(RECORD_SEP, FIELD_SEP).split(FIELD_SEP)
+    if len(flat) != field_count * (text.count(RECORD_SEP) + 1):
+        return None
+    return flat
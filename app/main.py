@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import argparse
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 from app.core.controller import RepoController
 from app.exec.command_runner import CommandRunner
@@ -14,7 +15,10 @@ def build_controller() -> tuple[RepoController, CommandRunner]:
     runner = CommandRunner()
     git_runner = GitRunner(runner)
     service = GitService(git_runner)
-    controller = RepoController(service)
+    # Parse status/log/branch/tag output off the UI thread; diffs are not parsed,
+    # only decoded on read. The queue waits for each parse, so one worker is enough.
+    parse_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gitui-parse")
+    controller = RepoController(service, parse_executor=parse_pool)
     return controller, runner
 
 
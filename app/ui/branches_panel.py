@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from PySide6.QtCore import Qt, Signal
+from typing import Any
+
+from PySide6.QtCore import QObject, QStringListModel, Signal
 from PySide6.QtWidgets import (
     QComboBox,
     QGroupBox,
@@ -10,13 +12,29 @@ from PySide6.QtWidgets import (
     QLabel,
     QLineEdit,
     QPushButton,
-    QTreeWidget,
-    QTreeWidgetItem,
+    QTreeView,
     QVBoxLayout,
     QWidget,
 )
 
 from app.core.models import Branch, RemoteBranch
+from app.ui.rows_model import RowsModel
+
+
+def _branch_cells(branch: Branch) -> tuple[str, ...]:
+    """Column texts for one local branch row."""
+    return (
+        ("* " if branch.is_current else "") + branch.name,
+        branch.upstream or "",
+        str(branch.ahead),
+        str(branch.behind),
+        "yes" if branch.gone else "",
+    )
+
+
+def _remote_branch_cells(branch: RemoteBranch) -> tuple[str, ...]:
+    """Column texts for one remote branch row."""
+    return (branch.remote, branch.name)
 
 
 class BranchesPanel(QWidget):
@@ -34,30 +52,44 @@ class BranchesPanel(QWidget):
         self._branches: list[Branch] = []
         self._remote_branches: list[RemoteBranch] = []
         self._remotes: list[str] = []
+        # (remotes, branch names) the upstream combo was last built from.
+        self._upstream_key: tuple[tuple[str, ...], tuple[str, ...]] | None = None
 
-        self._tree = QTreeWidget()
-        self._tree.setHeaderLabels(["Branch", "Upstream", "Ahead", "Behind", "Gone"])
-        self._tree.itemSelectionChanged.connect(self._on_selection_changed)
-
-        self._remote_tree = QTreeWidget()
-        self._remote_tree.setHeaderLabels(["Remote", "Branch"])
-        self._remote_tree.itemSelectionChanged.connect(
+        # Views over models: the panel's branch lists are the backing rows.
+        self._model = RowsModel(
+            ["Branch", "Upstream", "Ahead", "Behind", "Gone"], _branch_cells, self
+        )
+        self._tree = QTreeView()
+        self._tree.setModel(self._model)
+        self._tree.selectionModel().selectionChanged.connect(self._on_selection_changed)
+
+        self._remote_model = RowsModel(["Remote", "Branch"], _remote_branch_cells, self)
+        self._remote_tree = QTreeView()
+        self._remote_tree.setModel(self._remote_model)
+        # Flat, single-line rows: one cached row height, no expand decorations.
+        for tree in (self._tree, self._remote_tree):
+            tree.setUniformRowHeights(True)
+            tree.setRootIsDecorated(False)
+            tree.setItemsExpandable(False)
+        self._remote_tree.selectionModel().selectionChanged.connect(
             self._on_remote_selection_changed
         )
 
-        self._branch_combo = QComboBox()
+        # Combos refilled on every refresh are backed by a QStringListModel, so a
+        # refill is one setStringList (one model reset) instead of clear+insert.
+        self._branch_combo = _list_combo(self)
         self._branch_combo.setToolTip("Select a branch for actions")
 
-        self._start_point_combo = QComboBox()
+        self._start_point_combo = _list_combo(self)
         self._start_point_combo.setToolTip("Start point for new branches")
 
         self._new_branch = QLineEdit()
         self._new_branch.setPlaceholderText("new-branch-name")
 
-        self._upstream_combo = QComboBox()
+        self._upstream_combo = _list_combo(self)
         self._upstream_combo.setToolTip("Upstream (remote/branch)")
 
-        self._remote_branch_combo = QComboBox()
+        self._remote_branch_combo = _list_combo(self)
         self._remote_branch_combo.setToolTip("Select a remote branch to delete")
 
         self._force_delete = QComboBox()
@@ -132,32 +164,25 @@ class BranchesPanel(QWidget):
     def set_branches(self, branches: list[Branch] | None) -> None:
         """Populate the branch list and dropdowns."""
         self._branches = list(branches or [])
-        self._tree.clear()
 
         current_branch = self._branch_combo.currentText()
         current_upstream = self._upstream_combo.currentText()
+        selected = _selected_row(self._tree)
 
-        for branch in self._branches:
-            item = QTreeWidgetItem(
-                [
-                    ("* " if branch.is_current else "") + branch.name,
-                    branch.upstream or "",
-                    str(branch.ahead),
-                    str(branch.behind),
-                    "yes" if branch.gone else "",
-                ]
-            )
-            item.setData(0, Qt.UserRole, branch.name)
-            self._tree.addTopLevelItem(item)
+        self._model.set_rows(self._branches)
 
         branch_names = [b.name for b in self._branches]
-        self._branch_combo.clear()
-        self._branch_combo.addItems(branch_names)
+        # The reset cleared the selection and emitted nothing; re-select the
+        # same branch, which runs the selection handler once.
+        if selected is not None and selected.name in branch_names:
+            self._tree.setCurrentIndex(
+                self._model.index(branch_names.index(selected.name), 0)
+            )
+        _fill_combo(self._branch_combo, branch_names)
         if current_branch in branch_names:
             self._branch_combo.setCurrentText(current_branch)
 
-        self._start_point_combo.clear()
-        self._start_point_combo.addItems(["HEAD", *branch_names])
+        _fill_combo(self._start_point_combo, ["HEAD", *branch_names])
 
         self._rebuild_upstream(branch_names)
         if current_upstream:
@@ -175,49 +200,55 @@ class BranchesPanel(QWidget):
     def set_remote_branches(self, branches: list[RemoteBranch] | None) -> None:
         """Populate the remote branch list and dropdown."""
         self._remote_branches = list(branches or [])
-        self._remote_tree.clear()
 
-        current_remote = self._remote_branch_combo.currentData()
-        self._remote_branch_combo.clear()
+        current_remote = self._remote_branch_combo.currentText()
+        selected = _selected_row(self._remote_tree)
 
-        for branch in self._remote_branches:
-            item = QTreeWidgetItem([branch.remote, branch.name])
-            item.setData(0, Qt.UserRole, (branch.remote, branch.name))
-            self._remote_tree.addTopLevelItem(item)
-            self._remote_branch_combo.addItem(
-                branch.full_name, (branch.remote, branch.name)
-            )
+        self._remote_model.set_rows(self._remote_branches)
+
+        # Entries are in _remote_branches order, so the combo index is the row;
+        # no per-entry (remote, name) item data.
+        combo = self._remote_branch_combo
+        _fill_combo(combo, [branch.full_name for branch in self._remote_branches])
 
         if current_remote:
-            index = self._remote_branch_combo.findData(current_remote)
+            index = combo.findText(current_remote)
             if index >= 0:
-                self._remote_branch_combo.setCurrentIndex(index)
+                combo.setCurrentIndex(index)
+
+        if selected is not None:
+            index = combo.findText(selected.full_name)
+            if index >= 0:
+                self._remote_tree.setCurrentIndex(self._remote_model.index(index, 0))
 
     def _rebuild_upstream(self, branch_names: list[str]) -> None:
         # Build upstream options from remotes + branch names for quick selection.
-        self._upstream_combo.clear()
         remotes = self._remotes or ["origin"]
-        for remote in remotes:
-            for branch in branch_names:
-                self._upstream_combo.addItem(f"{remote}/{branch}")
+        # Refreshes usually repeat the same inputs; skip the remotes x branches
+        # rebuild then (the combo, and its selection, are already right).
+        key = (tuple(remotes), tuple(branch_names))
+        if key == self._upstream_key:
+            return
+        self._upstream_key = key
+        _fill_combo(
+            self._upstream_combo,
+            [f"{remote}/{branch}" for remote in remotes for branch in branch_names],
+        )
 
     def _on_selection_changed(self) -> None:
-        items = self._tree.selectedItems()
-        if not items:
+        rows = self._tree.selectionModel().selectedRows()
+        if not rows:
             return
-        name = items[0].data(0, Qt.UserRole)
+        name = self._model.row_at(rows[0]).name
         if name:
             self._branch_combo.setCurrentText(name)
 
     def _on_remote_selection_changed(self) -> None:
-        items = self._remote_tree.selectedItems()
-        if not items:
+        rows = self._remote_tree.selectionModel().selectedRows()
+        if not rows:
             return
-        data = items[0].data(0, Qt.UserRole)
-        if data:
-            index = self._remote_branch_combo.findData(data)
-            if index >= 0:
-                self._remote_branch_combo.setCurrentIndex(index)
+        # The combo lists the same rows in the same order as the model.
+        self._remote_branch_combo.setCurrentIndex(rows[0].row())
 
     def _emit_switch(self) -> None:
         name = self._branch_combo.currentText()
@@ -244,9 +275,29 @@ class BranchesPanel(QWidget):
             self.set_upstream_requested.emit(upstream, branch)
 
     def _emit_delete_remote(self) -> None:
-        data = self._remote_branch_combo.currentData()
-        if not data:
+        index = self._remote_branch_combo.currentIndex()
+        if not 0 <= index < len(self._remote_branches):
             return
-        remote, name = data
-        if remote and name:
-            self.delete_remote_requested.emit(remote, name)
+        branch = self._remote_branches[index]
+        if branch.remote and branch.name:
+            self.delete_remote_requested.emit(branch.remote, branch.name)
+
+
+def _selected_row(view: QTreeView) -> Any:
+    """Return the row object selected in a RowsModel view, or None."""
+    rows = view.selectionModel().selectedRows()
+    return view.model().row_at(rows[0]) if rows else None
+
+
+def _list_combo(parent: QObject) -> QComboBox:
+    """Return a combo whose entries live in a QStringListModel."""
+    combo = QComboBox()
+    combo.setModel(QStringListModel(parent))
+    return combo
+
+
+def _fill_combo(combo: QComboBox, texts: list[str]) -> None:
+    """Replace a _list_combo's entries with one model reset, without index signals."""
+    combo.blockSignals(True)
+    combo.model().setStringList(texts)
+    combo.blockSignals(False)
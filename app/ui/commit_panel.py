@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from PySide6.QtCore import Signal
+from PySide6.QtCore import QRegularExpression, QTimer, Signal
 from PySide6.QtGui import QTextCursor
 from PySide6.QtWidgets import (
     QCheckBox,
@@ -16,6 +16,17 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+# Quiet period after the last keystroke before the count/button refresh.
+UPDATE_DELAY_MS = 100
+
+# Any non-whitespace character: a message made only of blanks cannot be committed.
+_NON_SPACE = QRegularExpression(r"\S")
+
+_CURSOR_END = QTextCursor.MoveOperation.End
+
+# Template combo entries; index 0 is the "no template" placeholder.
+_TEMPLATES = ("Template...", "feat:", "fix:", "docs:", "refactor:", "test:", "chore:")
+
 
 class CommitPanel(QWidget):
     """Collects commit message input and emits commit intent signals."""
@@ -26,13 +37,17 @@ class CommitPanel(QWidget):
         super().__init__()
         self._message = QPlainTextEdit()
         self._message.setPlaceholderText("Write a commit message...")
-        self._message.textChanged.connect(self._update_state)
+        # Coalesce bursts of keystrokes into one label/button update in
+        # _update_state (each change restarts the timer).
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(UPDATE_DELAY_MS)
+        self._update_timer.timeout.connect(self._update_state)
+        self._message.textChanged.connect(self._update_timer.start)
 
         self._template_combo = QComboBox()
-        self._template_combo.addItems(
-            ["Template...", "feat:", "fix:", "docs:", "refactor:", "test:", "chore:"]
-        )
-        self._template_combo.currentTextChanged.connect(self._apply_template)
+        self._template_combo.addItems(_TEMPLATES)
+        self._template_combo.currentIndexChanged.connect(self._apply_template)
 
         self._amend = QCheckBox("Amend last commit")
         self._count = QLabel("0 chars")
@@ -67,14 +82,14 @@ class CommitPanel(QWidget):
         outer.setContentsMargins(0, 0, 0, 0)
         outer.addWidget(group)
 
-    def _apply_template(self, text: str) -> None:
+    def _apply_template(self, index: int) -> None:
         # Only auto-insert a template if the message is empty.
-        if text == "Template...":
+        if index <= 0:
             return
         if not self._message.toPlainText().strip():
-            self._message.setPlainText(f"{text} ")
+            self._message.setPlainText(f"{_TEMPLATES[index]} ")
             cursor = self._message.textCursor()
-            cursor.movePosition(QTextCursor.End)
+            cursor.movePosition(_CURSOR_END)
             self._message.setTextCursor(cursor)
 
     def _emit_commit(self) -> None:
@@ -84,9 +99,12 @@ class CommitPanel(QWidget):
         self.commit_requested.emit(message, self._amend.isChecked())
 
     def _update_state(self) -> None:
-        message = self._message.toPlainText().strip()
-        self._commit_btn.setEnabled(bool(message))
-        self._count.setText(f"{len(message)} chars")
+        # Ask the document instead of copying its text: characterCount() is
+        # stored (it includes the final paragraph separator) and the search
+        # stops at the first non-blank character.
+        document = self._message.document()
+        self._commit_btn.setEnabled(not document.find(_NON_SPACE).isNull())
+        self._count.setText(f"{document.characterCount() - 1} chars")
 
     def clear(self) -> None:
         """Clear the commit message field after a successful commit."""
@@ -1,17 +1,30 @@
 from __future__ import annotations
 
-from PySide6.QtGui import QTextCursor
 from PySide6.QtWidgets import QPlainTextEdit, QVBoxLayout, QWidget
 
+# Scrollback kept by default. Older lines are dropped as new ones arrive,
+# so long-running commands cannot grow the document without bound.
+MAX_SCROLLBACK_LINES = 10_000
+
+# Bound once; the short PySide6 enum aliases are slow attribute lookups.
+_NO_WRAP = QPlainTextEdit.LineWrapMode.NoWrap
+
+# Scroll positions this close to the maximum still count as "at the end".
+_BOTTOM_SLACK = 4
+
 
 class ConsoleWidget(QWidget):
     """Scrollback console for command output."""
 
-    def __init__(self) -> None:
+    def __init__(self, max_lines: int = MAX_SCROLLBACK_LINES) -> None:
         super().__init__()
         self._view = QPlainTextEdit()
         self._view.setReadOnly(True)
-        self._view.setLineWrapMode(QPlainTextEdit.NoWrap)
+        # Each line is one block; 0 means unlimited.
+        self._view.setMaximumBlockCount(max_lines)
+        # Read-only log: an undo history would only hold memory.
+        self._view.setUndoRedoEnabled(False)
+        self._view.setLineWrapMode(_NO_WRAP)
         # Tag this widget so the theme engine can target console styling.
         self._view.setProperty("consoleWidget", True)
 
@@ -40,10 +53,17 @@ class ConsoleWidget(QWidget):
         text = data.decode("utf-8", errors="replace")
         if not text:
             return
-        for line in text.splitlines():
-            self._append_line(f"[{prefix}] {line}")
+        # One append for the whole chunk: appendPlainText lays out and scrolls
+        # on every call, so a per-line loop costs one pass per line.
+        tag = f"[{prefix}] "
+        self._append_line("\n".join(tag + line for line in text.splitlines()))
 
     def _append_line(self, line: str) -> None:
-        """Append a line and keep the view scrolled to the end."""
+        """Append a line; follow the output only if the view was at the end."""
+        # A reader scrolled up into the history stays where they are. This
+        # replaces moving the text cursor to the end after every append.
+        scrollbar = self._view.verticalScrollBar()
+        at_bottom = scrollbar.value() >= scrollbar.maximum() - _BOTTOM_SLACK
         self._view.appendPlainText(line)
-        self._view.moveCursor(QTextCursor.End)
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
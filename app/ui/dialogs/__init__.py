@@ -1,10 +1,40 @@
-"""Dialog widgets for GitUI."""
+"""Dialog widgets for GitUI.
+
+Names are imported on first access (PEP 562), so importing one dialog module
+does not also load the others, the theme editor in particular.
+"""
 
 from __future__ import annotations
 
-from app.ui.dialogs.confirm_dialog import ConfirmDialog
-from app.ui.dialogs.error_dialog import ErrorDialog
-from app.ui.dialogs.settings_dialog import SettingsDialog
-from app.ui.theme.theme_editor_dialog import ThemeEditorDialog
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from app.ui.dialogs.confirm_dialog import ConfirmDialog
+    from app.ui.dialogs.error_dialog import ErrorDialog
+    from app.ui.dialogs.settings_dialog import SettingsDialog
+    from app.ui.theme.theme_editor_dialog import ThemeEditorDialog
 
 __all__ = ["ConfirmDialog", "ErrorDialog", "SettingsDialog", "ThemeEditorDialog"]
+
+# Public name -> module that defines it.
+_MODULES = {
+    "ConfirmDialog": "app.ui.dialogs.confirm_dialog",
+    "ErrorDialog": "app.ui.dialogs.error_dialog",
+    "SettingsDialog": "app.ui.dialogs.settings_dialog",
+    "ThemeEditorDialog": "app.ui.theme.theme_editor_dialog",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a dialog class on first access and cache it on the package."""
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
@@ -7,12 +7,15 @@ from PySide6.QtWidgets import (
     QDialogButtonBox,
     QLabel,
     QPlainTextEdit,
+    QPushButton,
     QVBoxLayout,
     QWidget,
 )
 
 from app.core.errors import CommandFailed
 
+_NO_WRAP = QPlainTextEdit.LineWrapMode.NoWrap
+
 
 class ErrorDialog(QDialog):
     """Dialog that displays error details in a readable format."""
@@ -28,11 +31,20 @@ class ErrorDialog(QDialog):
         summary.setWordWrap(True)
         layout.addWidget(summary)
 
-        details = QPlainTextEdit()
-        details.setReadOnly(True)
-        details.setLineWrapMode(QPlainTextEdit.NoWrap)
-        details.setPlainText(self._format_details(error))
-        layout.addWidget(details, 1)
+        # Details start collapsed and are formatted on first expand, so the
+        # usual read-the-summary-and-close case never decodes the output.
+        self._error = error
+        self._details_loaded = False
+        self._toggle = QPushButton("Show details")
+        self._toggle.setCheckable(True)
+        self._toggle.toggled.connect(self._set_details_visible)
+        layout.addWidget(self._toggle)
+
+        self._details = QPlainTextEdit()
+        self._details.setReadOnly(True)
+        self._details.setLineWrapMode(_NO_WRAP)
+        self._details.hide()
+        layout.addWidget(self._details, 1)
 
         buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
         buttons.rejected.connect(self.reject)
@@ -44,6 +56,14 @@ class ErrorDialog(QDialog):
         dialog = ErrorDialog(error, parent)
         dialog.exec()
 
+    def _set_details_visible(self, visible: bool) -> None:
+        """Show or hide the details, formatting them the first time."""
+        if visible and not self._details_loaded:
+            self._details.setPlainText(self._format_details(self._error))
+            self._details_loaded = True
+        self._details.setVisible(visible)
+        self._toggle.setText("Hide details" if visible else "Show details")
+
     def _format_details(self, error: Exception) -> str:
         """Format detailed error output for diagnostics."""
         if isinstance(error, CommandFailed):
@@ -4,8 +4,6 @@ from __future__ import annotations
 
 from app.ui.theme.theme_editor_dialog import ThemeEditorDialog
 
-
-class SettingsDialog(ThemeEditorDialog):
-    """Backward-compatible name for the theme editor dialog."""
-
-    pass
+# Backward-compatible name for the theme editor dialog. An alias rather than
+# an empty subclass: no second QDialog type to create and register.
+SettingsDialog = ThemeEditorDialog
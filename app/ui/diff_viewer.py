@@ -1,6 +1,21 @@
 from __future__ import annotations
 
-from PySide6.QtWidgets import QPlainTextEdit, QVBoxLayout, QWidget
+from PySide6.QtCore import QStringListModel, Qt
+from PySide6.QtGui import QAction, QKeySequence
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QApplication,
+    QHeaderView,
+    QPlainTextEdit,
+    QStackedWidget,
+    QTableView,
+    QVBoxLayout,
+    QWidget,
+)
+
+# Diffs with more lines than this go to a line table that lays out only the
+# visible rows; smaller ones keep the text view (free-form selection).
+LARGE_DIFF_LINES = 10_000
 
 
 class DiffViewer(QWidget):
@@ -13,11 +28,82 @@ class DiffViewer(QWidget):
         self._view.setLineWrapMode(QPlainTextEdit.NoWrap)
         # Tag this widget so the theme engine can target diff styling.
         self._view.setProperty("diffViewer", True)
+        # (length, hash) of the text last shown; setPlainText re-lays out every
+        # line even when the text is the same (~0.5 s for a 100k-line diff). A key,
+        # not the text: RepoState keeps the bytes and the view its own copy.
+        self._text_key = (0, hash(""))
+
+        # One row per line in a single column: rows have a fixed height, so the
+        # table only lays out what is on screen (~0.45 s -> ~35 ms at 100k lines).
+        self._lines = QStringListModel(self)
+        self._line_view = QTableView()
+        self._line_view.setModel(self._lines)
+        self._line_view.setProperty("diffViewer", True)
+        self._line_view.horizontalHeader().hide()
+        self._line_view.verticalHeader().hide()
+        self._line_view.verticalHeader().setSectionResizeMode(
+            QHeaderView.ResizeMode.Fixed
+        )
+        self._line_view.setShowGrid(False)
+        self._line_view.setWordWrap(False)
+        self._line_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self._line_view.setSelectionBehavior(
+            QAbstractItemView.SelectionBehavior.SelectRows
+        )
+        self._line_view.setSelectionMode(
+            QAbstractItemView.SelectionMode.ExtendedSelection
+        )
+        self._line_view.setHorizontalScrollMode(
+            QAbstractItemView.ScrollMode.ScrollPerPixel
+        )
+        copy = QAction(self._line_view)
+        copy.setShortcut(QKeySequence.StandardKey.Copy)
+        copy.setShortcutContext(Qt.ShortcutContext.WidgetShortcut)
+        copy.triggered.connect(self._copy_selected_lines)
+        self._line_view.addAction(copy)
+
+        self._stack = QStackedWidget()
+        self._stack.addWidget(self._view)
+        self._stack.addWidget(self._line_view)
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
-        layout.addWidget(self._view)
+        layout.addWidget(self._stack)
 
     def set_diff_text(self, diff_text: str | None) -> None:
         """Update the diff display with the latest text."""
-        self._view.setPlainText(diff_text or "")
+        text = diff_text or ""
+        key = (len(text), hash(text))
+        if key == self._text_key:
+            return
+        self._text_key = key
+        if text.count("\n") < LARGE_DIFF_LINES:
+            self._lines.setStringList([])
+            self._view.setPlainText(text)
+            self._stack.setCurrentWidget(self._view)
+            return
+        self._view.clear()
+        self._show_lines(text.split("\n"))
+        self._stack.setCurrentWidget(self._line_view)
+
+    def _show_lines(self, lines: list[str]) -> None:
+        """Fill the line table and size its single column to the longest line."""
+        view = self._line_view
+        view.ensurePolished()
+        metrics = view.fontMetrics()
+        view.verticalHeader().setDefaultSectionSize(metrics.height() + 2)
+        self._lines.setStringList(lines)
+        if any("\t" in line for line in lines):
+            longest = max(len(line.expandtabs()) for line in lines)
+        else:
+            longest = max(map(len, lines))
+        # The theme uses a monospace font, so width is a multiple of one advance.
+        view.setColumnWidth(0, longest * metrics.horizontalAdvance("M") + 16)
+
+    def _copy_selected_lines(self) -> None:
+        """Copy the selected lines of the line table, in diff order."""
+        rows = sorted(
+            index.row() for index in self._line_view.selectionModel().selectedRows()
+        )
+        lines = self._lines.stringList()
+        QApplication.clipboard().setText("\n".join(lines[row] for row in rows))
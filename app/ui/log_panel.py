@@ -7,13 +7,18 @@ from PySide6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
 
 from app.core.models import Commit
+from app.ui.rows_model import RowsModel
+
+
+def _commit_cells(commit: Commit) -> tuple[str, ...]:
+    """Column texts for one commit row."""
+    return (commit.oid[:8], commit.subject, commit.author_name, commit.author_date)
 
 
 class LogPanel(QWidget):
@@ -23,8 +28,13 @@ class LogPanel(QWidget):
 
     def __init__(self) -> None:
         super().__init__()
-        self._table = QTableWidget(0, 4)
-        self._table.setHorizontalHeaderLabels(["Hash", "Subject", "Author", "Date"])
+        # A view over the commit list: a refresh is one model reset, not an item
+        # per cell, and only the rows on screen are formatted.
+        self._model = RowsModel(
+            ["Hash", "Subject", "Author", "Date"], _commit_cells, self
+        )
+        self._table = QTableView()
+        self._table.setModel(self._model)
         self._table.setSortingEnabled(True)
 
         self._setup_ui()
@@ -42,10 +52,7 @@ class LogPanel(QWidget):
 
     def set_commits(self, commits: list[Commit] | None) -> None:
         """Populate the table with commit metadata."""
-        rows = commits or []
-        self._table.setRowCount(len(rows))
-        for row, commit in enumerate(rows):
-            self._table.setItem(row, 0, QTableWidgetItem(commit.oid[:8]))
-            self._table.setItem(row, 1, QTableWidgetItem(commit.subject))
-            self._table.setItem(row, 2, QTableWidgetItem(commit.author_name))
-            self._table.setItem(row, 3, QTableWidgetItem(commit.author_date))
+        self._model.set_rows(commits or [])
+        # A reset drops the order; sort once by the column the header shows.
+        header = self._table.horizontalHeader()
+        self._model.sort(header.sortIndicatorSection(), header.sortIndicatorOrder())
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QAction, QKeySequence
 from PySide6.QtWidgets import QMainWindow, QSplitter, QTabWidget, QVBoxLayout, QWidget
 
 from app.core.controller import RepoController
 from app.core.errors import CommandFailed
+from app.core.repo_state import StateField
 from app.exec.command_runner import CommandRunner
 from app.git.git_runner import GitRunner
 from app.git.git_service import GitService
@@ -20,6 +23,7 @@ from app.ui.log_panel import LogPanel
 from app.ui.remotes_panel import RemotesPanel
 from app.ui.repo_picker import RepoPicker
 from app.ui.stash_panel import StashPanel
+from app.ui.state_dispatcher import StateDispatcher
 from app.ui.status_panel import StatusPanel
 from app.ui.tags_panel import TagsPanel
 from app.ui.theme.theme_editor_dialog import ThemeEditorDialog
@@ -68,7 +72,10 @@ class MainWindow(QMainWindow):
         runner = CommandRunner()
         git_runner = GitRunner(runner)
         service = GitService(git_runner)
-        controller = RepoController(service)
+        # Parse status/log/branch/tag output off the UI thread; diffs are not parsed,
+        # only decoded on read. The queue waits for each parse, so one worker is enough.
+        parse_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gitui-parse")
+        controller = RepoController(service, parse_executor=parse_pool)
         return controller, runner
 
     def _setup_menu(self) -> None:
@@ -102,12 +109,15 @@ class MainWindow(QMainWindow):
 
         refresh_action = QAction("&Refresh", self)
         refresh_action.setShortcut(QKeySequence.StandardKey.Refresh)
-        refresh_action.triggered.connect(self._controller.refresh_status)
+        refresh_action.triggered.connect(self._controller.refresh_all)
         view_menu.addAction(refresh_action)
 
     def _open_settings(self) -> None:
         """Open the theme editor dialog."""
         dialog = ThemeEditorDialog(self)
+        # Delete on close: a closed editor kept alive by its parent would stay
+        # connected to theme_changed and re-sync on every later theme change.
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
         dialog.exec()
 
     def _setup_layout(self) -> None:
@@ -176,7 +186,10 @@ class MainWindow(QMainWindow):
             self._confirm_delete_remote_branch
         )
 
-        self._log_panel.refresh_requested.connect(self._controller.refresh_log)
+        # The Refresh button always refetches; other paths skip if HEAD is unchanged.
+        self._log_panel.refresh_requested.connect(
+            lambda: self._controller.refresh_log(force=True)
+        )
 
         self._stash_panel.refresh_requested.connect(self._controller.refresh_stashes)
         self._stash_panel.save_requested.connect(self._controller.stash_save)
@@ -195,7 +208,7 @@ class MainWindow(QMainWindow):
         self._remotes_panel.remove_requested.connect(self._controller.remove_remote)
         self._remotes_panel.set_url_requested.connect(self._controller.set_remote_url)
 
-        self._toolbar.refresh_requested.connect(self._controller.refresh_status)
+        self._toolbar.refresh_requested.connect(self._controller.refresh_all)
         self._toolbar.stage_all_requested.connect(self._stage_all)
         self._toolbar.unstage_all_requested.connect(self._unstage_all)
         self._toolbar.discard_all_requested.connect(self._discard_all)
@@ -204,7 +217,10 @@ class MainWindow(QMainWindow):
         self._toolbar.push_requested.connect(self._controller.push)
 
         self._tabs.currentChanged.connect(self._on_tab_changed)
-        self._state.state_changed.connect(self._refresh_from_state)
+        self._sync_subscriptions()
+        # Changes landing in the same event-loop tick refresh the views once.
+        self._dispatcher = StateDispatcher(self._state, self)
+        self._dispatcher.refresh_requested.connect(self._refresh_from_state)
 
         # Log command lifecycle + output so users can see what git did.
         self._runner.command_started.connect(self._on_command_started)
@@ -216,27 +232,37 @@ class MainWindow(QMainWindow):
         )
         self._runner.command_finished.connect(self._on_command_finished)
 
-    def _refresh_from_state(self) -> None:
-        """Update widgets when RepoState changes."""
-        self._repo_picker.set_repo_path(self._state.repo_path)
-        self._status_panel.set_status(self._state.status)
-        self._log_panel.set_commits(list(self._state.log or []))
-        self._branches_panel.set_branches(list(self._state.branches or []))
-        self._branches_panel.set_remote_branches(
-            list(self._state.remote_branches or [])
-        )
-        self._stash_panel.set_stashes(list(self._state.stashes or []))
-        self._tags_panel.set_tags(list(self._state.tags or []))
-        self._remotes_panel.set_remotes(list(self._state.remotes or []))
-        self._diff_viewer.set_diff_text(self._state.diff_text)
-
-        remotes = [remote.name for remote in self._state.remotes or []]
-        self._branches_panel.set_remotes(remotes)
-        self._tags_panel.set_remotes(remotes)
-
-        title_suffix = self._state.repo_path or "(no repo)"
-        self.setWindowTitle(f"GitUI - {title_suffix}")
-
+    def _refresh_from_state(self, fields: int = StateField.ALL) -> None:
+        """Update widgets whose RepoState fields changed (all by default)."""
+        changed = StateField(fields)
+        if changed & StateField.REPO_PATH:
+            self._repo_picker.set_repo_path(self._state.repo_path)
+            title_suffix = self._state.repo_path or "(no repo)"
+            self.setWindowTitle(f"GitUI - {title_suffix}")
+        if changed & StateField.STATUS:
+            self._status_panel.set_status(self._state.status)
+        if changed & StateField.LOG:
+            self._log_panel.set_commits(list(self._state.log or []))
+        if changed & StateField.BRANCHES:
+            self._branches_panel.set_branches(list(self._state.branches or []))
+        if changed & StateField.REMOTE_BRANCHES:
+            self._branches_panel.set_remote_branches(
+                list(self._state.remote_branches or [])
+            )
+        if changed & StateField.STASHES:
+            self._stash_panel.set_stashes(list(self._state.stashes or []))
+        if changed & StateField.TAGS:
+            self._tags_panel.set_tags(list(self._state.tags or []))
+        if changed & StateField.REMOTES:
+            self._remotes_panel.set_remotes(list(self._state.remotes or []))
+            remotes = [remote.name for remote in self._state.remotes or []]
+            self._branches_panel.set_remotes(remotes)
+            self._tags_panel.set_remotes(remotes)
+        if changed & StateField.DIFF:
+            self._diff_viewer.set_diff_text(self._state.diff_text)
+
+        if not changed & StateField.ERROR:
+            return
         if self._state.last_error and self._state.last_error != self._last_error:
             self._console.append_event(f"error: {self._state.last_error}")
             self.statusBar().showMessage(str(self._state.last_error))
@@ -266,10 +292,29 @@ class MainWindow(QMainWindow):
         exit_code = getattr(cmd_result, "exit_code", "?")
         self._console.append_event(f"finish: {command} (exit {exit_code})")
 
+    def _sync_subscriptions(self) -> None:
+        """Only the visible tab's data is refreshed after mutations."""
+        # Branches/remotes also feed combos and the push-upstream prompt, so
+        # they stay subscribed; these topics are only shown in their own tab.
+        current = self._tabs.currentWidget()
+        for panel, topic in (
+            (self._log_panel, "log"),
+            (self._stash_panel, "stashes"),
+            (self._tags_panel, "tags"),
+        ):
+            if panel is current:
+                self._controller.subscribe(topic)
+            else:
+                self._controller.unsubscribe(topic)
+
     def _on_tab_changed(self, index: int) -> None:
         """Refresh data when a tab becomes active."""
+        self._sync_subscriptions()
         widget = self._tabs.widget(index)
         if widget is self._log_panel:
+            # HEAD may have moved outside the app: refresh status first so the
+            # log's unchanged-HEAD skip compares against the current HEAD.
+            self._controller.refresh_status()
             self._controller.refresh_log()
         elif widget is self._branches_panel:
             self._controller.refresh_branches()
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Signal
 from PySide6.QtWidgets import (
     QComboBox,
     QGroupBox,
@@ -91,7 +91,6 @@ class RemotesPanel(QWidget):
             item = QTreeWidgetItem(
                 [remote.name, remote.fetch_url or "", remote.push_url or ""]
             )
-            item.setData(0, Qt.UserRole, remote.name)
             self._tree.addTopLevelItem(item)
             self._remote_combo.addItem(remote.name)
 
@@ -99,7 +98,7 @@ class RemotesPanel(QWidget):
         items = self._tree.selectedItems()
         if not items:
             return
-        name = items[0].data(0, Qt.UserRole)
+        name = items[0].text(0)
         if name:
             self._remote_combo.setCurrentText(name)
 
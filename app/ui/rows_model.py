@@ -0,0 +1,113 @@
+"""Read-only table model over a list of row objects, shared by the list panels."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QObject, Qt
+
+# Invalid index = the (flat) model's root.
+_ROOT = QModelIndex()
+
+# Enum values read on every data() call, bound once: short aliases such as
+# Qt.DisplayRole take microseconds per lookup in PySide6.
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_HORIZONTAL = Qt.Orientation.Horizontal
+_ASCENDING = Qt.SortOrder.AscendingOrder
+_DESCENDING = Qt.SortOrder.DescendingOrder
+
+
+class RowsModel(QAbstractTableModel):
+    """Read-only table over a list of rows; cells(row) gives one text per column.
+
+    The view asks only for the rows it paints, and a refresh is one model
+    reset instead of one item object per cell. Each row is formatted once,
+    on first paint (or sort), and reused until the next reset.
+    """
+
+    def __init__(
+        self,
+        headers: list[str],
+        cells: Callable[[Any], tuple[str, ...]],
+        parent: QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self._headers = headers
+        self._cells = cells
+        self._rows: Sequence[Any] = []
+        # Row number -> formatted cells; data() runs per column on every paint.
+        self._texts: dict[int, tuple[str, ...]] = {}
+
+    def set_rows(self, rows: Sequence[Any]) -> None:
+        """Replace every row with a single model reset."""
+        self.beginResetModel()
+        self._rows = rows
+        self._texts = {}
+        self.endResetModel()
+
+    def row_at(self, index: QModelIndex) -> Any:
+        """Return the row object behind index."""
+        return self._rows[index.row()]
+
+    def rowCount(self, parent: QModelIndex = _ROOT) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = _ROOT) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index: QModelIndex, role: int = _DISPLAY_ROLE) -> Any:
+        if role != _DISPLAY_ROLE or not index.isValid():
+            return None
+        row = index.row()
+        texts = self._texts.get(row)
+        if texts is None:
+            texts = self._texts[row] = self._cells(self._rows[row])
+        return texts[index.column()]
+
+    def headerData(
+        self, section: int, orientation: Qt.Orientation, role: int = _DISPLAY_ROLE
+    ) -> Any:
+        if role == _DISPLAY_ROLE and orientation == _HORIZONTAL:
+            return self._headers[section]
+        return None
+
+    def sort(self, column: int, order: Qt.SortOrder = _ASCENDING) -> None:
+        """Reorder rows by the text in column (stable), keeping persistent indexes.
+
+        One Python sort over the cached texts; a sort proxy would instead call
+        data() twice per comparison.
+        """
+        if not 0 <= column < len(self._headers):
+            return
+        self.layoutAboutToBeChanged.emit()
+        texts = [self._row_texts(row) for row in range(len(self._rows))]
+        ordered = sorted(
+            range(len(texts)),
+            key=lambda row: texts[row][column],
+            reverse=order == _DESCENDING,
+        )
+        self._rows = [self._rows[row] for row in ordered]
+        self._texts = {new: texts[old] for new, old in enumerate(ordered)}
+
+        # Selection and current index are persistent indexes: move them along.
+        persistent = self.persistentIndexList()
+        if persistent:
+            moved_to = [0] * len(ordered)
+            for new, old in enumerate(ordered):
+                moved_to[old] = new
+            self.changePersistentIndexList(
+                persistent,
+                [
+                    self.index(moved_to[index.row()], index.column())
+                    for index in persistent
+                ],
+            )
+        self.layoutChanged.emit()
+
+    def _row_texts(self, row: int) -> tuple[str, ...]:
+        """Return the cached cell texts for row, formatting it on first use."""
+        texts = self._texts.get(row)
+        if texts is None:
+            texts = self._texts[row] = self._cells(self._rows[row])
+        return texts
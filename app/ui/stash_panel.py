@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Signal
 from PySide6.QtWidgets import (
     QCheckBox,
     QComboBox,
@@ -93,7 +93,6 @@ class StashPanel(QWidget):
         self._stash_combo.addItem("Latest", None)
         for stash in stashes or []:
             item = QTreeWidgetItem([stash.selector, stash.summary, stash.date])
-            item.setData(0, Qt.UserRole, stash.selector)
             self._tree.addTopLevelItem(item)
             self._stash_combo.addItem(stash.selector, stash.selector)
 
@@ -101,7 +100,7 @@ class StashPanel(QWidget):
         items = self._tree.selectedItems()
         if not items:
             return
-        ref = items[0].data(0, Qt.UserRole)
+        ref = items[0].text(0)
         if ref:
             self._stash_combo.setCurrentText(ref)
 
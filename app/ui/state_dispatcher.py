@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from app.core.repo_state import RepoState, StateField
+
+
+class StateDispatcher(QObject):
+    """Coalesces RepoState change masks into one refresh per event-loop tick."""
+
+    # OR of every StateField mask seen since the last flush.
+    refresh_requested = Signal(int)
+
+    def __init__(self, state: RepoState, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._pending = StateField.NONE
+        state.state_changed_fields.connect(self._on_fields_changed)
+
+    def _on_fields_changed(self, fields: int) -> None:
+        """Accumulate a change mask; schedule a flush on the first one."""
+        if not self._pending:
+            QTimer.singleShot(0, self.flush)
+        self._pending |= fields
+
+    def flush(self) -> None:
+        """Emit the accumulated mask now (no-op when nothing is pending)."""
+        if not self._pending:
+            return
+        fields, self._pending = self._pending, StateField.NONE
+        self.refresh_requested.emit(int(fields))
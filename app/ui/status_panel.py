@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
+
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QGroupBox,
     QListWidget,
-    QListWidgetItem,
     QMenu,
     QVBoxLayout,
     QWidget,
@@ -104,7 +105,7 @@ class StatusPanel(QWidget):
         """Extract selected file paths from a list widget."""
         paths: list[str] = []
         for item in widget.selectedItems():
-            path = item.data(Qt.UserRole)
+            path = item.text()
             if path:
                 paths.append(path)
         return paths
@@ -145,13 +146,10 @@ class StatusPanel(QWidget):
         elif action == diff_action:
             self.diff_requested.emit(paths[0], status == "staged")
 
-    def _populate(self, list_widget: QListWidget, items: list[FileChange]) -> None:
-        """Fill a list widget with file paths, storing path in item data."""
+    def _populate(self, list_widget: QListWidget, items: Sequence[FileChange]) -> None:
+        """Fill a list widget with file paths; each item's text is its path."""
         list_widget.clear()
-        for change in items:
-            item = QListWidgetItem(change.path)
-            item.setData(Qt.UserRole, change.path)
-            list_widget.addItem(item)
+        list_widget.addItems([change.path for change in items])
 
     def _clear_all(self) -> None:
         """Clear all list widgets when no status is available."""
@@ -186,6 +184,6 @@ class StatusPanel(QWidget):
             return
 
         item = source.selectedItems()[0]
-        path = item.data(Qt.UserRole)
+        path = item.text()
         if path:
             self.diff_requested.emit(path, staged)
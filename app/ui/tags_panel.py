@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Signal
 from PySide6.QtWidgets import (
     QComboBox,
     QGroupBox,
@@ -100,7 +100,6 @@ class TagsPanel(QWidget):
         self._tag_combo.clear()
         for tag in tags or []:
             item = QTreeWidgetItem([tag.name])
-            item.setData(0, Qt.UserRole, tag.name)
             self._tree.addTopLevelItem(item)
             self._tag_combo.addItem(tag.name)
 
@@ -113,7 +112,7 @@ class TagsPanel(QWidget):
         items = self._tree.selectedItems()
         if not items:
             return
-        name = items[0].data(0, Qt.UserRole)
+        name = items[0].text(0)
         if name:
             self._tag_combo.setCurrentText(name)
 
@@ -31,6 +31,9 @@ class ColorPickerButton(QPushButton):
 
     @color.setter
     def color(self, value: str) -> None:
+        # Restyling parses the color and re-polishes the button: skip no-ops.
+        if value == self._color:
+            return
         self._color = value
         self._update_style()
 
@@ -64,10 +67,11 @@ class ColorPickerButton(QPushButton):
         if color.isValid():
             if self._allow_alpha:
                 alpha = color.alphaF()
-                self._color = (
+                value = (
                     f"rgba({color.red()}, {color.green()}, {color.blue()}, {alpha:.2f})"
                 )
             else:
-                self._color = color.name()
-            self._update_style()
-            self.color_changed.emit(self._color)
+                value = color.name()
+            if value != self._color:
+                self.color = value
+                self.color_changed.emit(value)
@@ -2,16 +2,18 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from functools import cache, partial
 from pathlib import Path
+from typing import Any
 
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont
+from PySide6.QtCore import QSignalBlocker, QStringListModel, Qt, QTimer
+from PySide6.QtGui import QFont, QFontDatabase, QFontInfo
 from PySide6.QtWidgets import (
     QCheckBox,
     QComboBox,
     QDialog,
     QFileDialog,
-    QFontComboBox,
     QFormLayout,
     QGroupBox,
     QHBoxLayout,
@@ -29,9 +31,29 @@ from PySide6.QtWidgets import (
 )
 
 from .theme_controls import ColorPickerButton
-from .theme_engine import PRESETS, ThemeEngine, get_engine
+from .theme_engine import PRESETS, ThemeEngine, ThemeState, get_engine
 from .theme_preview import ThemePreview
 
+# Quiet period after the last control edit before the theme is saved and the
+# QSS views are regenerated (spin box drags fire many edits per second).
+SAVE_DELAY_MS = 100
+
+_font_model: QStringListModel | None = None
+
+
+def _font_families_model() -> QStringListModel:
+    """Return the font family list shared by every font picker, built once."""
+    global _font_model
+    if _font_model is None:
+        _font_model = QStringListModel(
+            [
+                f
+                for f in QFontDatabase.families()
+                if not QFontDatabase.isPrivateFamily(f)
+            ]
+        )
+    return _font_model
+
 
 class ThemeEditorDialog(QDialog):
     """Theme editor with presets, live preview, and import/export tools."""
@@ -42,12 +64,25 @@ class ThemeEditorDialog(QDialog):
         self.setMinimumSize(1100, 720)
 
         self._engine: ThemeEngine = get_engine()
-        self._updating_controls = False
 
         self._color_controls: dict[str, ColorPickerButton] = {}
         self._metric_controls: dict[str, QSpinBox] = {}
         self._effect_controls: dict[str, QWidget] = {}
-        self._font_controls: dict[str, QWidget] = {}
+        self._font_controls: dict[str, QComboBox] = {}
+        # Set when the Import/Export tab is first shown.
+        self._export_preview: QPlainTextEdit | None = None
+        # Tab index -> builder for tabs not shown yet (see _ensure_tab).
+        self._tab_builders: dict[int, Callable[[], QWidget]] = {}
+        # Engine state_key() the dialog last synced to; True while an edit made
+        # in this dialog is being passed to the engine.
+        self._synced_key: tuple[Any, ...] | None = None
+        self._editing = False
+
+        # Restarted on every control edit; runs _flush_changes once edits stop.
+        self._dirty_timer = QTimer(self)
+        self._dirty_timer.setSingleShot(True)
+        self._dirty_timer.setInterval(SAVE_DELAY_MS)
+        self._dirty_timer.timeout.connect(self._flush_changes)
 
         self._setup_ui()
         self._sync_from_engine()
@@ -56,9 +91,22 @@ class ThemeEditorDialog(QDialog):
         self._engine.theme_changed.connect(self._sync_from_engine)
 
     def closeEvent(self, event) -> None:  # type: ignore[override]
+        self._finish_editing()
+        super().closeEvent(event)
+
+    def done(self, result: int) -> None:
+        # Escape and the window buttons end here without a closeEvent.
+        self._finish_editing()
+        super().done(result)
+
+    def _finish_editing(self) -> None:
+        """Save a pending edit and restore live application before the dialog goes."""
+        # Save an edit still waiting on the timer before the dialog goes away.
+        if self._dirty_timer.isActive():
+            self._dirty_timer.stop()
+            self._flush_changes()
         # Re-enable live application so the app doesn't get stuck in preview-only mode.
         self._engine.set_apply_enabled(True)
-        super().closeEvent(event)
 
     def _setup_ui(self) -> None:
         """Build the dialog layout and editor tabs."""
@@ -123,14 +171,30 @@ class ThemeEditorDialog(QDialog):
         return bar
 
     def _build_editor_tabs(self) -> QWidget:
-        """Create the tabbed editor area."""
-        tabs = QTabWidget()
-        tabs.addTab(self._build_colors_tab(), "Colors")
-        tabs.addTab(self._build_fonts_tab(), "Fonts")
-        tabs.addTab(self._build_metrics_tab(), "Metrics")
-        tabs.addTab(self._build_effects_tab(), "Effects")
-        tabs.addTab(self._build_import_export_tab(), "Import/Export")
-        return tabs
+        """Create the tabbed editor area; each tab is built when first shown."""
+        self._tabs = QTabWidget()
+        for title, builder in (
+            ("Colors", self._build_colors_tab),
+            ("Fonts", self._build_fonts_tab),
+            ("Metrics", self._build_metrics_tab),
+            ("Effects", self._build_effects_tab),
+            ("Import/Export", self._build_import_export_tab),
+        ):
+            page = QWidget()
+            QVBoxLayout(page).setContentsMargins(0, 0, 0, 0)
+            self._tab_builders[self._tabs.addTab(page, title)] = builder
+        self._tabs.currentChanged.connect(self._ensure_tab)
+        self._ensure_tab(self._tabs.currentIndex())
+        return self._tabs
+
+    def _ensure_tab(self, index: int) -> None:
+        """Build the tab at index into its placeholder page on first view."""
+        builder = self._tab_builders.pop(index, None)
+        if builder is None:
+            return
+        self._tabs.widget(index).layout().addWidget(builder())
+        # The new controls start at their defaults; load the engine values.
+        self._sync_controls(self._engine.get_state())
 
     def _build_colors_tab(self) -> QWidget:
         scroll = QScrollArea()
@@ -154,9 +218,7 @@ class ThemeEditorDialog(QDialog):
             group_layout = QFormLayout(group)
             for key in keys:
                 btn = ColorPickerButton()
-                btn.color_changed.connect(
-                    lambda value, name=key: self._on_color_changed(name, value)
-                )
+                btn.color_changed.connect(partial(self._on_color_changed, key))
                 self._color_controls[key] = btn
                 group_layout.addRow(QLabel(self._labelize(key)), btn)
             layout.addWidget(group)
@@ -172,19 +234,17 @@ class ThemeEditorDialog(QDialog):
         families = self._make_editor_group("Font Families")
         families_layout = QFormLayout(families)
 
-        font_family = QFontComboBox()
-        font_family.currentFontChanged.connect(
-            lambda font: self._on_metric_changed("font_family", font.family())
-        )
-        families_layout.addRow("UI Font", font_family)
-        self._font_controls["font_family"] = font_family
-
-        font_mono = QFontComboBox()
-        font_mono.currentFontChanged.connect(
-            lambda font: self._on_metric_changed("font_family_mono", font.family())
-        )
-        families_layout.addRow("Mono Font", font_mono)
-        self._font_controls["font_family_mono"] = font_mono
+        # Plain combos over one shared family list: each QFontComboBox would
+        # enumerate the font database again when it is built.
+        for key, label in [
+            ("font_family", "UI Font"),
+            ("font_family_mono", "Mono Font"),
+        ]:
+            combo = QComboBox()
+            combo.setModel(_font_families_model())
+            combo.currentTextChanged.connect(partial(self._on_metric_changed, key))
+            families_layout.addRow(label, combo)
+            self._font_controls[key] = combo
 
         sizes = self._make_editor_group("Font Sizes")
         sizes_layout = QFormLayout(sizes)
@@ -197,9 +257,7 @@ class ThemeEditorDialog(QDialog):
             ("font_size_h3", "Heading 3", 10, 28),
         ]:
             spin = self._make_spinbox(minimum, maximum)
-            spin.valueChanged.connect(
-                lambda value, name=key: self._on_metric_changed(name, value)
-            )
+            spin.valueChanged.connect(partial(self._on_metric_changed, key))
             self._metric_controls[key] = spin
             sizes_layout.addRow(label, spin)
 
@@ -224,9 +282,7 @@ class ThemeEditorDialog(QDialog):
             ("border_width_focus", "Focus Width", 0, 6),
         ]:
             spin = self._make_spinbox(minimum, maximum)
-            spin.valueChanged.connect(
-                lambda value, name=key: self._on_metric_changed(name, value)
-            )
+            spin.valueChanged.connect(partial(self._on_metric_changed, key))
             self._metric_controls[key] = spin
             border_layout.addRow(label, spin)
 
@@ -240,9 +296,7 @@ class ThemeEditorDialog(QDialog):
             ("margin", "Margin", 0, 20),
         ]:
             spin = self._make_spinbox(minimum, maximum)
-            spin.valueChanged.connect(
-                lambda value, name=key: self._on_metric_changed(name, value)
-            )
+            spin.valueChanged.connect(partial(self._on_metric_changed, key))
             self._metric_controls[key] = spin
             spacing_layout.addRow(label, spin)
 
@@ -255,9 +309,7 @@ class ThemeEditorDialog(QDialog):
             ("scrollbar_width", "Scrollbar Width", 6, 20),
         ]:
             spin = self._make_spinbox(minimum, maximum)
-            spin.valueChanged.connect(
-                lambda value, name=key: self._on_metric_changed(name, value)
-            )
+            spin.valueChanged.connect(partial(self._on_metric_changed, key))
             self._metric_controls[key] = spin
             widgets_layout.addRow(label, spin)
 
@@ -277,7 +329,7 @@ class ThemeEditorDialog(QDialog):
 
         shadow_enabled = QCheckBox("Enable")
         shadow_enabled.toggled.connect(
-            lambda value, name="shadow_enabled": self._on_effect_changed(name, value)
+            partial(self._on_effect_changed, "shadow_enabled")
         )
         shadow_layout.addRow("Enabled", shadow_enabled)
         self._effect_controls["shadow_enabled"] = shadow_enabled
@@ -289,15 +341,13 @@ class ThemeEditorDialog(QDialog):
             ("shadow_spread", "Spread", -10, 20),
         ]:
             spin = self._make_spinbox(minimum, maximum)
-            spin.valueChanged.connect(
-                lambda value, name=key: self._on_effect_changed(name, value)
-            )
+            spin.valueChanged.connect(partial(self._on_effect_changed, key))
             self._effect_controls[key] = spin
             shadow_layout.addRow(label, spin)
 
         shadow_color = ColorPickerButton(allow_alpha=True)
         shadow_color.color_changed.connect(
-            lambda value, name="shadow_color": self._on_effect_changed(name, value)
+            partial(self._on_effect_changed, "shadow_color")
         )
         self._effect_controls["shadow_color"] = shadow_color
         shadow_layout.addRow("Shadow Color", shadow_color)
@@ -306,9 +356,7 @@ class ThemeEditorDialog(QDialog):
         transitions_layout = QFormLayout(transitions)
         duration = self._make_spinbox(0, 1000)
         duration.valueChanged.connect(
-            lambda value, name="transition_duration": self._on_effect_changed(
-                name, value
-            )
+            partial(self._on_effect_changed, "transition_duration")
         )
         transitions_layout.addRow("Duration (ms)", duration)
         self._effect_controls["transition_duration"] = duration
@@ -316,7 +364,7 @@ class ThemeEditorDialog(QDialog):
         timing = QComboBox()
         timing.addItems(["ease", "ease-in", "ease-out", "linear"])
         timing.currentTextChanged.connect(
-            lambda value, name="transition_timing": self._on_effect_changed(name, value)
+            partial(self._on_effect_changed, "transition_timing")
         )
         transitions_layout.addRow("Timing", timing)
         self._effect_controls["transition_timing"] = timing
@@ -324,16 +372,12 @@ class ThemeEditorDialog(QDialog):
         hover = self._make_editor_group("Hover")
         hover_layout = QFormLayout(hover)
         brighten = QCheckBox("Brighten")
-        brighten.toggled.connect(
-            lambda value, name="hover_brighten": self._on_effect_changed(name, value)
-        )
+        brighten.toggled.connect(partial(self._on_effect_changed, "hover_brighten"))
         hover_layout.addRow("Brighten", brighten)
         self._effect_controls["hover_brighten"] = brighten
 
         scale = QCheckBox("Scale")
-        scale.toggled.connect(
-            lambda value, name="hover_scale": self._on_effect_changed(name, value)
-        )
+        scale.toggled.connect(partial(self._on_effect_changed, "hover_scale"))
         hover_layout.addRow("Scale", scale)
         self._effect_controls["hover_scale"] = scale
 
@@ -388,7 +432,7 @@ class ThemeEditorDialog(QDialog):
         apply_json_btn.clicked.connect(self._apply_pasted_json)
         json_btn_layout.addWidget(apply_json_btn)
         clear_json_btn = QPushButton("Clear")
-        clear_json_btn.clicked.connect(lambda: self._json_paste_input.clear())
+        clear_json_btn.clicked.connect(self._json_paste_input.clear)
         json_btn_layout.addWidget(clear_json_btn)
         json_btn_layout.addStretch()
         json_paste_layout.addLayout(json_btn_layout)
@@ -416,7 +460,7 @@ class ThemeEditorDialog(QDialog):
         save_qss_preset_btn.clicked.connect(self._save_qss_as_preset)
         qss_btn_layout.addWidget(save_qss_preset_btn)
         clear_qss_btn = QPushButton("Clear")
-        clear_qss_btn.clicked.connect(lambda: self._qss_paste_input.clear())
+        clear_qss_btn.clicked.connect(self._qss_paste_input.clear)
         qss_btn_layout.addWidget(clear_qss_btn)
         qss_btn_layout.addStretch()
         qss_paste_layout.addLayout(qss_btn_layout)
@@ -428,6 +472,7 @@ class ThemeEditorDialog(QDialog):
         self._export_preview = QPlainTextEdit()
         self._export_preview.setReadOnly(True)
         self._export_preview.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self._export_preview.setPlainText(self._engine.generate_stylesheet())
         preview_layout.addWidget(self._export_preview)
         layout.addWidget(preview, 1)
         return widget
@@ -459,41 +504,68 @@ class ThemeEditorDialog(QDialog):
         spin.setRange(minimum, maximum)
         return spin
 
-    def _labelize(self, name: str) -> str:
+    @staticmethod
+    @cache
+    def _labelize(name: str) -> str:
+        # Keys are the fixed ThemeColors fields, so reopening the dialog reuses labels.
         return name.replace("_", " ").title()
 
     def _toggle_live_preview(self, enabled: bool) -> None:
         # When live preview is off, we style only the preview panel.
         self._engine.set_apply_enabled(enabled)
         if not enabled:
-            self._preview.setStyleSheet(self._engine.generate_stylesheet())
+            self._set_preview_stylesheet(self._engine.generate_stylesheet())
         else:
-            self._preview.setStyleSheet("")
+            self._set_preview_stylesheet("")
 
     def _on_preset_selected(self, name: str) -> None:
-        if self._updating_controls:
-            return
         self._engine.apply_theme(name, save=True)
         self._engine.save_current()
         self._refresh_preset_combo()
 
     def _on_color_changed(self, name: str, value: str) -> None:
-        if self._updating_controls:
-            return
-        self._engine.set_color(name, value)
-        self._engine.save_current()
+        self._apply_edit(self._engine.set_color, name, value)
 
     def _on_metric_changed(self, name: str, value: int | str) -> None:
-        if self._updating_controls:
-            return
-        self._engine.set_metric(name, value)
-        self._engine.save_current()
+        self._apply_edit(self._engine.set_metric, name, value)
 
     def _on_effect_changed(self, name: str, value: object) -> None:
-        if self._updating_controls:
-            return
-        self._engine.set_effect(name, value)
+        self._apply_edit(self._engine.set_effect, name, value)
+
+    def _apply_edit(
+        self, setter: Callable[[str, Any], None], name: str, value: Any
+    ) -> None:
+        """Pass one control edit to the engine and schedule the save."""
+        # Start the timer first: the setter syncs the dialog synchronously and
+        # that sync leaves the QSS views to the pending flush.
+        self._dirty_timer.start()
+        self._editing = True
+        try:
+            setter(name, value)
+        finally:
+            self._editing = False
+
+    def _flush_changes(self) -> None:
+        """Save the theme and regenerate the QSS views after a burst of edits."""
         self._engine.save_current()
+        self._refresh_stylesheet_views()
+
+    def _refresh_stylesheet_views(self) -> None:
+        """Show the generated QSS in the export preview (and the preview panel)."""
+        css = self._engine.generate_stylesheet()
+        # Re-setting identical text would still rebuild the read-only document.
+        preview = self._export_preview
+        if preview is not None and preview.toPlainText() != css:
+            preview.setPlainText(css)
+        if not self._live_preview.isChecked():
+            self._set_preview_stylesheet(css)
+
+    def _set_preview_stylesheet(self, css: str) -> None:
+        """Style the preview panel unless it already has exactly this sheet."""
+        # setStyleSheet re-polishes the whole gallery even for the same text
+        # (~15 ms); the comparison costs microseconds.
+        if self._preview.styleSheet() != css:
+            self._preview.setStyleSheet(css)
 
     def _save_preset(self) -> None:
         name, ok = QInputDialog.getText(self, "Save Preset", "Preset name:")
@@ -637,25 +709,52 @@ class ThemeEditorDialog(QDialog):
 
     def _sync_from_engine(self) -> None:
         """Refresh control values from the ThemeEngine state."""
-        self._updating_controls = True
-        try:
-            state = self._engine.get_state()
+        self._undo_btn.setEnabled(self._engine.can_undo())
+        self._redo_btn.setEnabled(self._engine.can_redo())
 
-            for name, btn in self._color_controls.items():
-                btn.color = getattr(state.colors, name, btn.color)
+        # theme_changed also fires when nothing changed (e.g. an equal state).
+        key = self._engine.state_key()
+        if key == self._synced_key:
+            return
+        self._synced_key = key
 
-            for name, spin in self._metric_controls.items():
-                if hasattr(state.metrics, name):
-                    spin.setValue(int(getattr(state.metrics, name)))
+        state = self._engine.get_state()
+        # An edit made here already shows in its control, and it cannot rename
+        # the theme or change the preset list.
+        if not self._editing:
+            self._sync_controls(state)
+            self._refresh_preset_combo()
+        self._preview.apply_effects(state.effects)
 
-            for name, control in self._font_controls.items():
-                if name == "font_family":
-                    control.setCurrentFont(QFont(state.metrics.font_family))
-                if name == "font_family_mono":
-                    control.setCurrentFont(QFont(state.metrics.font_family_mono))
+        # A control edit is pending: _flush_changes regenerates the QSS once.
+        if not self._dirty_timer.isActive():
+            self._refresh_stylesheet_views()
 
-            for name, control in self._effect_controls.items():
-                value = getattr(state.effects, name, None)
+    def _sync_controls(self, state: ThemeState) -> None:
+        """Set the built editor controls to the values in state.
+
+        Each write runs with the control's signals blocked, so the sync does
+        not call back into the _on_*_changed slots.
+        """
+        for name, btn in self._color_controls.items():
+            btn.color = getattr(state.colors, name, btn.color)
+
+        for name, spin in self._metric_controls.items():
+            if hasattr(state.metrics, name):
+                with QSignalBlocker(spin):
+                    spin.setValue(int(getattr(state.metrics, name)))
+
+        for name, combo in self._font_controls.items():
+            # Show the installed family the stored font list resolves to.
+            family = QFontInfo(QFont(getattr(state.metrics, name))).family()
+            index = combo.findText(family)
+            if index >= 0:
+                with QSignalBlocker(combo):
+                    combo.setCurrentIndex(index)
+
+        for name, control in self._effect_controls.items():
+            value = getattr(state.effects, name, None)
+            with QSignalBlocker(control):
                 if isinstance(control, QCheckBox):
                     control.setChecked(bool(value))
                 elif isinstance(control, QSpinBox):
@@ -664,14 +763,3 @@ class ThemeEditorDialog(QDialog):
                     control.setCurrentText(value)
                 elif isinstance(control, ColorPickerButton) and isinstance(value, str):
                     control.color = value
-
-            self._refresh_preset_combo()
-            self._export_preview.setPlainText(self._engine.generate_stylesheet())
-            self._undo_btn.setEnabled(self._engine.can_undo())
-            self._redo_btn.setEnabled(self._engine.can_redo())
-            self._preview.apply_effects(state.effects)
-
-            if not self._live_preview.isChecked():
-                self._preview.setStyleSheet(self._engine.generate_stylesheet())
-        finally:
-            self._updating_controls = False
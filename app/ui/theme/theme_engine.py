@@ -598,6 +598,8 @@ class ThemeEngine(QObject):
         self._settings = QSettings("GitUI", "Theme")
         self._suppress_signals = False
         self._apply_enabled = True
+        # Last generated stylesheet, keyed by the state values it was built from.
+        self._qss_cache: tuple[tuple[Any, ...], str] | None = None
 
     # ─────────────────────────────────────────────────────────────────────
     # Properties
@@ -873,6 +875,20 @@ class ThemeEngine(QObject):
         """Get a copy of the current theme state."""
         return self._state.copy()
 
+    def state_key(self) -> tuple[Any, ...]:
+        """Return a hashable snapshot of the theme name and every value.
+
+        Built from the values themselves, so direct edits to the state objects
+        (engine.colors.accent = ...) change it too.
+        """
+        state = self._state
+        return (
+            state.name,
+            tuple(vars(state.colors).values()),
+            tuple(vars(state.metrics).values()),
+            tuple(vars(state.effects).values()),
+        )
+
     def set_state(self, state: ThemeState, record_undo: bool = True) -> None:
         """Set the complete theme state."""
         if record_undo:
@@ -1020,7 +1036,20 @@ class ThemeEngine(QObject):
     # ─────────────────────────────────────────────────────────────────────
 
     def generate_stylesheet(self) -> str:
-        """Generate complete Qt stylesheet from current theme."""
+        """Generate complete Qt stylesheet from current theme.
+
+        The result is reused until state_key() changes.
+        """
+        key = self.state_key()
+        cached = self._qss_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        css = self._build_stylesheet()
+        self._qss_cache = (key, css)
+        return css
+
+    def _build_stylesheet(self) -> str:
+        """Build the Qt stylesheet text for the current theme."""
         c = self._state.colors
         m = self._state.metrics
         e = self._state.effects
@@ -1664,8 +1693,9 @@ QListWidget[gitStatus="conflicted"]::item {{
     border-left: 3px solid {c.error};
 }}
 
-/* Diff viewer */
-QPlainTextEdit[diffViewer="true"] {{
+/* Diff viewer (text view, and the line table used for large diffs) */
+QPlainTextEdit[diffViewer="true"],
+QTableView[diffViewer="true"] {{
     font-family: {m.font_family_mono};
     font-size: {m.font_size}px;
     background-color: {c.background};
@@ -4,7 +4,7 @@ import os
 from collections.abc import Callable
 
 
-def _build_fallback() -> tuple[type, type, type]:
+def _build_fallback() -> tuple[type, type, type, type]:
     """Return minimal Qt stand-ins for test environments without PySide6."""
 
     class QObject:
@@ -56,7 +56,28 @@ def _build_fallback() -> tuple[type, type, type]:
                 "PySide6 is required to run QProcess-based commands."
             )
 
-    return QObject, Signal, QProcess
+    class QProcessEnvironment:
+        """Dict-backed QProcessEnvironment stand-in."""
+
+        def __init__(self, other: QProcessEnvironment | None = None) -> None:
+            self._values: dict[str, str] = dict(other._values) if other else {}
+
+        @classmethod
+        def systemEnvironment(cls) -> QProcessEnvironment:
+            """Snapshot of the current process environment."""
+            env = cls()
+            env._values = dict(os.environ)
+            return env
+
+        def insert(self, key: str, value: str) -> None:
+            """Set or replace one variable."""
+            self._values[key] = value
+
+        def value(self, key: str, default: str = "") -> str:
+            """Return a variable, or default when unset."""
+            return self._values.get(key, default)
+
+    return QObject, Signal, QProcess, QProcessEnvironment
 
 
 _FORCE_FALLBACK = os.environ.get("GITUI_FORCE_QT_FALLBACK") == "1"
@@ -64,12 +85,17 @@ _FORCE_FALLBACK = os.environ.get("GITUI_FORCE_QT_FALLBACK") == "1"
 if not _FORCE_FALLBACK:
     try:
         # Prefer real Qt types when PySide6 is installed.
-        from PySide6.QtCore import QObject, QProcess, Signal  # type: ignore
+        from PySide6.QtCore import (  # type: ignore
+            QObject,
+            QProcess,
+            QProcessEnvironment,
+            Signal,
+        )
 
         PYSIDE6_AVAILABLE = True
     except ModuleNotFoundError:
         PYSIDE6_AVAILABLE = False
-        QObject, Signal, QProcess = _build_fallback()
+        QObject, Signal, QProcess, QProcessEnvironment = _build_fallback()
 else:
     PYSIDE6_AVAILABLE = False
-    QObject, Signal, QProcess = _build_fallback()
+    QObject, Signal, QProcess, QProcessEnvironment = _build_fallback()
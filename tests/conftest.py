@@ -51,7 +51,7 @@ class DummyService:
 
     def _handle(self, args: list[str], repo_path: str | None = None) -> RunHandle:
         spec = CommandSpec(args=args, cwd=repo_path, env={})
-        handle = RunHandle(run_id=self._next_run_id, spec=spec, started_at_ms=0)
+        handle = RunHandle(run_id=self._next_run_id, spec=spec, started_at_ns=0)
         self._next_run_id += 1
         self.last_handle = handle
         return handle
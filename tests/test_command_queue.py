@@ -49,3 +49,38 @@ def test_queue_prefers_user_priority() -> None:
 
     queue.mark_idle()
     assert ran[0] == "user"
+
+
+def test_queue_coalesced_item_moves_behind_other_background_items() -> None:
+    queue = CommandQueue()
+    ran: list[str] = []
+
+    queue.mark_running()
+
+    for key, label in (("status", "status-1"), ("log", "log"), ("status", "status-2")):
+        queue.enqueue(
+            QueueItem(
+                key=key,
+                run=lambda label=label: (ran.append(label), queue.mark_idle()),
+                priority=QueuePriority.BACKGROUND,
+            )
+        )
+
+    queue.mark_idle()
+    assert ran == ["log", "status-2"]
+
+
+def test_queue_emits_one_change_per_transition() -> None:
+    queue = CommandQueue()
+    changes: list[bool] = []
+    queue.queue_changed.connect(lambda: changes.append(queue.running))
+
+    # Starts immediately: one emit, already running.
+    queue.enqueue(
+        QueueItem(key="status", run=lambda: None, priority=QueuePriority.BACKGROUND)
+    )
+    assert changes == [True]
+
+    # Idle with nothing queued: one emit, not running.
+    queue.mark_idle()
+    assert changes == [True, False]
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import os
 import sys
+from types import MappingProxyType
 
 import pytest
 
@@ -85,6 +87,37 @@ def test_command_runner_emits_output_and_result(tmp_path) -> None:
     assert getattr(result, "duration_ms", 0) >= 0
 
 
+@pytest.mark.qprocess
+@pytest.mark.skipif(
+    not qt_compat.PYSIDE6_AVAILABLE or IS_DARWIN,
+    reason="PySide6 required for QProcess; macOS QProcess tests are unstable",
+)
+def test_command_runner_keeps_only_tail_when_not_capturing(tmp_path) -> None:
+    _ensure_qt_app()
+    runner = CommandRunner()
+    streamed: list[bytes] = []
+    runner.command_stdout.connect(lambda _handle, data: streamed.append(data))
+
+    spec = CommandSpec(
+        args=[
+            sys.executable,
+            "-c",
+            "import sys; sys.stdout.write('x' * 20000 + 'END')",
+        ],
+        cwd=str(tmp_path),
+        capture_stdout=False,
+    )
+    runner.run(spec)
+    done = _wait_for_finished(runner)
+
+    assert done, "command_finished did not fire"
+    stdout = getattr(done["result"], "stdout", b"")
+    assert len(stdout) <= command_runner.UNCAPTURED_STDOUT_TAIL
+    assert stdout.endswith(b"END")
+    # The console still receives every chunk.
+    assert sum(len(chunk) for chunk in streamed) == 20003
+
+
 @pytest.mark.qprocess
 @pytest.mark.skipif(
     not qt_compat.PYSIDE6_AVAILABLE or IS_DARWIN,
@@ -106,7 +139,7 @@ def test_command_runner_cancel_and_kill(tmp_path) -> None:
     done = _wait_for_finished(runner)
     assert done, "command did not finish after cancel/kill"
 
-    fake = RunHandle(run_id=999, spec=spec, started_at_ms=0)
+    fake = RunHandle(run_id=999, spec=spec, started_at_ns=0)
     assert runner.cancel(fake) is False
     assert runner.kill(fake) is False
 
@@ -157,6 +190,10 @@ def test_command_runner_with_fake_process(monkeypatch: pytest.MonkeyPatch) -> No
             self.terminated = False
             self.killed = False
             self.deleted = False
+            self.properties: dict[str, object] = {}
+
+        def setProperty(self, name: str, value: object) -> None:
+            self.properties[name] = value
 
         def setWorkingDirectory(self, cwd: str) -> None:
             self._cwd = cwd
@@ -205,7 +242,7 @@ def test_command_runner_with_fake_process(monkeypatch: pytest.MonkeyPatch) -> No
     spec = CommandSpec(args=["git", "status"], cwd="/repo", env={"TEST_ENV": "1"})
     handle = runner.run(spec)
 
-    process = runner._processes[handle.run_id]
+    process = runner._runs[handle.run_id].process
     assert runner.cancel(handle) is True
     assert runner.kill(handle) is True
     assert process.terminated is True
@@ -217,8 +254,39 @@ def test_command_runner_with_fake_process(monkeypatch: pytest.MonkeyPatch) -> No
     assert process._cwd == "/repo"
     assert process._program == "git"
     assert process._args == ["status"]
-    assert process._env.values["TEST_ENV"] == "1"
+    assert process.properties["run_id"] == handle.run_id
+    assert process._env.value("TEST_ENV") == "1"
+    # Overrides sit on top of the inherited environment.
+    assert process._env.value("PATH") == os.environ.get("PATH", "")
     assert stdout_chunks and stderr_chunks
     assert finished
 
     assert runner.cancel(handle) is False
+
+
+def test_run_ctx_caps_buffered_output(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(command_runner, "MAX_CAPTURE_BYTES", 8)
+    handle = RunHandle(run_id=1, spec=CommandSpec(args=["git"]), started_at_ns=0)
+    ctx = command_runner._RunCtx(handle)
+
+    ctx.add_stdout(b"12345")
+    ctx.add_stdout(b"67890")
+    ctx.add_stdout(b"more")
+    ctx.add_stderr(b"err")
+
+    assert b"".join(ctx.stdout) == b"12345678"
+    assert ctx.stdout_size == 8
+    assert ctx.stderr == [b"err"]
+    assert ctx.truncated is True
+
+
+def test_command_runner_reuses_env_for_shared_mapping() -> None:
+    runner = CommandRunner()
+    shared = MappingProxyType({"GIT_PAGER": "cat"})
+
+    first = runner._process_env(shared)
+
+    assert runner._process_env(shared) is first
+    assert first.value("GIT_PAGER") == "cat"
+    assert first.value("PATH") == os.environ.get("PATH", "")
+    assert runner._process_env({"GIT_PAGER": "cat"}) is not first
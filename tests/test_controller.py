@@ -74,7 +74,7 @@ class DummyService:
 
     def _handle(self, args: list[str], repo_path: str | None = None) -> RunHandle:
         spec = CommandSpec(args=args, cwd=repo_path, env={})
-        handle = RunHandle(run_id=self._next_run_id, spec=spec, started_at_ms=0)
+        handle = RunHandle(run_id=self._next_run_id, spec=spec, started_at_ns=0)
         self._next_run_id += 1
         # Keep the last handle so tests can simulate completion.
         self.last_handle = handle
@@ -258,7 +258,7 @@ class DummyService:
             conflicted=[],
         )
 
-    def parse_log(self, _payload: bytes) -> list[Commit]:
+    def parse_log(self, _payload: bytes, known=None) -> list[Commit]:
         return [
             Commit(
                 oid="abc123",
@@ -354,6 +354,20 @@ def test_refresh_status_without_repo_sets_error() -> None:
     assert isinstance(controller.state.last_error, NotARepo)
 
 
+def test_guarded_methods_without_repo_start_nothing() -> None:
+    service = DummyService()
+    controller = RepoController(service)
+
+    controller.refresh_log()
+    controller.request_diff("a.txt")
+    controller.stage(["a.txt"])
+
+    assert isinstance(controller.state.last_error, NotARepo)
+    assert service.log_calls == 0
+    assert service.stage_calls == 0
+    assert service.diff_calls == 0
+
+
 def test_open_repo_success_triggers_status_refresh() -> None:
     service = DummyService()
     controller = RepoController(service)
@@ -371,6 +385,66 @@ def test_open_repo_success_triggers_status_refresh() -> None:
     assert service.status_calls == 1
 
 
+def test_open_repo_reuses_cached_validation() -> None:
+    service = DummyService()
+    controller = RepoController(service)
+
+    controller.open_repo("/repo")
+    _complete_last(controller, service, stdout=b"true\n")
+    _complete_last(controller, service)
+    assert service.validate_calls == 1
+
+    # Reopening a validated repo skips the rev-parse subprocess.
+    controller.state.set_repo_path(None)
+    controller.open_repo("/repo/")
+    assert service.validate_calls == 1
+    assert controller.state.repo_path == "/repo"
+    assert service.status_calls == 2
+
+
+def test_cached_open_repo_runs_after_commands_queued_for_old_repo() -> None:
+    service = DummyService()
+    controller = RepoController(service)
+
+    controller.open_repo("/repo-b")
+    _complete_last(controller, service, stdout=b"true\n")
+    _complete_last(controller, service)
+    controller.open_repo("/repo-a")
+    _complete_last(controller, service, stdout=b"true\n")
+
+    # Status for A is running; the commit waits behind it, then B is reopened.
+    controller.commit("msg for A")
+    controller.open_repo("/repo-b")
+    assert controller.state.repo_path == "/repo-a"
+
+    _complete_last(controller, service)
+    assert service.commit_calls == 1
+    assert service.last_handle.spec.cwd == "/repo-a"
+
+    _complete_last(controller, service)
+    assert controller.state.repo_path == "/repo-b"
+    assert service.validate_calls == 2
+    assert service.last_handle.spec.cwd == "/repo-b"
+
+
+def test_open_repo_cache_invalidated_on_not_a_repo_failure() -> None:
+    service = DummyService()
+    controller = RepoController(service)
+
+    controller.open_repo("/repo")
+    _complete_last(controller, service, stdout=b"true\n")
+    # The repo vanished: status fails with git's "not a git repository".
+    _complete_last(
+        controller,
+        service,
+        exit_code=128,
+        stderr=b"fatal: not a git repository",
+    )
+
+    controller.open_repo("/repo")
+    assert service.validate_calls == 2
+
+
 def test_status_result_updates_state() -> None:
     service = DummyService()
     controller = RepoController(service)
@@ -605,6 +679,41 @@ def test_request_diff_updates_state() -> None:
     assert controller.state.diff_text == "diff contents"
 
 
+def test_truncated_output_is_flagged_not_parsed() -> None:
+    service = DummyService()
+    controller = RepoController(service)
+
+    controller.state.set_repo_path("/repo")
+    controller.refresh_status()
+    handle = service.last_handle
+    assert handle is not None
+    result = CommandResult(
+        exit_code=0, stdout=b"", stderr=b"", duration_ms=1, truncated=True
+    )
+    controller._on_command_finished(handle, result)
+
+    assert controller.state.status is None
+    assert isinstance(controller.state.last_error, ParseError)
+    assert "truncated" in str(controller.state.last_error)
+
+
+def test_truncated_diff_is_shown_and_flagged() -> None:
+    service = DummyService()
+    controller = RepoController(service)
+
+    controller.state.set_repo_path("/repo")
+    controller.request_diff("file.txt")
+    handle = service.last_handle
+    assert handle is not None
+    result = CommandResult(
+        exit_code=0, stdout=b"+partial", stderr=b"", duration_ms=1, truncated=True
+    )
+    controller._on_command_finished(handle, result)
+
+    assert controller.state.diff_text == "+partial"
+    assert isinstance(controller.state.last_error, ParseError)
+
+
 @pytest.mark.parametrize(
     ("method_name", "args", "kwargs"),
     [
@@ -858,3 +967,251 @@ def test_set_upstream_refreshes_branches() -> None:
     _complete_last(controller, service)
 
     assert service.branches_calls == 1
+
+
+def test_action_table_targets_real_service_methods() -> None:
+    from app.core.controller import _ACTIONS
+    from app.git.git_service import GitService
+
+    for name, spec in _ACTIONS.items():
+        assert hasattr(RepoController, name)
+        assert callable(getattr(GitService, spec.service_method, None))
+
+
+def test_enqueue_refreshes_runs_each_flagged_refresh() -> None:
+    from app.core.controller import RefreshFlag
+
+    service = DummyService()
+    controller = RepoController(service)
+    controller.state.set_repo_path("/repo")
+
+    controller._enqueue_refreshes(RefreshFlag.STATUS | RefreshFlag.TAGS)
+    # Re-requesting the same bits coalesces onto the queued refreshes.
+    controller._enqueue_refreshes(RefreshFlag.TAGS)
+    _complete_last(controller, service)
+    _complete_last(controller, service)
+
+    assert service.status_calls == 1
+    assert service.tags_calls == 1
+    assert service.log_calls == 0
+
+
+def test_refresh_all_runs_subscribed_refreshes() -> None:
+    service = DummyService()
+    controller = RepoController(service)
+    controller.state.set_repo_path("/repo")
+    controller.unsubscribe("log")
+
+    controller.refresh_all()
+    for _ in range(6):
+        _complete_last(controller, service)
+
+    assert service.status_calls == 1
+    assert service.branches_calls == 1
+    assert service.remote_branches_calls == 1
+    assert service.stash_list_calls == 1
+    assert service.tags_calls == 1
+    assert service.remotes_calls == 1
+    assert service.log_calls == 0
+
+
+def test_refresh_all_without_repo_sets_error_once() -> None:
+    service = DummyService()
+    controller = RepoController(service)
+    errors: list[object] = []
+    controller.state.state_changed.connect(
+        lambda: errors.append(controller.state.last_error)
+    )
+
+    controller.refresh_all()
+
+    assert isinstance(controller.state.last_error, NotARepo)
+    assert len(errors) == 1
+    assert service.status_calls == 0
+
+
+def test_pending_actions_are_shared_instances() -> None:
+    from app.core.controller import PendingAction
+
+    service = DummyService()
+    controller = RepoController(service)
+    controller.state.set_repo_path("/repo")
+
+    controller.stage(["a.txt"])
+    first = controller._pending[service.last_handle.run_id]
+    _complete_last(controller, service)
+    _complete_last(controller, service)
+    controller.stage(["b.txt"])
+    second = controller._pending[service.last_handle.run_id]
+
+    assert first is second
+    assert PendingAction.diff("a.txt", True) is PendingAction.diff("a.txt", True)
+    assert PendingAction.diff("a.txt", True) is not PendingAction.diff("a.txt")
+
+
+def test_open_repo_rejects_non_true_output() -> None:
+    service = DummyService()
+    controller = RepoController(service)
+
+    controller.open_repo("/repo")
+    _complete_last(controller, service, stdout=b"false\n")
+
+    assert isinstance(controller.state.last_error, NotARepo)
+    assert controller.state.repo_path is None
+
+
+def test_refresh_log_skips_when_head_unchanged() -> None:
+    service = DummyService()
+    controller = RepoController(service)
+    controller.state.set_repo_path("/repo")
+    controller.state.set_status(
+        RepoStatus(
+            branch=BranchInfo(
+                name="main", head_oid="abc123", upstream=None, ahead=0, behind=0
+            ),
+            staged=[],
+            unstaged=[],
+            untracked=[],
+            conflicted=[],
+        )
+    )
+
+    controller.refresh_log()
+    _complete_last(controller, service)
+    assert service.log_calls == 1
+
+    # HEAD still matches the parsed log: no subprocess, queue keeps moving.
+    controller.refresh_log()
+    controller.refresh_tags()
+    assert service.log_calls == 1
+    assert service.tags_calls == 1
+    _complete_last(controller, service)
+
+    controller.refresh_log(force=True)
+    assert service.log_calls == 2
+
+
+class ImmediateExecutor:
+    """Executor stub that runs work synchronously and returns a done Future."""
+
+    def __init__(self) -> None:
+        self.submitted = 0
+
+    def submit(self, fn, *args, **kwargs):
+        from concurrent.futures import Future
+
+        self.submitted += 1
+        future: Future = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+
+class DeferredExecutor:
+    """Executor stub that holds work until the test runs it."""
+
+    def __init__(self) -> None:
+        self.jobs: list = []
+
+    def submit(self, fn, *args, **kwargs):
+        from concurrent.futures import Future
+
+        future: Future = Future()
+        self.jobs.append((future, fn, args, kwargs))
+        return future
+
+    def run_all(self) -> None:
+        jobs, self.jobs = self.jobs, []
+        for future, fn, args, kwargs in jobs:
+            future.set_result(fn(*args, **kwargs))
+
+
+def test_parse_executor_applies_results() -> None:
+    service = DummyService()
+    executor = ImmediateExecutor()
+    controller = RepoController(service, parse_executor=executor)
+    controller.state.set_repo_path("/repo")
+
+    controller.refresh_status()
+    controller.refresh_tags()
+    _complete_last(controller, service)
+
+    assert executor.submitted == 1
+    assert controller.state.status is not None
+    # The queue advanced exactly once to the next refresh.
+    assert service.tags_calls == 1
+
+
+def test_parse_executor_holds_queue_until_parse_lands() -> None:
+    service = DummyService()
+    executor = DeferredExecutor()
+    controller = RepoController(service, parse_executor=executor)
+    controller.state.set_repo_path("/repo")
+
+    controller.refresh_status()
+    controller.refresh_tags()
+    _complete_last(controller, service)
+
+    assert controller.state.status is None
+    assert controller.state.busy is True
+    assert service.tags_calls == 0
+
+    executor.run_all()
+
+    assert controller.state.status is not None
+    assert service.tags_calls == 1
+
+
+def test_unsubscribed_topics_skip_post_mutation_refresh() -> None:
+    service = DummyService()
+    controller = RepoController(service)
+    controller.state.set_repo_path("/repo")
+    controller.unsubscribe("log")
+
+    controller.commit("message")
+    _complete_last(controller, service)
+    _complete_last(controller, service)
+    assert service.status_calls == 1
+    assert service.log_calls == 0
+
+    controller.subscribe("log")
+    controller.commit("message")
+    _complete_last(controller, service)
+    _complete_last(controller, service)
+    assert service.log_calls == 1
+
+
+def test_busy_does_not_flicker_across_chained_commands() -> None:
+    service = DummyService()
+    controller = RepoController(service)
+    controller.state.set_repo_path("/repo")
+    transitions: list[bool] = []
+    controller.state.state_changed.connect(
+        lambda: transitions.append(controller.state.busy)
+    )
+
+    controller.commit("message")
+    _complete_last(controller, service)  # commit -> status
+    _complete_last(controller, service)  # status -> log
+    _complete_last(controller, service)  # log -> idle
+
+    busy_changes = [
+        value
+        for index, value in enumerate(transitions)
+        if index == 0 or value != transitions[index - 1]
+    ]
+    assert busy_changes == [True, False]
+
+
+def test_command_completion_emits_state_changed_once() -> None:
+    service = DummyService()
+    controller = RepoController(service)
+    controller.state.set_repo_path("/repo")
+    controller.refresh_status()
+    emissions: list[str] = []
+    controller.state.state_changed.connect(lambda: emissions.append("changed"))
+
+    # set_status + set_error + busy False collapse into one notification.
+    _complete_last(controller, service)
+
+    assert controller.state.busy is False
+    assert len(emissions) == 1
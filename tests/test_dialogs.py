@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import os
+import subprocess
+import sys
+from pathlib import Path
 
 import pytest
 
@@ -24,8 +27,54 @@ def test_error_dialog_formats_command_failed() -> None:
     assert "Exit code" in details
 
 
+def test_error_dialog_formats_details_on_first_expand(monkeypatch) -> None:
+    err = CommandFailed(["git", "push"], 1, b"", b"rejected")
+    dialog = ErrorDialog(err)
+    calls: list[Exception] = []
+    original = dialog._format_details
+    monkeypatch.setattr(
+        dialog, "_format_details", lambda e: calls.append(e) or original(e)
+    )
+
+    assert dialog._details.isHidden()
+    assert dialog._details.toPlainText() == ""
+
+    dialog._toggle.setChecked(True)
+    dialog._toggle.setChecked(False)
+    dialog._toggle.setChecked(True)
+
+    assert not dialog._details.isHidden()
+    assert "rejected" in dialog._details.toPlainText()
+    assert calls == [err]
+    assert dialog._toggle.text() == "Hide details"
+
+
 def test_confirm_dialog_ask(monkeypatch) -> None:
     monkeypatch.setattr(
         ConfirmDialog, "exec", lambda *_args, **_kwargs: QDialog.Accepted
     )
     assert ConfirmDialog.ask(None, "Confirm", "Proceed?") is True
+
+
+def test_dialogs_package_resolves_names_lazily() -> None:
+    import app.ui.dialogs as dialogs
+
+    assert dialogs.ErrorDialog is ErrorDialog
+    assert "SettingsDialog" in dir(dialogs)
+    assert dialogs.SettingsDialog is dialogs.ThemeEditorDialog
+    with pytest.raises(AttributeError):
+        _ = dialogs.MissingDialog
+
+    # A fresh interpreter: one dialog module must not drag in the theme editor.
+    code = (
+        "import sys, app.ui.dialogs.confirm_dialog;"
+        "print('app.ui.theme.theme_editor_dialog' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=Path(__file__).resolve().parents[1],
+    )
+    assert result.stdout.strip() == "False"
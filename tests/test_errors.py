@@ -1,6 +1,13 @@
 from __future__ import annotations
 
-from app.core.errors import AuthError, CommandFailed, NotARepo, ParseError
+from app.core.errors import (
+    OUTPUT_TAIL_LIMIT,
+    TRUNCATED_MARKER,
+    AuthError,
+    CommandFailed,
+    NotARepo,
+    ParseError,
+)
 
 
 def test_command_failed_stores_attributes() -> None:
@@ -28,6 +35,20 @@ def test_command_failed_accepts_tuple_args() -> None:
     assert exc.command_args == ["git", "status"]
 
 
+def test_command_failed_keeps_tail_of_large_output() -> None:
+    big = b"x" * OUTPUT_TAIL_LIMIT + b"fatal: the end"
+    exc = CommandFailed(
+        command_args=["git", "pull"],
+        exit_code=1,
+        stdout=big,
+        stderr=b"short",
+    )
+    assert exc.stdout.startswith(TRUNCATED_MARKER)
+    assert exc.stdout.endswith(b"fatal: the end")
+    assert len(exc.stdout) == len(TRUNCATED_MARKER) + OUTPUT_TAIL_LIMIT
+    assert exc.stderr == b"short"
+
+
 def test_not_a_repo_stores_path() -> None:
     exc = NotARepo(path="/tmp/not-a-repo")
     assert exc.path == "/tmp/not-a-repo"
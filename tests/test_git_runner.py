@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from types import MappingProxyType
+
 import pytest
 
 from app.exec.fake_command_runner import FakeCommandRunner
@@ -13,7 +15,7 @@ def test_git_runner_builds_command_spec_with_defaults() -> None:
     handle = git.run(["status"], cwd="/repo", env={"LANG": "C"})
 
     spec = runner.calls[-1]
-    assert spec.args == ["git-test", "status"]
+    assert spec.args == ("git-test", "status")
     assert spec.cwd == "/repo"
     assert spec.env is not None
     assert spec.env["GIT_PAGER"] == "cat"
@@ -35,3 +37,46 @@ def test_git_runner_requires_args() -> None:
 
     with pytest.raises(ValueError, match="at least one arg"):
         git.run([])
+
+
+def test_git_runner_shares_default_env_without_overrides() -> None:
+    runner = FakeCommandRunner()
+    git = GitRunner(runner)
+
+    git.run(["status"])
+    git.run(["log"])
+
+    first, second = runner.calls
+    assert first.env is second.env
+    assert first.env["LANG"] == "C.UTF-8"
+
+
+def test_git_runner_interns_repeated_read_specs() -> None:
+    runner = FakeCommandRunner()
+    git = GitRunner(runner)
+    read_only = MappingProxyType({"GIT_OPTIONAL_LOCKS": "0"})
+
+    git.run(["status"], cwd="/repo", env=read_only)
+    git.run(["status"], cwd="/repo", env=read_only)
+    git.run(["add", "a.txt"], cwd="/repo", capture_stdout=False)
+    git.run(["add", "a.txt"], cwd="/repo", capture_stdout=False)
+
+    first, second, add_1, add_2 = runner.calls
+    assert first is second
+    assert first.env["GIT_OPTIONAL_LOCKS"] == "0"
+    assert first.env["GIT_PAGER"] == "cat"
+    # Mutations are never interned (their args may carry messages/paths).
+    assert add_1 is not add_2
+
+
+def test_fake_runner_history_can_be_bounded_and_reset() -> None:
+    runner = FakeCommandRunner(max_history=2)
+    git = GitRunner(runner)
+
+    for name in ("status", "log", "branch"):
+        git.run([name])
+
+    assert [spec.args[1] for spec in runner.calls] == ["log", "branch"]
+    runner.reset()
+    assert not runner.calls and not runner.handles
+    assert git.run(["tag"]).run_id == 4
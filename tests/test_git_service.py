@@ -27,6 +27,8 @@ def test_git_service_status_raw_uses_porcelain_v2() -> None:
     spec = fake.calls[-1]
     assert list(spec.args) == ["git", "status", "--porcelain=v2", "-b", "-z"]
     assert spec.cwd == "/repo"
+    # Background status must not take git's optional index lock.
+    assert spec.env["GIT_OPTIONAL_LOCKS"] == "0"
 
 
 def test_git_service_diff_file_raw_staged_and_unstaged() -> None:
@@ -286,3 +288,14 @@ def test_git_service_push_set_upstream_missing_branch_raises() -> None:
 
     with pytest.raises(ValueError, match="remote and branch are required"):
         service.push("/repo", set_upstream=True, remote="origin", branch=None)
+
+
+def test_git_service_mutations_do_not_capture_stdout() -> None:
+    fake = FakeCommandRunner()
+    service = GitService(GitRunner(fake))
+
+    service.stage("/repo", ["a.txt"])
+    assert fake.calls[-1].capture_stdout is False
+
+    service.status_raw("/repo")
+    assert fake.calls[-1].capture_stdout is True
@@ -8,13 +8,17 @@ pytest.importorskip("PySide6")
 
 os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 
+from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QApplication
 
+from app.core.controller import RepoController
 from app.core.errors import CommandFailed
 from app.core.models import Branch, BranchInfo, Remote, RepoStatus
-from app.core.repo_state import RepoState
+from app.core.repo_state import RepoState, StateField
+from app.exec.command_models import CommandResult
 from app.ui.dialogs.confirm_dialog import ConfirmDialog
 from app.ui.main_window import MainWindow
+from app.ui.theme.theme_editor_dialog import ThemeEditorDialog
 
 app = QApplication.instance() or QApplication([])
 
@@ -99,3 +103,94 @@ def test_main_window_push_no_upstream_prompt(monkeypatch) -> None:
     assert handled is True
     assert controller.calls
     assert controller.calls[-1][0] == "push"
+
+
+def test_main_window_refreshes_only_changed_views(monkeypatch) -> None:
+    controller = FakeController()
+    runner = DummyRunner()
+    window = MainWindow(controller=controller, runner=runner)  # type: ignore[arg-type]
+    status_updates: list[object] = []
+    monkeypatch.setattr(window._status_panel, "set_status", status_updates.append)
+
+    controller.state.set_log([])
+    window._dispatcher.flush()
+    assert status_updates == []
+
+    status = RepoStatus(
+        branch=BranchInfo(name="main", head_oid=None, upstream=None, ahead=0, behind=0),
+        staged=[],
+        unstaged=[],
+        untracked=[],
+        conflicted=[],
+    )
+    controller.state.set_status(status)
+    # Deferred to the end of the event-loop tick.
+    assert status_updates == []
+    window._dispatcher.flush()
+    assert status_updates == [status]
+
+
+def test_main_window_coalesces_changes_within_a_tick() -> None:
+    controller = FakeController()
+    runner = DummyRunner()
+    window = MainWindow(controller=controller, runner=runner)  # type: ignore[arg-type]
+    masks: list[int] = []
+    window._dispatcher.refresh_requested.connect(masks.append)
+
+    controller.state.set_log([])
+    controller.state.set_tags([])
+    app.processEvents()
+
+    assert masks == [StateField.LOG | StateField.TAGS]
+
+
+def test_main_window_theme_editor_deleted_on_close(monkeypatch) -> None:
+    opened = []
+    monkeypatch.setattr(ThemeEditorDialog, "exec", lambda self: opened.append(self))
+    window = MainWindow(controller=FakeController(), runner=DummyRunner())  # type: ignore[arg-type]
+
+    window._open_settings()
+
+    assert opened[0].testAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+    opened[0].close()
+
+
+def test_main_window_log_tab_refetches_after_outside_head_change(
+    monkeypatch, dummy_service
+) -> None:
+    head = ["old"]
+    monkeypatch.setattr(
+        dummy_service,
+        "parse_status",
+        lambda _payload: RepoStatus(
+            branch=BranchInfo(
+                name="main", head_oid=head[0], upstream=None, ahead=0, behind=0
+            ),
+            staged=[],
+            unstaged=[],
+            untracked=[],
+            conflicted=[],
+        ),
+    )
+    monkeypatch.setattr(dummy_service, "parse_log", lambda _payload, known=None: [])
+    controller = RepoController(dummy_service)
+    controller.state.set_repo_path("/repo")
+    window = MainWindow(controller=controller, runner=DummyRunner())  # type: ignore[arg-type]
+
+    def run_queued() -> None:
+        while controller._pending:
+            result = CommandResult(exit_code=0, stdout=b"", stderr=b"", duration_ms=1)
+            controller._on_command_finished(dummy_service.last_handle, result)
+
+    controller.refresh_status()
+    controller.refresh_log()
+    run_queued()
+    assert dummy_service.log_calls == 1
+
+    # A commit made outside the app moves HEAD; nothing in the app saw it.
+    head[0] = "new"
+    window._tabs.setCurrentWidget(window._log_panel)
+    run_queued()
+
+    assert controller.state.status.branch.head_oid == "new"
+    assert dummy_service.log_calls == 2
@@ -0,0 +1,43 @@
+import pickle
+
+import pytest
+
+from app.core.models import (
+    Branch,
+    BranchInfo,
+    Commit,
+    FileChange,
+    FileChangeBucket,
+    Remote,
+    RemoteBranch,
+    RepoStatus,
+    StashEntry,
+    Tag,
+)
+
+_BUCKET = FileChangeBucket()
+_BUCKET.add("a.txt", "M", ".")
+
+_MODELS = [
+    FileChange("a.txt", "M", "."),
+    _BUCKET,
+    BranchInfo("main", "abc", "origin/main", 1, 0),
+    Branch("main", True, "origin/main", 1, 0, False),
+    RemoteBranch("origin", "main", "origin/main"),
+    RepoStatus(None, _BUCKET, [], [], []),
+    Commit("abc", [], "Alice", "a@x", "date", "subject"),
+    StashEntry("abc", "stash@{0}", "WIP", "date"),
+    Tag("v1"),
+    Remote("origin", "url", None),
+]
+
+
+@pytest.mark.parametrize("model", _MODELS, ids=lambda model: type(model).__name__)
+def test_models_have_no_instance_dict(model: object) -> None:
+    # Parsers allocate one model per record; slots keep that allocation small.
+    assert not hasattr(model, "__dict__")
+
+
+@pytest.mark.parametrize("model", _MODELS, ids=lambda model: type(model).__name__)
+def test_models_pickle_round_trip(model: object) -> None:
+    assert pickle.loads(pickle.dumps(model)) == model
@@ -53,3 +53,10 @@ def test_parse_branches_handles_unbracketed_track() -> None:
     branch = parse_branches(payload)[0]
     assert branch.ahead == 2
     assert branch.behind == 1
+
+
+def test_parse_branches_irregular_track_uses_fallback() -> None:
+    payload = b"odd||origin/odd|[ahead 4, gone]\n"
+    branch = parse_branches(payload)[0]
+    assert branch.ahead == 4
+    assert branch.gone is True
@@ -27,3 +27,48 @@ def test_parse_log_records_basic() -> None:
     assert second.author_email == "bob@example.com"
     assert second.author_date == "2024-01-02T00:00:00+00:00"
     assert second.subject == "Merge branch"
+
+
+def test_parse_log_records_reuses_known_commits() -> None:
+    payload = (
+        b"aaaaaaaa\x1f\x1fAlice\x1falice@example.com\x1f"
+        b"2024-01-01T00:00:00+00:00\x1fInitial commit\x1e"
+    )
+    first = parse_log_records(payload)
+
+    again = parse_log_records(payload, known={first[0].oid: first[0]})
+
+    assert again[0] is first[0]
+
+
+def test_parse_log_records_builds_slotted_commits() -> None:
+    commits = parse_log_records(b"aaaaaaaa\x1f\x1fA\x1fa@x\x1fdate\x1fsubject\x1e")
+
+    # Slotted dataclasses carry no per-instance __dict__.
+    assert not hasattr(commits[0], "__dict__")
+
+
+def test_parse_log_records_strips_newline_between_records() -> None:
+    # `git log --pretty=format:` separates records with a newline.
+    payload = (
+        b"aaaaaaaa\x1f\x1fAlice\x1fa@x\x1fdate\x1ffirst\x1e\n"
+        b"bbbbbbbb\x1faaaaaaaa\x1fBob\x1fb@x\x1fdate\x1fsecond\x1e"
+    )
+
+    commits = parse_log_records(payload)
+
+    assert [commit.oid for commit in commits] == ["aaaaaaaa", "bbbbbbbb"]
+    assert commits[1].parents == ["aaaaaaaa"]
+
+
+def test_parse_log_records_pads_short_records() -> None:
+    payload = (
+        b"aaaaaaaa\x1f\x1fAlice\x1e"
+        b"bbbbbbbb\x1f\x1fBob\x1fb@x\x1fdate\x1fsubject\x1e"
+    )
+
+    commits = parse_log_records(payload)
+
+    assert [commit.oid for commit in commits] == ["aaaaaaaa", "bbbbbbbb"]
+    assert commits[0].subject == ""
+    assert commits[1].subject == "subject"
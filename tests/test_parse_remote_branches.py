@@ -24,3 +24,13 @@ def test_parse_remote_branches_filters_and_splits() -> None:
     ]
     assert branches[0].remote == "origin"
     assert branches[0].name == "main"
+
+
+def test_parse_remote_branches_skips_symbolic_refs_and_empty_parts() -> None:
+    payload = b"origin/HEAD -> origin/main\n/main\norigin/\n  origin/dev  \n"
+
+    branches = parse_remote_branches(payload)
+
+    assert [(b.remote, b.name, b.full_name) for b in branches] == [
+        ("origin", "dev", "origin/dev")
+    ]
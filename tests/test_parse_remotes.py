@@ -55,3 +55,11 @@ def test_parse_remotes_empty_lines_skipped() -> None:
     assert len(remotes) == 1
     assert remotes[0].fetch_url == "https://example.com/repo.git"
     assert remotes[0].push_url == "https://example.com/repo.git"
+
+
+def test_parse_remotes_keeps_spaces_inside_url() -> None:
+    payload = b"local\t/srv/my  repos/app.git (fetch)\n"
+
+    remotes = parse_remotes(payload)
+    assert remotes[0].name == "local"
+    assert remotes[0].fetch_url == "/srv/my  repos/app.git"
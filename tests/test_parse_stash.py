@@ -24,3 +24,15 @@ def test_parse_stash_records_missing_fields_padded() -> None:
     assert stashes[0].selector == "stash@{0}"
     assert stashes[0].summary == ""  # Padded field
     assert stashes[0].date == ""  # Padded field
+
+
+def test_parse_stash_records_strips_newline_between_records() -> None:
+    # `git stash list --pretty=format:` separates records with a newline.
+    payload = (
+        b"abc123\x1fstash@{0}\x1fWIP on main: msg\x1f2024-01-01T00:00:00Z\x1e\n"
+        b"def456\x1fstash@{1}\x1fOn dev: more\x1f2024-01-02T00:00:00Z\x1e"
+    )
+
+    stashes = parse_stash_records(payload)
+    assert [stash.oid for stash in stashes] == ["abc123", "def456"]
+    assert stashes[1].date == "2024-01-02T00:00:00Z"
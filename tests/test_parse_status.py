@@ -1,4 +1,4 @@
-from app.core.models import RepoStatus
+from app.core.models import FileChange, FileChangeBucket, RepoStatus
 from app.git.parse_status import parse_status_porcelain_v2
 
 
@@ -83,3 +83,77 @@ def test_parse_status_behind_non_numeric_defaults_to_zero() -> None:
     assert status.branch is not None
     assert status.branch.ahead == 1
     assert status.branch.behind == 0
+
+
+def test_parse_status_decodes_only_path_and_xy() -> None:
+    """Non-UTF-8 bytes in a path are replaced; the XY codes still classify."""
+    payload = b"1 MM N... 100644 100644 100644 abcdef1 abcdef2 caf\xe9.txt\x00"
+
+    status = parse_status_porcelain_v2(payload)
+    assert [f.path for f in status.staged] == ["caf\ufffd.txt"]
+    assert [f.path for f in status.unstaged] == ["caf\ufffd.txt"]
+    assert status.staged[0].staged_status == "M"
+    assert status.staged[0].unstaged_status == "M"
+
+
+def test_parse_status_xy_outside_the_table_still_splits() -> None:
+    """XY pairs missing from the lookup table fall back to splitting the text."""
+    payload = b"1 XZ N... 100644 100644 100644 abcdef1 abcdef2 odd.txt\x00"
+
+    status = parse_status_porcelain_v2(payload)
+    assert status.staged[0].staged_status == "X"
+    assert status.unstaged[0].unstaged_status == "Z"
+
+
+def test_parse_status_rename_orig_path_without_trailing_nul() -> None:
+    """The last record may lack its NUL terminator."""
+    payload = b"2 R. N... 100644 100644 100644 abcdef1 abcdef2 R100 new.txt\x00old.txt"
+
+    status = parse_status_porcelain_v2(payload)
+    assert status.staged[0].orig_path == "old.txt"
+
+
+def test_parse_status_buckets_are_column_wise() -> None:
+    """Buckets expose per-field columns and build FileChange rows on access."""
+    payload = (
+        b"1 MM N... 100644 100644 100644 abcdef1 abcdef2 both.txt\x00"
+        b"2 R. N... 100644 100644 100644 abcdef1 abcdef2 R100 new.txt\x00old.txt\x00"
+    )
+
+    status = parse_status_porcelain_v2(payload)
+    assert isinstance(status.staged, FileChangeBucket)
+    assert status.staged.paths == ["both.txt", "new.txt"]
+    assert status.staged.orig_paths == [None, "old.txt"]
+    assert status.staged[-1] == FileChange("new.txt", "R", ".", "old.txt")
+    assert status.staged[:1] == [FileChange("both.txt", "M", "M")]
+    assert status.unstaged == [FileChange("both.txt", "M", "M")]
+
+
+def test_parse_status_ahead_with_sign_defaults_to_zero() -> None:
+    """Counts are unsigned; a stray sign is not parsed as negative."""
+    payload = b"# branch.ab +-3 -1\x00"
+
+    status = parse_status_porcelain_v2(payload)
+    assert status.branch is not None
+    assert status.branch.ahead == 0
+    assert status.branch.behind == 1
+
+
+def test_parse_status_records_across_block_boundaries(monkeypatch) -> None:
+    """Blocks are cut at NULs, so records (and rename pairs) span blocks intact."""
+    import app.git.parse_status as parse_status
+
+    payload = (
+        b"1 M. N... 100644 100644 100644 abcdef1 abcdef2 src/app.py\x00"
+        b"2 R. N... 100644 100644 100644 abcdef1 abcdef2 R100 new.txt\x00old.txt\x00"
+        b"? untracked.txt"
+    )
+    expected = parse_status_porcelain_v2(payload)
+
+    for block_size in (1, 7, 64):
+        monkeypatch.setattr(parse_status, "_BLOCK_SIZE", block_size)
+        assert parse_status_porcelain_v2(payload) == expected
+
+    assert [f.path for f in expected.staged] == ["src/app.py", "new.txt"]
+    assert expected.staged[1].orig_path == "old.txt"
+    assert [f.path for f in expected.untracked] == ["untracked.txt"]
@@ -0,0 +1,31 @@
+import pytest
+
+from app.git.parse_utils import decode_records, parse_uint, split_flat_fields
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("0", 0),
+        ("42", 42),
+        ("", 0),
+        ("abc", 0),
+        ("-3", 0),
+        ("1_000", 0),
+        (" 7", 0),
+        ("٣", 0),
+    ],
+)
+def test_parse_uint_accepts_only_ascii_digits(text: str, expected: int) -> None:
+    assert parse_uint(text) == expected
+
+
+def test_decode_records_folds_newlines_and_final_separator() -> None:
+    assert decode_records(b"a\x1fb\x1e\nc\x1fd\x1e") == "a\x1fb\x1ec\x1fd"
+    assert decode_records(b"") == ""
+
+
+def test_split_flat_fields_requires_exact_field_count() -> None:
+    assert split_flat_fields("a\x1fb\x1ec\x1fd", 2) == ["a", "b", "c", "d"]
+    # One record is short, so the caller must fall back.
+    assert split_flat_fields("a\x1fb\x1ec", 2) is None
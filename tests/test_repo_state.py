@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from app.core.models import Branch, BranchInfo, Commit, RemoteBranch, RepoStatus
-from app.core.repo_state import RepoState
+from app.core.repo_state import RepoState, StateField
 
 
 def test_initial_state_is_empty() -> None:
@@ -164,3 +164,99 @@ def test_multiple_signal_handlers() -> None:
 
     assert len(emissions_a) == 1
     assert len(emissions_b) == 1
+
+
+def test_set_diff_bytes_decodes_lazily() -> None:
+    state = RepoState()
+
+    state.set_diff_bytes(b"+caf\xc3\xa9 \xff")
+
+    assert state.diff_text == "+café �"
+    # Only the bytes are kept; the decoded text is not cached.
+    assert state._diff_text is None
+
+    state.set_diff_text("plain")
+    assert state.diff_text == "plain"
+
+
+def test_batch_emits_once_for_many_setters() -> None:
+    state = RepoState()
+    emissions: list[str] = []
+    state.state_changed.connect(lambda: emissions.append("changed"))
+
+    with state.batch():
+        state.set_repo_path("/repo")
+        with state.batch():
+            state.set_busy(True)
+            state.set_error(None)
+        assert emissions == []
+
+    assert len(emissions) == 1
+    assert state.repo_path == "/repo"
+    assert state.busy is True
+
+
+def test_batch_without_changes_does_not_emit() -> None:
+    state = RepoState()
+    emissions: list[str] = []
+    state.state_changed.connect(lambda: emissions.append("changed"))
+
+    with state.batch():
+        pass
+
+    assert emissions == []
+
+
+def test_setters_skip_unchanged_values() -> None:
+    state = RepoState()
+    commits = [
+        Commit(
+            oid="abc123",
+            parents=[],
+            author_name="Dev",
+            author_email="dev@example.com",
+            author_date="2024-01-01",
+            subject="Test",
+        )
+    ]
+    state.set_repo_path("/repo")
+    state.set_log(commits)
+    state.set_diff_text("diff")
+    emissions: list[str] = []
+    state.state_changed.connect(lambda: emissions.append("changed"))
+
+    state.set_repo_path("/repo")
+    state.set_log(commits)
+    state.set_diff_text("diff")
+    state.set_busy(False)
+    state.set_error(None)
+
+    assert emissions == []
+
+    state.set_log(list(commits))
+    assert len(emissions) == 1
+
+
+def test_state_changed_fields_reports_changed_mask() -> None:
+    state = RepoState()
+    masks: list[int] = []
+    state.state_changed_fields.connect(masks.append)
+
+    state.set_busy(True)
+    with state.batch():
+        state.set_repo_path("/repo")
+        state.set_diff_text("diff")
+
+    assert masks == [StateField.BUSY, StateField.REPO_PATH | StateField.DIFF]
+
+
+def test_set_repo_path_normalizes_once() -> None:
+    state = RepoState()
+    emissions: list[str] = []
+    state.state_changed.connect(lambda: emissions.append("changed"))
+
+    state.set_repo_path("/path//to/repo/")
+    state.set_repo_path("/path/to/repo")
+
+    assert state.repo_path == "/path/to/repo"
+    assert len(emissions) == 1
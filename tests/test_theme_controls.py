@@ -38,3 +38,20 @@ def test_color_picker_button_alpha(monkeypatch) -> None:
     button._pick_color()
 
     assert button.color.startswith("rgba(10, 20, 30,")
+
+
+def test_color_picker_button_skips_unchanged_color(monkeypatch) -> None:
+    button = ColorPickerButton("#abcdef")
+    emitted: list[str] = []
+    button.color_changed.connect(emitted.append)
+    restyles: list[None] = []
+    monkeypatch.setattr(button, "_update_style", lambda: restyles.append(None))
+
+    button.color = "#abcdef"
+    monkeypatch.setattr(
+        QColorDialog, "getColor", staticmethod(lambda *_a, **_k: QColor("#ABCDEF"))
+    )
+    button._pick_color()
+
+    assert restyles == []
+    assert emitted == []
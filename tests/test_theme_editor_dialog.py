@@ -8,13 +8,24 @@ pytest.importorskip("PySide6")
 
 os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 
-from PySide6.QtWidgets import QApplication, QFileDialog, QInputDialog, QMessageBox
+from PySide6.QtWidgets import (
+    QApplication,
+    QFileDialog,
+    QInputDialog,
+    QMessageBox,
+    QPushButton,
+)
 
 from app.ui.theme.theme_editor_dialog import ThemeEditorDialog
 
 app = QApplication.instance() or QApplication([])
 
 
+def _show_all_tabs(dialog: ThemeEditorDialog) -> None:
+    for index in range(dialog._tabs.count()):
+        dialog._tabs.setCurrentIndex(index)
+
+
 def test_theme_editor_dialog_constructs() -> None:
     dialog = ThemeEditorDialog()
     assert dialog.windowTitle() == "Theme Editor"
@@ -85,3 +96,179 @@ def test_theme_editor_dialog_import_export(monkeypatch, tmp_path) -> None:
     )
     dialog._import_json()
     dialog.close()
+
+
+def test_theme_editor_dialog_saves_once_per_burst(monkeypatch) -> None:
+    dialog = ThemeEditorDialog()
+    saves: list[str] = []
+    monkeypatch.setattr(dialog._engine, "save_current", lambda: saves.append("save"))
+    _show_all_tabs(dialog)
+    dialog._export_preview.setPlainText("")
+
+    dialog._on_metric_changed("padding", 7)
+    dialog._on_metric_changed("padding", 8)
+    dialog._on_color_changed("accent", "#445566")
+
+    assert dialog._dirty_timer.isActive()
+    assert saves == []
+    assert dialog._export_preview.toPlainText() == ""
+
+    dialog._dirty_timer.timeout.emit()
+
+    assert saves == ["save"]
+    assert "#445566" in dialog._export_preview.toPlainText()
+    dialog.close()
+
+
+def test_theme_editor_dialog_close_flushes_pending_edit(monkeypatch) -> None:
+    dialog = ThemeEditorDialog()
+    saves: list[str] = []
+    monkeypatch.setattr(dialog._engine, "save_current", lambda: saves.append("save"))
+
+    dialog._on_effect_changed("hover_scale", False)
+    dialog.close()
+
+    assert saves == ["save"]
+    assert not dialog._dirty_timer.isActive()
+
+
+def test_theme_editor_dialog_reject_flushes_pending_edit(monkeypatch) -> None:
+    dialog = ThemeEditorDialog()
+    saves: list[str] = []
+    monkeypatch.setattr(dialog._engine, "save_current", lambda: saves.append("save"))
+    dialog.show()
+
+    dialog._on_metric_changed("padding", 7)
+    dialog.reject()
+
+    assert saves == ["save"]
+    assert not dialog._dirty_timer.isActive()
+
+
+def test_theme_editor_dialog_controls_route_to_engine() -> None:
+    dialog = ThemeEditorDialog()
+    engine = dialog._engine
+    _show_all_tabs(dialog)
+
+    dialog._metric_controls["padding"].setValue(15)
+    dialog._effect_controls["hover_scale"].setChecked(
+        not engine.get_effect("hover_scale")
+    )
+    dialog._color_controls["accent"].color_changed.emit("#0A0B0C")
+    font = dialog._font_controls["font_family_mono"]
+    font.setCurrentIndex((font.currentIndex() + 1) % font.count())
+
+    assert engine.get_metric("padding") == 15
+    assert (
+        engine.get_effect("hover_scale")
+        is dialog._effect_controls["hover_scale"].isChecked()
+    )
+    assert engine.get_color("accent") == "#0A0B0C"
+    assert engine.get_metric("font_family_mono") == font.currentText()
+
+    dialog._json_paste_input.setPlainText("{}")
+    clear = [b for b in dialog.findChildren(QPushButton) if b.text() == "Clear"]
+    clear[0].click()
+    assert dialog._json_paste_input.toPlainText() == ""
+    dialog.close()
+
+
+def test_theme_editor_dialog_builds_tabs_on_first_view() -> None:
+    dialog = ThemeEditorDialog()
+    engine = dialog._engine
+    engine.set_metric("padding", 11)
+
+    assert dialog._color_controls
+    assert "padding" not in dialog._metric_controls
+    assert dialog._export_preview is None
+
+    dialog._tabs.setCurrentIndex(2)
+
+    assert dialog._metric_controls["padding"].value() == 11
+    assert not dialog._tab_builders.keys() & {0, 2}
+    dialog.close()
+
+
+def test_theme_editor_dialog_font_pickers_share_one_model() -> None:
+    dialog = ThemeEditorDialog()
+    dialog._tabs.setCurrentIndex(1)
+    other = ThemeEditorDialog()
+    other._tabs.setCurrentIndex(1)
+
+    models = {
+        id(combo.model())
+        for editor in (dialog, other)
+        for combo in editor._font_controls.values()
+    }
+    assert len(models) == 1
+    assert dialog._font_controls["font_family"].count() > 0
+    dialog.close()
+    other.close()
+
+
+def test_theme_editor_dialog_sync_does_not_write_back() -> None:
+    dialog = ThemeEditorDialog()
+    _show_all_tabs(dialog)
+    engine = dialog._engine
+    writes: list[str] = []
+    signals = (engine.colors_changed, engine.metrics_changed, engine.effects_changed)
+
+    def record(name: str, _value: object) -> None:
+        writes.append(name)
+
+    for signal in signals:
+        signal.connect(record)
+    state = engine.get_state()
+    state.metrics.padding = 3
+    state.effects.shadow_blur = 5
+    state.effects.hover_brighten = not state.effects.hover_brighten
+
+    engine.set_state(state)
+
+    assert dialog._metric_controls["padding"].value() == 3
+    assert dialog._effect_controls["shadow_blur"].value() == 5
+    for signal in signals:
+        signal.disconnect(record)
+    assert writes == []
+    dialog.close()
+
+
+def test_theme_editor_dialog_resyncs_only_on_new_state(monkeypatch) -> None:
+    dialog = ThemeEditorDialog()
+    engine = dialog._engine
+    syncs: list[object] = []
+    monkeypatch.setattr(dialog, "_sync_controls", syncs.append)
+
+    dialog._on_metric_changed("padding", 9)
+    assert syncs == []
+
+    engine.set_state(engine.get_state())
+    assert syncs == []
+
+    state = engine.get_state()
+    state.metrics.padding = 4
+    engine.set_state(state)
+    assert len(syncs) == 1
+    dialog._dirty_timer.stop()
+    dialog.close()
+
+
+def test_theme_editor_dialog_skips_identical_preview_stylesheet(monkeypatch) -> None:
+    dialog = ThemeEditorDialog()
+    dialog._live_preview.setChecked(False)
+    applied: list[str] = []
+    original = dialog._preview.setStyleSheet
+
+    def record(css: str) -> None:
+        applied.append(css)
+        original(css)
+
+    monkeypatch.setattr(dialog._preview, "setStyleSheet", record)
+
+    dialog._refresh_stylesheet_views()
+    dialog._toggle_live_preview(False)
+    assert applied == []
+
+    dialog._toggle_live_preview(True)
+    assert applied == [""]
+    dialog.close()
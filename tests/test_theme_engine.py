@@ -57,3 +57,19 @@ def test_theme_engine_custom_preset_round_trip() -> None:
 
     presets = engine.get_preset_names()
     assert "CustomTest" in presets
+
+
+def test_theme_engine_reuses_stylesheet_until_state_changes() -> None:
+    engine = ThemeEngine()
+    engine._suppress_signals = True
+
+    first = engine.generate_stylesheet()
+    assert engine.generate_stylesheet() is first
+
+    engine.set_color("accent", "#ABCDEF")
+    changed = engine.generate_stylesheet()
+    assert "#ABCDEF" in changed
+
+    # Direct edits to the state objects also invalidate the cached text.
+    engine.metrics.padding = 17
+    assert "17px" in engine.generate_stylesheet()
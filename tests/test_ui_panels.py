@@ -8,7 +8,7 @@ pytest.importorskip("PySide6")
 
 os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 
-from PySide6.QtCore import QPoint
+from PySide6.QtCore import QPoint, QStringListModel, Qt
 from PySide6.QtWidgets import QApplication, QMenu
 
 from app.core.models import (
@@ -24,6 +24,8 @@ from app.core.models import (
 )
 from app.ui.branches_panel import BranchesPanel
 from app.ui.commit_panel import CommitPanel
+from app.ui.console_widget import ConsoleWidget
+from app.ui.diff_viewer import LARGE_DIFF_LINES, DiffViewer
 from app.ui.git_toolbar import GitToolbar
 from app.ui.log_panel import LogPanel
 from app.ui.remotes_panel import RemotesPanel
@@ -45,7 +47,42 @@ def test_commit_panel_emits_commit() -> None:
 
     assert emitted == [("feat: add panel", False)]
     panel.clear()
-    panel._apply_template("fix:")
+    panel._template_combo.setCurrentIndex(2)
+    assert panel._message.toPlainText() == "fix: "
+
+    panel._template_combo.setCurrentIndex(1)
+    assert panel._message.toPlainText() == "fix: "
+
+
+def test_commit_panel_coalesces_updates_while_typing() -> None:
+    panel = CommitPanel()
+    panel._message.setPlainText("a")
+    panel._message.setPlainText("ab")
+
+    assert panel._update_timer.isActive()
+    assert panel._count.text() == "0 chars"
+
+    panel._update_timer.timeout.emit()
+
+    assert panel._count.text() == "2 chars"
+    assert panel._commit_btn.isEnabled()
+
+
+@pytest.mark.parametrize(
+    ("text", "count", "enabled"),
+    [
+        ("", "0 chars", False),
+        ("  \n\t", "4 chars", False),
+        ("\n fix: x", "8 chars", True),
+    ],
+)
+def test_commit_panel_state_from_document(text: str, count: str, enabled: bool) -> None:
+    panel = CommitPanel()
+    panel._message.setPlainText(text)
+    panel._update_state()
+
+    assert panel._count.text() == count
+    assert panel._commit_btn.isEnabled() is enabled
 
 
 def test_branches_panel_actions() -> None:
@@ -109,6 +146,167 @@ def test_branches_panel_actions() -> None:
     assert deleted_remote == [("origin", "main")]
 
 
+def test_branches_panel_refresh_fills_views_and_keeps_selection() -> None:
+    panel = BranchesPanel()
+    branches = [
+        Branch("main", True, "origin/main", 0, 0, False),
+        Branch("dev", False, None, 2, 1, False),
+    ]
+    panel.set_remotes(["origin"])
+    panel.set_branches(branches)
+    panel._branch_combo.setCurrentText("dev")
+
+    panel.set_branches(branches)
+
+    model = panel._tree.model()
+    assert model.rowCount() == 2
+    assert model.columnCount() == 5
+    assert model.data(model.index(0, 0)) == "* main"
+    assert model.data(model.index(1, 2)) == "2"
+    assert model.headerData(1, Qt.Orientation.Horizontal) == "Upstream"
+    assert panel._branch_combo.currentText() == "dev"
+    assert [
+        panel._upstream_combo.itemText(i) for i in range(panel._upstream_combo.count())
+    ] == ["origin/main", "origin/dev"]
+    assert not panel._branch_combo.signalsBlocked()
+    for tree in (panel._tree, panel._remote_tree):
+        assert tree.uniformRowHeights()
+        assert not tree.rootIsDecorated()
+
+
+def test_branches_panel_refills_combos_with_one_model_reset() -> None:
+    panel = BranchesPanel()
+    model = panel._branch_combo.model()
+    events: list[str] = []
+    model.modelReset.connect(lambda: events.append("reset"))
+    model.rowsInserted.connect(lambda *_: events.append("insert"))
+
+    panel.set_branches(
+        [
+            Branch("main", True, None, 0, 0, False),
+            Branch("dev", False, None, 0, 0, False),
+        ]
+    )
+
+    assert isinstance(model, QStringListModel)
+    assert events == ["reset"]
+    assert model.stringList() == ["main", "dev"]
+    assert panel._start_point_combo.model().stringList() == ["HEAD", "main", "dev"]
+
+
+def test_branches_panel_formats_each_row_once_per_refresh(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    panel = BranchesPanel()
+    calls: list[str] = []
+    cells = panel._model._cells
+    monkeypatch.setattr(
+        panel._model, "_cells", lambda b: calls.append(b.name) or cells(b)
+    )
+    panel.set_branches([Branch("main", True, None, 3, 1, False)])
+    model = panel._tree.model()
+
+    texts = [model.data(model.index(0, column)) for column in range(5)] * 2
+
+    assert texts[:5] == ["* main", "", "3", "1", ""]
+    assert calls == ["main"]
+
+    panel.set_branches([Branch("main", True, None, 4, 1, False)])
+    assert model.data(model.index(0, 2)) == "4"
+
+
+def test_branches_panel_skips_unchanged_upstream_rebuild() -> None:
+    panel = BranchesPanel()
+    branches = [Branch("main", True, None, 0, 0, False)]
+    panel.set_remotes(["origin", "upstream"])
+    panel.set_branches(branches)
+    panel._upstream_combo.setCurrentIndex(1)
+    rebuilt: list[int] = []
+    panel._upstream_combo.model().rowsInserted.connect(lambda *_: rebuilt.append(1))
+
+    panel.set_branches(branches)
+    panel.set_remotes(["origin", "upstream"])
+
+    assert rebuilt == []
+    assert panel._upstream_combo.currentText() == "upstream/main"
+
+    panel.set_remotes(["origin"])
+
+    assert [
+        panel._upstream_combo.itemText(i) for i in range(panel._upstream_combo.count())
+    ] == ["origin/main"]
+
+
+def test_branches_panel_selecting_rows_updates_combos() -> None:
+    panel = BranchesPanel()
+    panel.set_branches(
+        [
+            Branch("main", True, "origin/main", 0, 0, False),
+            Branch("dev", False, None, 0, 0, False),
+        ]
+    )
+    panel.set_remote_branches(
+        [
+            RemoteBranch("origin", "main", "origin/main"),
+            RemoteBranch("origin", "dev", "origin/dev"),
+        ]
+    )
+
+    panel._tree.setCurrentIndex(panel._tree.model().index(1, 0))
+    panel._remote_tree.setCurrentIndex(panel._remote_tree.model().index(1, 0))
+
+    assert panel._branch_combo.currentText() == "dev"
+    assert panel._remote_branch_combo.currentText() == "origin/dev"
+
+    panel.set_remote_branches(
+        [
+            RemoteBranch("origin", "main", "origin/main"),
+            RemoteBranch("origin", "dev", "origin/dev"),
+        ]
+    )
+    assert panel._remote_branch_combo.currentText() == "origin/dev"
+
+
+def test_branches_panel_refresh_keeps_selected_rows() -> None:
+    panel = BranchesPanel()
+    panel.set_branches(
+        [
+            Branch("main", True, None, 0, 0, False),
+            Branch("dev", False, None, 0, 0, False),
+        ]
+    )
+    panel.set_remote_branches([RemoteBranch("origin", "dev", "origin/dev")])
+    panel._tree.setCurrentIndex(panel._tree.model().index(1, 0))
+    panel._remote_tree.setCurrentIndex(panel._remote_tree.model().index(0, 0))
+    selections: list[int] = []
+    panel._tree.selectionModel().selectionChanged.connect(
+        lambda *_: selections.append(1)
+    )
+
+    # A new branch sorts in ahead of the selected one.
+    panel.set_branches(
+        [
+            Branch("a-new", False, None, 0, 0, False),
+            Branch("main", True, None, 0, 0, False),
+            Branch("dev", False, None, 0, 0, False),
+        ]
+    )
+    panel.set_remote_branches(
+        [
+            RemoteBranch("origin", "a-new", "origin/a-new"),
+            RemoteBranch("origin", "dev", "origin/dev"),
+        ]
+    )
+
+    assert [index.row() for index in panel._tree.selectionModel().selectedRows()] == [2]
+    assert [
+        index.row() for index in panel._remote_tree.selectionModel().selectedRows()
+    ] == [1]
+    assert selections == [1]
+    assert panel._branch_combo.currentText() == "dev"
+    assert panel._remote_branch_combo.currentText() == "origin/dev"
+
+
 def test_log_panel_sets_commits() -> None:
     panel = LogPanel()
     commits = [
@@ -122,7 +320,47 @@ def test_log_panel_sets_commits() -> None:
         )
     ]
     panel.set_commits(commits)
-    assert panel._table.rowCount() == 1
+    assert panel._model.rowCount() == 1
+    assert panel._model.index(0, 0).data() == "abc123"
+
+
+def test_log_panel_refill_keeps_sort_order() -> None:
+    panel = LogPanel()
+    commits = [
+        Commit(f"{oid}0000", [], "Dev", "dev@example.com", "2024-01-01", subject)
+        for oid, subject in [("aaaa", "b"), ("bbbb", "c"), ("cccc", "a")]
+    ]
+    panel.set_commits(commits)
+    panel._table.sortByColumn(1, Qt.SortOrder.AscendingOrder)
+
+    panel.set_commits(commits)
+
+    assert panel._table.isSortingEnabled()
+    model = panel._model
+    rows = [
+        (model.index(row, 0).data(), model.index(row, 1).data())
+        for row in range(model.rowCount())
+    ]
+    assert rows == [("cccc0000", "a"), ("aaaa0000", "b"), ("bbbb0000", "c")]
+    assert model.row_at(model.index(0, 0)) is commits[2]
+
+
+def test_log_panel_sort_keeps_selection() -> None:
+    panel = LogPanel()
+    commits = [
+        Commit(f"{oid}0000", [], "Dev", "dev@example.com", "2024-01-01", subject)
+        for oid, subject in [("aaaa", "b"), ("bbbb", "c"), ("cccc", "a")]
+    ]
+    panel.set_commits(commits)
+    panel._table.selectRow(
+        next(row for row in range(3) if panel._model.index(row, 1).data() == "c")
+    )
+
+    panel._table.sortByColumn(1, Qt.SortOrder.DescendingOrder)
+
+    selected = panel._table.selectionModel().selectedRows()
+    assert [index.row() for index in selected] == [0]
+    assert panel._model.row_at(selected[0]) is commits[1]
 
 
 def test_stash_panel_emits_actions() -> None:
@@ -213,6 +451,31 @@ def test_remotes_panel_emits_actions() -> None:
     assert updated == [("origin", "git@new")]
 
 
+def test_panels_map_tree_selection_from_row_text() -> None:
+    stash = StashPanel()
+    stash.set_stashes(
+        [
+            StashEntry("1", "stash@{0}", "WIP", "2024-01-01"),
+            StashEntry("2", "stash@{1}", "Old", "2024-01-01"),
+        ]
+    )
+    stash._tree.setCurrentItem(stash._tree.topLevelItem(1))
+    tags = TagsPanel()
+    tags.set_tags([Tag("v1"), Tag("v2")])
+    tags._tree.setCurrentItem(tags._tree.topLevelItem(1))
+    remotes = RemotesPanel()
+    remotes.set_remotes([Remote("origin", "a", "a"), Remote("upstream", "b", "b")])
+    remotes._tree.setCurrentItem(remotes._tree.topLevelItem(1))
+    status = StatusPanel()
+    status.set_status(RepoStatus(None, [FileChange("a b.txt", "M", ".")], [], [], []))
+    status._staged_list.item(0).setSelected(True)
+
+    assert stash._stash_combo.currentData() == "stash@{1}"
+    assert tags._tag_combo.currentText() == "v2"
+    assert remotes._remote_combo.currentText() == "upstream"
+    assert status._selected_paths(status._staged_list) == ["a b.txt"]
+
+
 def test_git_toolbar_signals() -> None:
     toolbar = GitToolbar()
     calls = []
@@ -279,3 +542,76 @@ def test_status_panel_context_menu(monkeypatch) -> None:
 
     assert emitted["stage"] == 1
     assert emitted["unstage"] == 1
+
+
+def test_console_widget_prefixes_every_line_of_a_chunk() -> None:
+    console = ConsoleWidget()
+    console.append_event("started")
+    console.append_stdout(b"one\ntwo\n")
+    console.append_stderr(b"\xffbad\n")
+
+    assert console._view.toPlainText().splitlines() == [
+        "[event] started",
+        "[out] one",
+        "[out] two",
+        "[err] \ufffdbad",
+    ]
+
+
+def test_console_widget_drops_lines_past_scrollback() -> None:
+    console = ConsoleWidget(max_lines=3)
+    console.append_stdout(b"1\n2\n3\n4\n5\n")
+
+    assert console._view.toPlainText().splitlines() == ["[out] 3", "[out] 4", "[out] 5"]
+    assert not console._view.isUndoRedoEnabled()
+
+
+def test_console_widget_follows_output_only_at_the_end() -> None:
+    console = ConsoleWidget()
+    console.resize(300, 100)
+    console.show()
+    scrollbar = console._view.verticalScrollBar()
+
+    console.append_stdout(b"line\n" * 200)
+    assert scrollbar.value() == scrollbar.maximum() > 0
+
+    scrollbar.setValue(10)
+    console.append_stdout(b"more\n" * 50)
+    assert scrollbar.value() == 10
+
+    scrollbar.setValue(scrollbar.maximum())
+    console.append_stdout(b"tail\n")
+    assert scrollbar.value() == scrollbar.maximum()
+
+
+def test_diff_viewer_skips_identical_text() -> None:
+    viewer = DiffViewer()
+    updates: list[None] = []
+    viewer._view.textChanged.connect(lambda: updates.append(None))
+
+    viewer.set_diff_text("+a\n-b")
+    viewer.set_diff_text("+a\n-b")
+    viewer.set_diff_text(None)
+    viewer.set_diff_text("")
+
+    assert len(updates) == 2
+    assert viewer._view.toPlainText() == ""
+
+
+def test_diff_viewer_uses_line_table_for_large_diffs() -> None:
+    viewer = DiffViewer()
+    large = "\n".join(f"+line {i}" for i in range(LARGE_DIFF_LINES + 1))
+
+    viewer.set_diff_text(large)
+    assert viewer._stack.currentWidget() is viewer._line_view
+    assert viewer._lines.rowCount() == LARGE_DIFF_LINES + 1
+    assert viewer._view.toPlainText() == ""
+
+    viewer._line_view.selectRow(2)
+    viewer._copy_selected_lines()
+    assert QApplication.clipboard().text() == "+line 2"
+
+    viewer.set_diff_text("+a\n-b")
+    assert viewer._stack.currentWidget() is viewer._view
+    assert viewer._lines.rowCount() == 0
+    assert viewer._view.toPlainText() == "+a\n-b"